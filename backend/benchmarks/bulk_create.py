@@ -0,0 +1,72 @@
+"""ジョブ一括作成のスループットベンチマーク。
+
+同じ件数のジョブを 2 つの方式で作成し、所要時間とスループット（件/秒）を比較する。
+
+    single: CreateJobUseCase を 1 件ずつ実行（POST /api/jobs を繰り返すのと同じ経路）
+    batch:  CreateJobsBatchUseCase で一括作成（POST /api/jobs/batch と同じ経路）
+
+作成したジョブは実行秒数 0 の PENDING ジョブとして、イベントとともにアウトボックスに入る
+（アウトボックスリレーが動いていれば、通常どおりキューに配信される）。
+
+実行方法（backend ディレクトリで、PostgreSQL が起動している状態）:
+    PYTHONPATH=src python benchmarks/bulk_create.py --jobs 2000
+"""
+
+import argparse
+import asyncio
+import time
+
+from app.adapters.outbound.messaging.outbox_event_publisher import (
+    OutboxEventPublisher,
+)
+from app.adapters.outbound.persistence.database import async_session, engine
+from app.adapters.outbound.persistence.models import Base
+from app.adapters.outbound.persistence.postgres_job_repository import (
+    PostgresJobRepository,
+)
+from app.usecases.create_job import CreateJobUseCase
+from app.usecases.create_jobs_batch import CreateJobsBatchUseCase, JobSpec
+
+
+async def run_single(jobs: int) -> None:
+    """1 件ずつ作成する（リクエストごとにセッションを開く）。"""
+    for _ in range(jobs):
+        async with async_session() as session:
+            usecase = CreateJobUseCase(
+                PostgresJobRepository(session), OutboxEventPublisher(session)
+            )
+            await usecase.execute(0)
+
+
+async def run_batch(jobs: int) -> None:
+    """1 回の一括作成で作成する。"""
+    async with async_session() as session:
+        usecase = CreateJobsBatchUseCase(
+            PostgresJobRepository(session), OutboxEventPublisher(session)
+        )
+        await usecase.execute([JobSpec(duration_seconds=0)] * jobs)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=2000)
+    args = parser.parse_args()
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    print(f"{'mode':<8} {'jobs':>6} {'seconds':>8} {'jobs/s':>9}")
+    results = {}
+    for mode, runner in (("single", run_single), ("batch", run_batch)):
+        start = time.perf_counter()
+        await runner(args.jobs)
+        elapsed = time.perf_counter() - start
+        results[mode] = elapsed
+        print(f"{mode:<8} {args.jobs:>6} {elapsed:>8.2f} {args.jobs / elapsed:>9.0f}")
+    print(f"speedup: {results['single'] / results['batch']:.1f}x")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,164 @@
+"""Discord 通知のレート制限対応のベンチマーク。
+
+Discord と同じ形式でレート制限を返す偽の Webhook サーバーをプロセス内で起動し、
+同じ数の通知を 2 つの方法で一斉に送って、届いた数・429 の数・所要時間を比較する。
+
+    naive:     レート制限を見ずに送り、429 はそのまま失敗にする（従来の送信）
+    scheduled: DiscordNotificationSender（トークンバケットで待ち、429 は再送する）
+
+偽のサーバーは --limit 件 / --window 秒の固定窓で制限し、
+X-RateLimit-Limit / X-RateLimit-Remaining / X-RateLimit-Reset-After を返す。
+超えたリクエストには Retry-After 付きの 429 を返す。
+--global-429-every を指定すると、その件数ごとにグローバルな 429 も返す。
+
+実行方法（backend ディレクトリで。外部サービスは不要）:
+    PYTHONPATH=src python benchmarks/discord_rate_limit.py --notifications 100
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+import httpx
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from app.adapters.outbound.notification.discord_notification_sender import (
+    DiscordNotificationSender,
+    create_discord_http_client,
+)
+from app.domain.models.job import Job, JobType
+
+
+class FakeWebhook:
+    """固定窓でレート制限する偽の Discord Webhook。"""
+
+    def __init__(self, limit: int, window: float, global_429_every: int) -> None:
+        self.limit = limit
+        self.window = window
+        self.global_429_every = global_429_every
+        self.accepted = 0
+        self.rejected = 0
+        self._window_start = 0.0
+        self._used = 0
+        self._requests = 0
+
+    async def handle(self, request: Request) -> JSONResponse:
+        """制限内なら 200、超えていれば 429 を返す。"""
+        await request.body()
+        self._requests += 1
+        now = time.monotonic()
+        if now - self._window_start >= self.window:
+            self._window_start = now
+            self._used = 0
+        reset_after = self._window_start + self.window - now
+
+        if self.global_429_every and self._requests % self.global_429_every == 0:
+            self.rejected += 1
+            return JSONResponse(
+                {"message": "global rate limit", "retry_after": 0.2, "global": True},
+                status_code=429,
+                headers={"Retry-After": "0.2", "X-RateLimit-Global": "true"},
+            )
+        if self._used >= self.limit:
+            self.rejected += 1
+            return JSONResponse(
+                {
+                    "message": "rate limited",
+                    "retry_after": reset_after,
+                    "global": False,
+                },
+                status_code=429,
+                headers={
+                    "Retry-After": f"{reset_after:.3f}",
+                    "X-RateLimit-Limit": str(self.limit),
+                    "X-RateLimit-Remaining": "0",
+                    "X-RateLimit-Reset-After": f"{reset_after:.3f}",
+                },
+            )
+        self._used += 1
+        self.accepted += 1
+        return JSONResponse(
+            {"channel_id": str(uuid.uuid4())},
+            headers={
+                "X-RateLimit-Limit": str(self.limit),
+                "X-RateLimit-Remaining": str(self.limit - self._used),
+                "X-RateLimit-Reset-After": f"{reset_after:.3f}",
+            },
+        )
+
+    def reset(self) -> None:
+        """計測結果と窓をリセットする。"""
+        self.accepted = self.rejected = self._used = self._requests = 0
+        self._window_start = 0.0
+
+
+async def send_naive(client: httpx.AsyncClient, url: str, jobs: list[Job]) -> int:
+    """レート制限を見ずに一斉に送り、成功した数を返す。"""
+
+    async def send(job: Job) -> bool:
+        response = await client.post(url, json={"content": str(job.id)})
+        return response.is_success
+
+    return sum(await asyncio.gather(*(send(job) for job in jobs)))
+
+
+async def send_scheduled(client: httpx.AsyncClient, url: str, jobs: list[Job]) -> int:
+    """DiscordNotificationSender で一斉に送り、成功した数を返す。"""
+    sender = DiscordNotificationSender(client, webhook_url=url)
+
+    async def send(job: Job) -> bool:
+        try:
+            await sender.send(job)
+        except httpx.HTTPStatusError:
+            return False
+        return True
+
+    return sum(await asyncio.gather(*(send(job) for job in jobs)))
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--notifications", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument("--window", type=float, default=1.0)
+    parser.add_argument("--global-429-every", type=int, default=0)
+    parser.add_argument("--port", type=int, default=8799)
+    args = parser.parse_args()
+
+    webhook = FakeWebhook(args.limit, args.window, args.global_429_every)
+    app = Starlette(routes=[Route("/webhook", webhook.handle, methods=["POST"])])
+    server = uvicorn.Server(
+        uvicorn.Config(app, port=args.port, log_level="warning", lifespan="off")
+    )
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    url = f"http://127.0.0.1:{args.port}/webhook"
+    jobs = [Job.create(JobType(0)) for _ in range(args.notifications)]
+    try:
+        for name, send in (("naive", send_naive), ("scheduled", send_scheduled)):
+            webhook.reset()
+            async with create_discord_http_client() as client:
+                start = time.perf_counter()
+                delivered = await send(client, url, jobs)
+                elapsed = time.perf_counter() - start
+            print(
+                f"{name:<10} delivered={delivered:>5}/{len(jobs)}  "
+                f"429s={webhook.rejected:>5}  elapsed={elapsed:>6.2f}s"
+            )
+        print(
+            f"(理論上の最短: {max(0, (len(jobs) - 1) // args.limit) * args.window:.2f}s)"
+        )
+    finally:
+        server.should_exit = True
+        await server_task
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,217 @@
+"""優先度・投入者ごとの実行順のベンチマーク（外部サービス不要）。
+
+以下のシナリオで、ジョブの投入から実行開始までの待ち時間（p50 / p99 / max）を
+優先度・投入者ごとに、2 つの方式で比較する。
+
+    interactive: 1 人の投入者が LOW のバッチジョブを大量に投入した直後から、
+                 別の投入者が HIGH の短いジョブを一定間隔で投入する
+    submitters:  投入者 A が NORMAL のジョブを大量に投入した直後に、
+                 投入者 B が同じ NORMAL のジョブを少数投入する
+    backlog:     HIGH のジョブが大量に溜まっている状態で LOW のジョブを投入する
+                 （LOW が HIGH の滞留の解消を待たずに進むかを、HIGH の最後のジョブが
+                 実行を開始するまでに実行を開始した LOW のジョブ数で確認する）
+
+方式:
+    fifo: 優先度・投入者を使わず、到着順に実行する（FifoJobBuffer）
+    fair: 優先度の重みと投入者の順番で、キューからの取り出しとバッファからの
+          取り出しの両方を決める（InMemoryJobQueue + FairJobBuffer）
+
+InMemoryEventBus・InMemoryJobQueue・JobDispatcher をプロセス内でそのまま使い、
+ジョブの実行は sleep で代用する。
+
+実行方法（backend ディレクトリで）:
+    PYTHONPATH=src python benchmarks/fair_dispatch.py --batch-jobs 2000 --high-jobs 100
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from app.adapters.inbound.queue.fair_job_buffer import FairJobBuffer
+from app.adapters.inbound.queue.in_memory_job_queue import InMemoryJobQueue
+from app.adapters.inbound.queue.job_buffer import FifoJobBuffer
+from app.adapters.inbound.queue.job_dispatcher import JobDispatcher
+from app.adapters.outbound.messaging.in_memory_event_bus import InMemoryEventBus
+from app.domain.events.job_events import JobCreated, JobId
+from app.domain.models.priority import DEFAULT_SUBMITTER, JobPriority
+from app.ports.job_queue import JobDelivery
+
+
+@dataclass(frozen=True)
+class Submission:
+    """投入するジョブのまとまり。
+
+    Attributes:
+        count: ジョブ数。
+        priority: 優先度。
+        submitter: 投入者。
+        seconds: 1 件の実行秒数。
+        interval: 1 件ごとに空ける間隔（秒）。0 なら一度に投入する。
+    """
+
+    count: int
+    priority: JobPriority
+    submitter: str
+    seconds: float
+    interval: float = 0.0
+
+
+def scenarios(args: argparse.Namespace) -> dict[str, list[Submission]]:
+    """シナリオ名と、順に投入するジョブのまとまり。"""
+    return {
+        "interactive": [
+            Submission(args.batch_jobs, JobPriority.LOW, "batch", args.batch_seconds),
+            Submission(
+                args.high_jobs,
+                JobPriority.HIGH,
+                "interactive",
+                args.high_seconds,
+                args.high_interval,
+            ),
+        ],
+        "submitters": [
+            Submission(args.batch_jobs, JobPriority.NORMAL, "A", args.batch_seconds),
+            Submission(args.high_jobs, JobPriority.NORMAL, "B", args.batch_seconds),
+        ],
+        "backlog": [
+            Submission(args.batch_jobs, JobPriority.HIGH, "A", args.batch_seconds),
+            Submission(args.high_jobs, JobPriority.LOW, "B", args.batch_seconds),
+        ],
+    }
+
+
+async def measure(
+    mode: str, submissions: list[Submission], args: argparse.Namespace
+) -> dict:
+    """1 つの方式で、(優先度, 投入者) ごとの待ち時間と実行開始時刻を計測する。"""
+    bus = InMemoryEventBus()
+    queue = InMemoryJobQueue(bus)
+    submitted: dict[JobId, tuple[float, tuple[JobPriority, str], float]] = {}
+    waits: dict[tuple[JobPriority, str], list[float]] = {}
+    started_at: dict[tuple[JobPriority, str], list[float]] = {}
+    total = sum(s.count for s in submissions)
+    done = asyncio.Event()
+    finished = 0
+
+    async def handler(delivery: JobDelivery) -> None:
+        nonlocal finished
+        submitted_at, group, duration = submitted[delivery.job_id]
+        now = time.perf_counter()
+        waits.setdefault(group, []).append(now - submitted_at)
+        started_at.setdefault(group, []).append(now)
+        await asyncio.sleep(duration)
+        finished += 1
+        if finished >= total:
+            done.set()
+
+    dispatcher = JobDispatcher(
+        queue,
+        handler,
+        concurrency=args.concurrency,
+        buffer_size=args.buffer_size,
+        batch_size=10,
+        extend_interval=60,
+        stats_interval=3600,
+        shutdown_grace=0,
+        buffer=FifoJobBuffer() if mode == "fifo" else FairJobBuffer(),
+    )
+
+    async def submit(submission: Submission) -> None:
+        for _ in range(submission.count):
+            job_id = JobId(uuid.uuid4())
+            group = (submission.priority, submission.submitter)
+            submitted[job_id] = (time.perf_counter(), group, submission.seconds)
+            priority, submitter = group
+            if mode == "fifo":
+                priority, submitter = JobPriority.NORMAL, DEFAULT_SUBMITTER
+            await bus.publish_all(
+                [
+                    JobCreated(
+                        job_id=job_id,
+                        timestamp=datetime.now(timezone.utc),
+                        priority=priority,
+                        submitter=submitter,
+                    )
+                ]
+            )
+            if submission.interval:
+                await asyncio.sleep(submission.interval)
+
+    task = asyncio.create_task(dispatcher.run())
+    started = time.perf_counter()
+    for submission in submissions:
+        await submit(submission)
+    await done.wait()
+    elapsed = time.perf_counter() - started
+    dispatcher.stop()
+    await task
+    await queue.close()
+    return {"elapsed": elapsed, "waits": waits, "started_at": started_at}
+
+
+def percentile(values: list[float], q: float) -> float:
+    """values の q 分位点（0〜1）。"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scenario",
+        choices=["all", "interactive", "submitters", "backlog"],
+        default="all",
+    )
+    parser.add_argument("--batch-jobs", type=int, default=2000)
+    parser.add_argument("--batch-seconds", type=float, default=0.05)
+    parser.add_argument("--high-jobs", type=int, default=100)
+    parser.add_argument("--high-seconds", type=float, default=0.005)
+    parser.add_argument("--high-interval", type=float, default=0.02)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--buffer-size", type=int, default=20)
+    args = parser.parse_args()
+
+    print(
+        f"bulk={args.batch_jobs}x{args.batch_seconds}s "
+        f"small={args.high_jobs} (interactive: {args.high_seconds}s "
+        f"every {args.high_interval}s) "
+        f"concurrency={args.concurrency} buffer={args.buffer_size}"
+    )
+    for name, submissions in scenarios(args).items():
+        if args.scenario not in ("all", name):
+            continue
+        print(f"\n[{name}]")
+        print(
+            f"{'mode':<6}{'group':<20}{'p50 ms':>10}{'p99 ms':>10}"
+            f"{'max ms':>10}{'total s':>10}"
+        )
+        for mode in ("fifo", "fair"):
+            result = await measure(mode, submissions, args)
+            for submission in submissions:
+                group = (submission.priority, submission.submitter)
+                waits = result["waits"][group]
+                label = f"{submission.priority.value}/{submission.submitter}"
+                print(
+                    f"{mode:<6}{label:<20}"
+                    f"{statistics.median(waits) * 1000:>10.1f}"
+                    f"{percentile(waits, 0.99) * 1000:>10.1f}"
+                    f"{max(waits) * 1000:>10.1f}"
+                    f"{result['elapsed']:>10.2f}"
+                )
+            if name == "backlog":
+                high, low = submissions
+                high_last = max(result["started_at"][high.priority, high.submitter])
+                low_started = result["started_at"][low.priority, low.submitter]
+                progressed = sum(1 for t in low_started if t < high_last)
+                print(
+                    f"{mode:<6}LOW started before the HIGH backlog drained: "
+                    f"{progressed}/{len(low_started)}"
+                )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
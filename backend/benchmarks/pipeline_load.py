@@ -0,0 +1,269 @@
+"""ジョブパイプライン全体の負荷試験ベンチマーク。
+
+起動中の API（とワーカー・アウトボックスリレー）に対して、以下の負荷を指定したレートで
+同時に流し、経路ごとのスループットとレイテンシ（p50 / p95 / p99 / max）を出力する。
+
+    create:          POST /api/jobs（実行秒数 0 のジョブ）
+    list:            GET /api/jobs?limit=50
+    cancel:          実行秒数 60 のジョブを作成し、POST /api/jobs/{job_id}/cancel
+    sse_fanout:      create したジョブの JobCreated が各 SSE 購読者に届くまで（POST の送信から）
+    event_to_worker: create したジョブの JobStarted が SSE に届くまで（POST の送信から。
+                     アウトボックスリレー → ジョブキュー → ワーカーの開始までを含む）
+
+リクエストは前のリクエストの完了を待たずに一定間隔で送る（open-loop）。
+サーバーが遅くなっても送信レートが下がらないため、遅延を過小評価しない。
+期限（負荷終了 + --settle 秒）までに届かなかったイベントは errors に数える。
+サーバーに切断された SSE 購読者（キューが溢れた遅いクライアント）の数は
+sse_disconnects として別に出力する。
+
+--output を指定すると結果を JSON で保存する。--baseline に以前の JSON を渡すと、
+経路ごとのスループットと p99 の変化率も表示する（回帰の確認用）。
+
+実行方法（backend ディレクトリで、API・ワーカー・アウトボックスリレーが起動している状態）:
+    python benchmarks/pipeline_load.py --duration 20 --create-rate 50 --sse-clients 20
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+
+import httpx
+
+EVENT_TYPES = ("JobCreated", "JobStarted")
+"""SSE 購読者が受け取るイベント種別。"""
+
+
+@dataclass
+class PathStats:
+    """1 つの経路の計測結果。"""
+
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    def summary(self, elapsed: float) -> dict:
+        """スループット（件/秒）とレイテンシのパーセンタイル（ミリ秒）を返す。"""
+        values = sorted(v * 1000 for v in self.latencies)
+        return {
+            "count": len(values),
+            "errors": self.errors,
+            "per_second": len(values) / elapsed if elapsed else 0.0,
+            "p50_ms": percentile(values, 0.50),
+            "p95_ms": percentile(values, 0.95),
+            "p99_ms": percentile(values, 0.99),
+            "max_ms": values[-1] if values else 0.0,
+        }
+
+
+def percentile(values: list[float], q: float) -> float:
+    """昇順に並んだ値の q 分位点（nearest-rank）を返す。"""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, max(0, round(q * len(values)) - 1))]
+
+
+@dataclass
+class Subscriber:
+    """1 本の SSE 接続で受け取ったイベントの到着時刻（job_id → perf_counter）。"""
+
+    created: dict[str, float] = field(default_factory=dict)
+    started: dict[str, float] = field(default_factory=dict)
+    connected: asyncio.Event = field(default_factory=asyncio.Event)
+    disconnected: bool = False
+
+
+async def subscribe(client: httpx.AsyncClient, subscriber: Subscriber) -> None:
+    """SSE に接続し、JobCreated / JobStarted の到着時刻を記録し続ける。
+
+    サーバーがストリームを閉じた場合は disconnected を立てて終了する。
+    """
+    params = [("event_type", event_type) for event_type in EVENT_TYPES]
+    async with client.stream("GET", "/api/jobs/stream", params=params) as response:
+        subscriber.connected.set()
+        event_type = None
+        async for line in response.aiter_lines():
+            if line.startswith("event: "):
+                event_type = line[len("event: ") :]
+            elif line.startswith("data: "):
+                arrived = time.perf_counter()
+                job_id = json.loads(line[len("data: ") :])["job_id"]
+                target = (
+                    subscriber.created
+                    if event_type == "JobCreated"
+                    else subscriber.started
+                )
+                target.setdefault(job_id, arrived)
+    subscriber.disconnected = True
+
+
+async def open_loop(rate: float, duration: float, action) -> None:
+    """rate 件/秒の間隔で action() を duration 秒間起動し、全件の完了を待つ。"""
+    if rate <= 0:
+        return
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    tasks = []
+    for i in range(int(rate * duration)):
+        delay = start + i / rate - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(action()))
+    await asyncio.gather(*tasks)
+
+
+async def run(args: argparse.Namespace) -> dict:
+    """負荷をかけ、経路ごとの集計結果を返す。"""
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    timeout = httpx.Timeout(30.0, read=None)
+    stats = {
+        name: PathStats()
+        for name in ("create", "list", "cancel", "sse_fanout", "event_to_worker")
+    }
+    sent_at: dict[str, float] = {}
+
+    async def create() -> None:
+        start = time.perf_counter()
+        try:
+            response = await client.post("/api/jobs", json={"duration_seconds": 0})
+            response.raise_for_status()
+        except httpx.HTTPError:
+            stats["create"].errors += 1
+            return
+        stats["create"].latencies.append(time.perf_counter() - start)
+        sent_at[response.json()["id"]] = start
+
+    async def list_jobs() -> None:
+        start = time.perf_counter()
+        try:
+            response = await client.get("/api/jobs", params={"limit": 50})
+            response.raise_for_status()
+        except httpx.HTTPError:
+            stats["list"].errors += 1
+            return
+        stats["list"].latencies.append(time.perf_counter() - start)
+
+    async def cancel() -> None:
+        try:
+            response = await client.post("/api/jobs", json={"duration_seconds": 60})
+            response.raise_for_status()
+            start = time.perf_counter()
+            response = await client.post(f"/api/jobs/{response.json()['id']}/cancel")
+            # 409: 取得後にワーカーが開始した等の競合。キャンセル経路の遅延としては数える
+            if response.status_code not in (200, 409):
+                response.raise_for_status()
+        except httpx.HTTPError:
+            stats["cancel"].errors += 1
+            return
+        stats["cancel"].latencies.append(time.perf_counter() - start)
+
+    async with (
+        httpx.AsyncClient(
+            base_url=args.base_url, limits=limits, timeout=timeout
+        ) as client,
+        httpx.AsyncClient(
+            base_url=args.base_url, limits=limits, timeout=timeout
+        ) as sse_client,
+    ):
+        subscribers = [Subscriber() for _ in range(args.sse_clients)]
+        sse_tasks = [asyncio.create_task(subscribe(sse_client, s)) for s in subscribers]
+        await asyncio.wait_for(
+            asyncio.gather(*(s.connected.wait() for s in subscribers)), timeout=10
+        )
+
+        started = time.perf_counter()
+        await asyncio.gather(
+            open_loop(args.create_rate, args.duration, create),
+            open_loop(args.list_rate, args.duration, list_jobs),
+            open_loop(args.cancel_rate, args.duration, cancel),
+        )
+        elapsed = time.perf_counter() - started
+        await asyncio.sleep(args.settle)
+
+        for task in sse_tasks:
+            task.cancel()
+        await asyncio.gather(*sse_tasks, return_exceptions=True)
+
+    for job_id, start in sent_at.items():
+        for subscriber in subscribers:
+            arrived = subscriber.created.get(job_id)
+            if arrived is None:
+                stats["sse_fanout"].errors += 1
+            else:
+                stats["sse_fanout"].latencies.append(arrived - start)
+        if subscribers:
+            arrived = subscribers[0].started.get(job_id)
+            if arrived is None:
+                stats["event_to_worker"].errors += 1
+            else:
+                stats["event_to_worker"].latencies.append(arrived - start)
+
+    return {
+        "config": {
+            "duration": args.duration,
+            "create_rate": args.create_rate,
+            "list_rate": args.list_rate,
+            "cancel_rate": args.cancel_rate,
+            "sse_clients": args.sse_clients,
+        },
+        "paths": {name: s.summary(elapsed) for name, s in stats.items()},
+        "sse_disconnects": sum(s.disconnected for s in subscribers),
+    }
+
+
+def print_report(result: dict, baseline: dict | None) -> None:
+    """経路ごとの結果を表形式で出力する。baseline があれば変化率も出す。"""
+    header = (
+        f"{'path':<16} {'count':>7} {'errors':>6} {'per_s':>8} "
+        f"{'p50_ms':>8} {'p95_ms':>8} {'p99_ms':>8} {'max_ms':>8}"
+    )
+    if baseline:
+        header += f" {'per_s_Δ':>8} {'p99_Δ':>8}"
+    print(header)
+    for name, r in result["paths"].items():
+        line = (
+            f"{name:<16} {r['count']:>7} {r['errors']:>6} {r['per_second']:>8.1f} "
+            f"{r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f} "
+            f"{r['max_ms']:>8.2f}"
+        )
+        base = (baseline or {}).get("paths", {}).get(name)
+        if base:
+            line += f" {_change(base['per_second'], r['per_second']):>8}"
+            line += f" {_change(base['p99_ms'], r['p99_ms']):>8}"
+        print(line)
+    print(f"sse_disconnects: {result['sse_disconnects']}")
+
+
+def _change(before: float, after: float) -> str:
+    """変化率を +12.3% 形式で返す。"""
+    if not before:
+        return "-"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument("--create-rate", type=float, default=50.0)
+    parser.add_argument("--list-rate", type=float, default=20.0)
+    parser.add_argument("--cancel-rate", type=float, default=5.0)
+    parser.add_argument("--sse-clients", type=int, default=20)
+    parser.add_argument("--settle", type=float, default=5.0)
+    parser.add_argument("--output", help="結果を保存する JSON ファイル")
+    parser.add_argument("--baseline", help="比較する以前の結果（JSON ファイル）")
+    args = parser.parse_args()
+
+    result = await run(args)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(result, baseline)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
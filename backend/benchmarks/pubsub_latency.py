@@ -0,0 +1,116 @@
+"""Pub/Sub イベントの受信遅延ベンチマーク。
+
+job_events チャンネルに不規則な間隔でイベントを Publish し、
+Publish からハンドラー呼び出しまでの遅延（p50 / p99 / max）と、
+受信ループが消費した CPU 時間を、2 つの受信方式で比較する。
+
+    polling: get_message(timeout=1.0) + 空振り時に sleep(0.1)（従来の方式）
+    listen:  RedisEventSubscriber（pubsub.listen() でブロックして待つ方式）
+
+実行方法（backend ディレクトリで、Redis が起動している状態）:
+    PYTHONPATH=src python benchmarks/pubsub_latency.py --events 40 --max-gap 1.5
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import time
+import uuid
+
+import redis.asyncio as aioredis
+
+from app.adapters.inbound.events.redis_event_subscriber import RedisEventSubscriber
+from app.adapters.outbound.messaging.redis_event_publisher import CHANNEL
+
+REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379")
+
+
+async def polling_consumer(redis: aioredis.Redis, handler) -> None:
+    """従来の受信ループ（get_message + sleep）。"""
+    pubsub = redis.pubsub()
+    await pubsub.subscribe(CHANNEL)
+    try:
+        while True:
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=1.0
+            )
+            if message and message["type"] == "message":
+                await handler(json.loads(message["data"]))
+            else:
+                await asyncio.sleep(0.1)
+    finally:
+        await pubsub.unsubscribe(CHANNEL)
+        await pubsub.aclose()
+
+
+async def listen_consumer(redis: aioredis.Redis, handler) -> None:
+    """RedisEventSubscriber による受信ループ。"""
+    await RedisEventSubscriber(redis, handler).run()
+
+
+async def measure(mode: str, events: int, max_gap: float) -> dict:
+    """1 つの受信方式で遅延と CPU 時間を計測する。"""
+    redis = aioredis.from_url(REDIS_URL)
+    run_id = str(uuid.uuid4())
+    delays: list[float] = []
+    done = asyncio.Event()
+
+    async def handler(data: dict) -> None:
+        if data.get("run_id") != run_id:
+            return
+        delays.append(time.perf_counter() - data["sent_at"])
+        if len(delays) >= events:
+            done.set()
+
+    consumer = polling_consumer if mode == "polling" else listen_consumer
+    task = asyncio.create_task(consumer(redis, handler))
+    await asyncio.sleep(0.5)
+
+    cpu_start = time.process_time()
+    rng = random.Random(42)
+    for _ in range(events):
+        await asyncio.sleep(rng.uniform(0, max_gap))
+        message = {
+            "event_type": "BenchmarkEvent",
+            "job_id": str(uuid.uuid4()),
+            "run_id": run_id,
+            "sent_at": time.perf_counter(),
+        }
+        await redis.publish(CHANNEL, json.dumps(message))
+    await asyncio.wait_for(done.wait(), timeout=5)
+    cpu_seconds = time.process_time() - cpu_start
+
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    await redis.aclose()
+
+    delays_ms = sorted(d * 1000 for d in delays)
+    return {
+        "mode": mode,
+        "p50_ms": statistics.median(delays_ms),
+        "p99_ms": delays_ms[min(len(delays_ms) - 1, int(len(delays_ms) * 0.99))],
+        "max_ms": delays_ms[-1],
+        "cpu_s": cpu_seconds,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=40)
+    parser.add_argument("--max-gap", type=float, default=1.5)
+    args = parser.parse_args()
+
+    print(f"{'mode':<8} {'p50_ms':>8} {'p99_ms':>8} {'max_ms':>8} {'cpu_s':>7}")
+    for mode in ("polling", "listen"):
+        r = await measure(mode, args.events, args.max_gap)
+        print(
+            f"{r['mode']:<8} {r['p50_ms']:>8.2f} {r['p99_ms']:>8.2f} "
+            f"{r['max_ms']:>8.2f} {r['cpu_s']:>7.3f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,112 @@
+"""ジョブ 1 件のライフサイクルあたりの DB 往復回数ベンチマーク。
+
+ワーカーと同じ手順（作成 → 開始 → thread_id の保存 → 完了）を 2 つの save 実装で実行し、
+ジョブ 1 件あたりの SQL 文の数・commit 数と所要時間を比較する。
+
+    legacy: 保存前に session.get で行を読み、INSERT / UPDATE を選ぶ（従来の save）
+    upsert: INSERT ... ON CONFLICT DO UPDATE の 1 文で保存する（現在の save）
+
+実行方法（backend ディレクトリで、PostgreSQL が起動している状態）:
+    PYTHONPATH=src python benchmarks/repository_round_trips.py --jobs 200
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import event
+
+from app.adapters.outbound.messaging.outbox_event_publisher import (
+    OutboxEventPublisher,
+)
+from app.adapters.outbound.persistence.database import async_session, engine
+from app.adapters.outbound.persistence.models import Base, JobRow
+from app.adapters.outbound.persistence.postgres_job_repository import (
+    PostgresJobRepository,
+)
+from app.domain.models.job import Job, JobResult
+from app.usecases.create_job import CreateJobUseCase
+
+
+class LegacyJobRepository(PostgresJobRepository):
+    """比較用: 保存前に行を読む従来の save を持つリポジトリ。"""
+
+    async def save(self, job: Job) -> None:
+        row = await self._session.get(JobRow, str(job.id))
+        if row is None:
+            self._session.add(JobRow(**self._to_row_values(job)))
+        else:
+            row.status = job.status.value
+            row.started_at = job.started_at
+            row.completed_at = job.completed_at
+            row.result_message = job.result.message if job.result else None
+            row.result_error = job.result.error if job.result else None
+            row.discord_thread_id = job.discord_thread_id
+        await self._session.commit()
+
+
+async def lifecycle(repository_class: type[PostgresJobRepository]) -> None:
+    """ワーカーと同じ手順でジョブ 1 件を作成から完了まで進める。"""
+    async with async_session() as session:
+        job = await CreateJobUseCase(
+            repository_class(session), OutboxEventPublisher(session)
+        ).execute(0)
+
+    async with async_session() as session:
+        repo = repository_class(session)
+        job = await repo.find_by_id(job.id)
+        job.start()
+        await OutboxEventPublisher(session).publish_all(job.collect_events())
+        await repo.save(job)
+        job.discord_thread_id = "0"
+        await repo.save(job)
+
+    async with async_session() as session:
+        repo = repository_class(session)
+        job = await repo.find_by_id(job.id)
+        job.complete(JobResult(message="done"))
+        await OutboxEventPublisher(session).publish_all(job.collect_events())
+        await repo.save(job)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=200)
+    args = parser.parse_args()
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    counts = {"statements": 0, "commits": 0}
+
+    def on_execute(*_) -> None:
+        counts["statements"] += 1
+
+    def on_commit(*_) -> None:
+        counts["commits"] += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", on_execute)
+    event.listen(engine.sync_engine, "commit", on_commit)
+
+    print(f"{'mode':<8} {'stmts/job':>10} {'commits/job':>12} {'ms/job':>8}")
+    for mode, repository_class in (
+        ("legacy", LegacyJobRepository),
+        ("upsert", PostgresJobRepository),
+    ):
+        counts.update(statements=0, commits=0)
+        start = time.perf_counter()
+        for _ in range(args.jobs):
+            await lifecycle(repository_class)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{mode:<8} {counts['statements'] / args.jobs:>10.1f} "
+            f"{counts['commits'] / args.jobs:>12.1f} "
+            f"{elapsed * 1000 / args.jobs:>8.2f}"
+        )
+    print("（アウトボックスへの INSERT / NOTIFY はどちらも同じ数だけ含まれる）")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
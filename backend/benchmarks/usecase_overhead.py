@@ -0,0 +1,141 @@
+"""ドメイン層・ユースケース層のオーバーヘッドのベンチマーク。
+
+ジョブ 1 件のライフサイクル（作成 → 開始 → 完了）と一覧の 1 ページ取得を、
+2 つのアダプターの組で実行し、1 件あたりの所要時間を比較する。
+
+    memory:   InMemoryJobRepository + InMemoryEventPublisher（外部 I/O なし）
+    postgres: PostgresJobRepository + OutboxEventPublisher
+
+memory の結果がドメイン層・ユースケース層だけのコストで、
+postgres との差が DB 往復とシリアライズのコストになる。
+
+実行方法（backend ディレクトリで。postgres は PostgreSQL が起動している場合のみ）:
+    PYTHONPATH=src python benchmarks/usecase_overhead.py --jobs 2000
+    PYTHONPATH=src python benchmarks/usecase_overhead.py --jobs 2000 --adapters memory
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+
+from app.adapters.outbound.job_storage import JobStorage
+from app.adapters.outbound.messaging.in_memory_event_bus import (
+    InMemoryEventBus,
+    InMemoryEventPublisher,
+)
+from app.adapters.outbound.messaging.outbox_event_publisher import (
+    OutboxEventPublisher,
+)
+from app.adapters.outbound.persistence.database import async_session, engine
+from app.adapters.outbound.persistence.in_memory_job_repository import (
+    InMemoryJobRepository,
+    InMemoryJobStore,
+    InMemorySession,
+)
+from app.adapters.outbound.persistence.models import Base
+from app.adapters.outbound.persistence.postgres_job_repository import (
+    PostgresJobRepository,
+)
+from app.domain.models.job import JobResult
+from app.ports.repository import JobQuery
+from app.usecases.create_job import CreateJobUseCase
+from app.usecases.list_jobs import ListJobsUseCase
+
+StorageFactory = Callable[[], AbstractAsyncContextManager[JobStorage]]
+"""呼ぶたびに新しいトランザクションの JobStorage を開く関数。"""
+
+
+def memory_storage() -> StorageFactory:
+    """新しいストアとバスを使う memory の JobStorage を開く関数を返す。"""
+    store = InMemoryJobStore()
+    bus = InMemoryEventBus()
+
+    @asynccontextmanager
+    async def open_storage() -> AsyncIterator[JobStorage]:
+        session = InMemorySession(store, bus.publish_all)
+        yield JobStorage(
+            InMemoryJobRepository(session), InMemoryEventPublisher(session)
+        )
+
+    return open_storage
+
+
+async def postgres_storage() -> StorageFactory:
+    """テーブルを用意し、postgres の JobStorage を開く関数を返す。"""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    @asynccontextmanager
+    async def open_storage() -> AsyncIterator[JobStorage]:
+        async with async_session() as session:
+            yield JobStorage(
+                PostgresJobRepository(session), OutboxEventPublisher(session)
+            )
+
+    return open_storage
+
+
+async def lifecycle(open_storage: StorageFactory) -> None:
+    """ワーカーと同じ手順でジョブ 1 件を作成から完了まで進める。"""
+    async with open_storage() as storage:
+        job = await CreateJobUseCase(storage.repository, storage.publisher).execute(0)
+
+    async with open_storage() as storage:
+        job = await storage.repository.find_by_id(job.id)
+        job.start()
+        await storage.publisher.publish_all(job.collect_events())
+        await storage.repository.save(job)
+
+    async with open_storage() as storage:
+        job = await storage.repository.find_by_id(job.id)
+        job.complete(JobResult(message="done"))
+        await storage.publisher.publish_all(job.collect_events())
+        await storage.repository.save(job)
+
+
+async def list_page(open_storage: StorageFactory) -> None:
+    """一覧の先頭 50 件を取得する。"""
+    async with open_storage() as storage:
+        await ListJobsUseCase(storage.repository).execute(JobQuery(limit=50))
+
+
+async def measure(name: str, open_storage: StorageFactory, jobs: int) -> None:
+    """ライフサイクルと一覧取得をそれぞれ jobs 回実行し、1 回あたりの時間を出力する。"""
+    await lifecycle(open_storage)  # ウォームアップ
+
+    start = time.perf_counter()
+    for _ in range(jobs):
+        await lifecycle(open_storage)
+    lifecycle_us = (time.perf_counter() - start) / jobs * 1_000_000
+
+    start = time.perf_counter()
+    for _ in range(jobs):
+        await list_page(open_storage)
+    list_us = (time.perf_counter() - start) / jobs * 1_000_000
+
+    print(
+        f"{name:<9} lifecycle={lifecycle_us:>9.1f}us/job  list={list_us:>9.1f}us/page"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument(
+        "--adapters",
+        nargs="+",
+        choices=["memory", "postgres"],
+        default=["memory", "postgres"],
+    )
+    args = parser.parse_args()
+
+    if "memory" in args.adapters:
+        await measure("memory", memory_storage(), args.jobs)
+    if "postgres" in args.adapters:
+        await measure("postgres", await postgres_storage(), args.jobs)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,50 @@
+"""処理時間を計測する APIRoute。
+
+APIRouter(route_class=InstrumentedRoute) として使うと、そのルーターの各エンドポイントの
+処理時間をルートのパステンプレート（/api/jobs/{job_id} 等）ごとにヒストグラムへ記録する。
+リクエスト全体は 1 つのスパン（"GET /api/jobs/{job_id}" 等）になり、
+ユースケースやリポジトリのスパンはその子として記録される。
+ストリーミングレスポンスは、レスポンスを返すまで（送信開始まで）の時間になる。
+"""
+
+import time
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from fastapi import HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+
+from app.adapters.outbound.metrics.app_metrics import HTTP_REQUEST_SECONDS
+from app.ports.tracer import get_tracer
+
+
+class InstrumentedRoute(APIRoute):
+    """リクエストの処理時間を HTTP_REQUEST_SECONDS に記録する APIRoute。"""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        route = self.path
+
+        async def timed_handler(request: Request) -> Response:
+            start = time.perf_counter()
+            status = "500"
+            try:
+                with get_tracer().span(f"{request.method} {route}") as span:
+                    response = await handler(request)
+                    if span is not None:
+                        span.attributes["status"] = response.status_code
+                status = str(response.status_code)
+                return response
+            except HTTPException as e:
+                status = str(e.status_code)
+                raise
+            except RequestValidationError:
+                status = "422"
+                raise
+            finally:
+                HTTP_REQUEST_SECONDS.observe(
+                    time.perf_counter() - start, request.method, route, status
+                )
+
+        return timed_handler
@@ -7,27 +7,56 @@ HTTP リクエストを受け取り、ユースケースを呼び出してレス
 
 from __future__ import annotations
 
+import base64
+import csv
+import io
+import json
 import uuid
-from datetime import datetime
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from pydantic import BaseModel
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
 
-from app.adapters.outbound.messaging.redis_event_publisher import RedisEventPublisher
-from app.adapters.outbound.persistence.database import get_session
-from app.adapters.outbound.persistence.postgres_job_repository import (
-    PostgresJobRepository,
+from app.adapters.inbound.api.instrumented_route import InstrumentedRoute
+from app.adapters.outbound.job_storage import (
+    JobStorage,
+    get_job_storage,
+    open_job_storage,
 )
-from app.domain.exceptions import InvalidStatusTransitionError, JobNotFoundError
-from app.domain.models.job import Job, JobId
+from app.domain.exceptions import (
+    ConcurrencyConflictError,
+    InvalidStatusTransitionError,
+    JobNotFoundError,
+)
+from app.domain.models.job import Job, JobId, JobStatus
 from app.domain.models.notification import NotificationChannel
+from app.domain.models.priority import DEFAULT_SUBMITTER, JobPriority
+from app.ports.repository import JobCursor, JobFilter, JobQuery
 from app.usecases.cancel_job import CancelJobUseCase
 from app.usecases.create_job import CreateJobUseCase
+from app.usecases.create_jobs_batch import CreateJobsBatchUseCase, JobSpec
+from app.usecases.export_jobs import ExportJobsUseCase
 from app.usecases.get_job import GetJobUseCase
 from app.usecases.list_jobs import ListJobsUseCase
 
-router = APIRouter(prefix="/api/jobs", tags=["jobs"])
+router = APIRouter(prefix="/api/jobs", tags=["jobs"], route_class=InstrumentedRoute)
+
+LIST_DEFAULT_LIMIT = 100
+"""GET /api/jobs の 1 ページの既定件数。"""
+
+LIST_MAX_LIMIT = 500
+"""GET /api/jobs の 1 ページの最大件数。"""
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+"""次のページのカーソルを返すレスポンスヘッダー名。"""
+
+BATCH_MAX_JOBS = 10000
+"""POST /api/jobs/batch で 1 回に作成できるジョブ数の上限。"""
+
+EXPORT_CHUNK_ROWS = 500
+"""エクスポートで 1 回の書き込みにまとめる行数。"""
 
 
 # --- リクエスト / レスポンスのスキーマ ---
@@ -39,10 +68,45 @@ class CreateJobRequest(BaseModel):
     Attributes:
         duration_seconds: ダミージョブの実行秒数。
         notification_channel: 通知チャネル（none / email / discord）。
+        priority: 優先度（high / normal / low）。
+        submitter: 投入者。同じ優先度のジョブは投入者ごとに順番に実行される。
+        run_at: 実行予定時刻。未来の日時ならその時刻まで SCHEDULED で待つ
+            （タイムゾーンの無い日時は UTC とみなす）。
     """
 
     duration_seconds: int
     notification_channel: str = "none"
+    priority: str = "normal"
+    submitter: str = Field(default=DEFAULT_SUBMITTER, min_length=1, max_length=100)
+    run_at: datetime | None = None
+
+    def to_spec(self) -> JobSpec:
+        """ユースケースに渡す JobSpec に変換する。
+
+        Raises:
+            ValueError: 通知チャネルまたは優先度が不明な場合。
+        """
+        return JobSpec(
+            duration_seconds=self.duration_seconds,
+            notification_channel=NotificationChannel(self.notification_channel.upper()),
+            priority=JobPriority(self.priority.upper()),
+            submitter=self.submitter,
+            run_at=(
+                self.run_at.replace(tzinfo=timezone.utc)
+                if self.run_at is not None and self.run_at.tzinfo is None
+                else self.run_at
+            ),
+        )
+
+
+class CreateJobsBatchRequest(BaseModel):
+    """ジョブ一括作成リクエスト。
+
+    Attributes:
+        jobs: 作成するジョブ（1 件以上 BATCH_MAX_JOBS 件以下）。
+    """
+
+    jobs: list[CreateJobRequest] = Field(min_length=1, max_length=BATCH_MAX_JOBS)
 
 
 class JobResponse(BaseModel):
@@ -55,6 +119,9 @@ class JobResponse(BaseModel):
     status: str
     duration_seconds: int
     notification_channel: str
+    priority: str
+    submitter: str
+    run_at: datetime | None
     created_at: datetime
     started_at: datetime | None
     completed_at: datetime | None
@@ -69,6 +136,9 @@ def _to_response(job: Job) -> JobResponse:
         status=job.status.value,
         duration_seconds=job.job_type.duration_seconds,
         notification_channel=job.notification_channel.value.lower(),
+        priority=job.priority.value.lower(),
+        submitter=job.submitter,
+        run_at=job.run_at,
         created_at=job.created_at,
         started_at=job.started_at,
         completed_at=job.completed_at,
@@ -77,43 +147,201 @@ def _to_response(job: Job) -> JobResponse:
     )
 
 
+def _encode_cursor(cursor: JobCursor) -> str:
+    """カーソルを URL に載せられる不透明な文字列に変換する。"""
+    raw = json.dumps([cursor.created_at.isoformat(), str(cursor.job_id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(value: str) -> JobCursor:
+    """_encode_cursor の逆変換。
+
+    Raises:
+        HTTPException: カーソルが不正な場合（400）。
+    """
+    try:
+        raw = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+        decoded = json.loads(raw)
+        # JSON としては正しくても、[作成日時, ジョブ ID] の形でなければ不正とする
+        if not (
+            isinstance(decoded, list)
+            and len(decoded) == 2
+            and all(isinstance(v, str) for v in decoded)
+        ):
+            raise ValueError("cursor must be [created_at, job_id]")
+        created_at = datetime.fromisoformat(decoded[0])
+        if created_at.tzinfo is None:
+            raise ValueError("cursor created_at must have a timezone")
+        return JobCursor(created_at=created_at, job_id=JobId(uuid.UUID(decoded[1])))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _parse_enum_values(enum_type, values: list[str] | None, name: str) -> frozenset:
+    """クエリパラメータ（大文字小文字を問わない）を列挙型の集合に変換する。
+
+    Raises:
+        HTTPException: 不明な値が指定された場合（400）。
+    """
+    try:
+        return frozenset(enum_type(v.upper()) for v in values or [])
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Unknown {name}: {values}")
+
+
+def _job_filter(
+    job_status: list[str] | None = Query(default=None, alias="status"),
+    notification_channel: list[str] | None = Query(default=None),
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+) -> JobFilter:
+    """一覧・エクスポート共通の絞り込み用クエリパラメータを JobFilter に変換する。
+
+    status / notification_channel は複数指定可。作成日時は
+    created_from 以上、created_to 未満で絞り込む。
+    """
+    return JobFilter(
+        statuses=_parse_enum_values(JobStatus, job_status, "status"),
+        notification_channels=_parse_enum_values(
+            NotificationChannel, notification_channel, "notification_channel"
+        ),
+        created_from=created_from,
+        created_to=created_to,
+    )
+
+
+async def _export_lines(
+    job_filter: JobFilter, export_format: str
+) -> AsyncIterator[str]:
+    """条件に合うジョブを NDJSON または CSV の行にして、EXPORT_CHUNK_ROWS 行ずつ返す。
+
+    ストリーム中はリクエストの JobStorage とは別に JobStorage を開き、
+    送信が終わる（またはクライアントが切断する）まで保持する。
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if export_format == "csv":
+        writer.writerow(JobResponse.model_fields)
+    rows = 0
+    async with open_job_storage() as storage:
+        usecase = ExportJobsUseCase(storage.repository)
+        async for job in usecase.execute(job_filter):
+            response = _to_response(job)
+            if export_format == "csv":
+                writer.writerow(response.model_dump(mode="json").values())
+            else:
+                buffer.write(response.model_dump_json())
+                buffer.write("\n")
+            rows += 1
+            if rows % EXPORT_CHUNK_ROWS == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
 # --- エンドポイント ---
 
 
 @router.post("", status_code=status.HTTP_201_CREATED, response_model=JobResponse)
 async def create_job(
     body: CreateJobRequest,
-    request: Request,
-    session: AsyncSession = Depends(get_session),
+    storage: JobStorage = Depends(get_job_storage),
 ) -> JobResponse:
     """POST /api/jobs - 新しいジョブを作成する。"""
-    repo = PostgresJobRepository(session)
-    publisher = RedisEventPublisher(request.app.state.redis)
-    usecase = CreateJobUseCase(repo, publisher)
-    channel = NotificationChannel(body.notification_channel.upper())
-    job = await usecase.execute(body.duration_seconds, notification_channel=channel)
+    try:
+        spec = body.to_spec()
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    usecase = CreateJobUseCase(storage.repository, storage.publisher)
+    job = await usecase.execute(
+        spec.duration_seconds,
+        notification_channel=spec.notification_channel,
+        priority=spec.priority,
+        submitter=spec.submitter,
+        run_at=spec.run_at,
+    )
     return _to_response(job)
 
 
+@router.post(
+    "/batch", status_code=status.HTTP_201_CREATED, response_model=list[JobResponse]
+)
+async def create_jobs_batch(
+    body: CreateJobsBatchRequest,
+    storage: JobStorage = Depends(get_job_storage),
+) -> list[JobResponse]:
+    """POST /api/jobs/batch - 複数のジョブをまとめて作成する。
+
+    ジョブとイベント（アウトボックス）の INSERT を 1 トランザクションでまとめて行う。
+    """
+    try:
+        specs = [job.to_spec() for job in body.jobs]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    usecase = CreateJobsBatchUseCase(storage.repository, storage.publisher)
+    jobs = await usecase.execute(specs)
+    return [_to_response(j) for j in jobs]
+
+
 @router.get("", response_model=list[JobResponse])
 async def list_jobs(
-    session: AsyncSession = Depends(get_session),
+    response: Response,
+    limit: int = Query(default=LIST_DEFAULT_LIMIT, ge=1, le=LIST_MAX_LIMIT),
+    cursor: str | None = None,
+    job_filter: JobFilter = Depends(_job_filter),
+    storage: JobStorage = Depends(get_job_storage),
 ) -> list[JobResponse]:
-    """GET /api/jobs - ジョブ一覧を取得する。"""
-    repo = PostgresJobRepository(session)
-    usecase = ListJobsUseCase(repo)
-    jobs = await usecase.execute()
-    return [_to_response(j) for j in jobs]
+    """GET /api/jobs - ジョブ一覧を作成日時の降順で 1 ページ分取得する。
+
+    status / notification_channel（複数指定可）と作成日時の範囲
+    （created_from 以上、created_to 未満）で絞り込める。
+    続きがある場合は X-Next-Cursor ヘッダーにカーソルを返すので、
+    次のリクエストの cursor に指定する。
+    """
+    query = JobQuery(
+        limit=limit,
+        after=_decode_cursor(cursor) if cursor else None,
+        job_filter=job_filter,
+    )
+    usecase = ListJobsUseCase(storage.repository)
+    page = await usecase.execute(query)
+    if page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = _encode_cursor(page.next_cursor)
+    return [_to_response(j) for j in page.jobs]
+
+
+@router.get("/export")
+async def export_jobs(
+    export_format: str = Query(
+        default="ndjson", alias="format", pattern="^(ndjson|csv)$"
+    ),
+    job_filter: JobFilter = Depends(_job_filter),
+) -> StreamingResponse:
+    """GET /api/jobs/export - 条件に合う全ジョブを NDJSON または CSV でストリーム配信する。
+
+    一覧 API と同じ絞り込み条件を指定できる。行はサーバーサイドカーソルから
+    読みながら送るため、件数が増えてもサーバーのメモリ使用量は一定。
+    """
+    if export_format == "csv":
+        media_type = "text/csv"
+        headers = {"Content-Disposition": 'attachment; filename="jobs.csv"'}
+    else:
+        media_type = "application/x-ndjson"
+        headers = {}
+    return StreamingResponse(
+        _export_lines(job_filter, export_format), media_type=media_type, headers=headers
+    )
 
 
 @router.get("/{job_id}", response_model=JobResponse)
 async def get_job(
     job_id: str,
-    session: AsyncSession = Depends(get_session),
+    storage: JobStorage = Depends(get_job_storage),
 ) -> JobResponse:
     """GET /api/jobs/{job_id} - ジョブの詳細を取得する。"""
-    repo = PostgresJobRepository(session)
-    usecase = GetJobUseCase(repo)
+    usecase = GetJobUseCase(storage.repository)
     try:
         job = await usecase.execute(JobId(uuid.UUID(job_id)))
     except JobNotFoundError:
@@ -124,21 +352,22 @@ async def get_job(
 @router.post("/{job_id}/cancel", response_model=JobResponse)
 async def cancel_job(
     job_id: str,
-    request: Request,
-    session: AsyncSession = Depends(get_session),
+    storage: JobStorage = Depends(get_job_storage),
 ) -> JobResponse:
     """POST /api/jobs/{job_id}/cancel - ジョブをキャンセルする。
 
-    PENDING または RUNNING 状態のジョブのみキャンセル可能。
+    SCHEDULED・PENDING・RUNNING 状態のジョブのみキャンセル可能。
     完了済みのジョブをキャンセルしようとすると 400 エラーを返す。
+    読み込み後にワーカーがジョブを更新していた場合は 409 エラーを返す
+    （クライアントは最新の状態を確認して再試行できる）。
     """
-    repo = PostgresJobRepository(session)
-    publisher = RedisEventPublisher(request.app.state.redis)
-    usecase = CancelJobUseCase(repo, publisher)
+    usecase = CancelJobUseCase(storage.repository, storage.publisher)
     try:
         job = await usecase.execute(JobId(uuid.UUID(job_id)))
     except JobNotFoundError:
         raise HTTPException(status_code=404, detail="Job not found")
     except InvalidStatusTransitionError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except ConcurrencyConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     return _to_response(job)
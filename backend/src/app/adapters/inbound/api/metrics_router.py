@@ -0,0 +1,76 @@
+"""運用向けメトリクスのエンドポイント（プライマリアダプター）。
+
+エンドポイント:
+    GET /metrics        Prometheus のテキスト形式のメトリクス
+    GET /metrics/pool   DB コネクションプールの状態と統計（JSON）
+"""
+
+import asyncio
+import math
+import os
+import time
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.adapters.outbound.job_storage import open_job_storage
+from app.adapters.outbound.metrics.app_metrics import JOBS_BY_STATUS
+from app.adapters.outbound.metrics.registry import REGISTRY
+from app.adapters.outbound.persistence.database import pool_stats
+from app.domain.models.job import JobStatus
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+"""Prometheus のテキスト形式の Content-Type。"""
+
+JOB_COUNTS_TTL_SECONDS = float(os.environ.get("JOB_COUNTS_TTL_SECONDS", "15"))
+"""ステータスごとのジョブ数を数え直す間隔（秒）。それまでのスクレイプは前回の値を返す。"""
+
+
+class JobCountsCache:
+    """ステータスごとのジョブ数（GROUP BY の全件集計）を TTL の間使い回す。
+
+    スクレイプのたびに集計するとジョブ数に比例した負荷が DB にかかるため、
+    数え直すのは ttl 秒に 1 回だけにする。同時に来たスクレイプは 1 回の集計を待つ。
+    """
+
+    def __init__(self, ttl: float = JOB_COUNTS_TTL_SECONDS) -> None:
+        self._ttl = ttl
+        self._refreshed_at = -math.inf
+        self._lock = asyncio.Lock()
+
+    async def refresh(self) -> None:
+        """前回の集計から ttl 秒以上経っていれば数え直し、JOBS_BY_STATUS に反映する。"""
+        async with self._lock:
+            if time.monotonic() - self._refreshed_at < self._ttl:
+                return
+            async with open_job_storage() as storage:
+                counts = await storage.repository.count_by_status()
+            for status in JobStatus:
+                JOBS_BY_STATUS.set(counts.get(status, 0), status.value)
+            self._refreshed_at = time.monotonic()
+
+
+job_counts = JobCountsCache()
+"""このプロセスで共有するジョブ数のキャッシュ。"""
+
+
+@router.get("", response_class=PlainTextResponse)
+async def get_metrics() -> PlainTextResponse:
+    """GET /metrics - このプロセスのメトリクスを Prometheus のテキスト形式で返す。
+
+    ステータスごとのジョブ数は JOB_COUNTS_TTL_SECONDS ごとにリポジトリで数え直す。
+    """
+    await job_counts.refresh()
+    return PlainTextResponse(REGISTRY.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@router.get("/pool")
+async def get_pool_stats() -> dict:
+    """GET /metrics/pool - DB コネクションプールの状態と統計を返す。
+
+    checked_out が size + max_overflow に張り付き、wait_seconds_max や
+    timeouts が増えている場合はプールが足りていない。
+    """
+    return pool_stats()
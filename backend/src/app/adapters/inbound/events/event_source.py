@@ -0,0 +1,32 @@
+"""ドメインイベントの受信元のインターフェース。
+
+SSE の EventHub やワーカーのキャンセル検知は、この EventSource を通じて
+イベントを受け取り、Redis（RedisEventSource）かプロセス内のバス
+（InMemoryEventSource）かには依存しない。
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+
+EventHandler = Callable[[dict], Awaitable[None]]
+"""受信したイベント 1 件（JSON をデコードした dict）を処理するコルーチン関数。"""
+
+
+class EventSource(ABC):
+    """ドメインイベントの購読と、再送ログからの読み出しを提供する受信元。"""
+
+    @abstractmethod
+    async def run(self, handler: EventHandler) -> None:
+        """キャンセルされるまで、届いたイベントを handler に渡し続ける。"""
+        ...
+
+    @abstractmethod
+    async def read_after(
+        self, last_event_id: int
+    ) -> tuple[list[tuple[int, dict]], bool]:
+        """再送ログから last_event_id より後のイベントを読み出す。
+
+        Returns:
+            ((event_id, イベント) のリスト, 取りこぼしが保持範囲を超えていれば True)
+        """
+        ...
@@ -0,0 +1,27 @@
+"""プロセス内のイベントバスによる EventSource の実装（ADAPTER_MODE=memory 用）。"""
+
+import asyncio
+
+from app.adapters.inbound.events.event_source import EventHandler, EventSource
+from app.adapters.outbound.messaging.in_memory_event_bus import InMemoryEventBus
+
+
+class InMemoryEventSource(EventSource):
+    """InMemoryEventBus を購読する EventSource。"""
+
+    def __init__(self, bus: InMemoryEventBus) -> None:
+        self._bus = bus
+
+    async def run(self, handler: EventHandler) -> None:
+        """バスに handler を登録し、キャンセルされたら登録を解除する。"""
+        self._bus.subscribe(handler)
+        try:
+            await asyncio.Future()
+        finally:
+            self._bus.unsubscribe(handler)
+
+    async def read_after(
+        self, last_event_id: int
+    ) -> tuple[list[tuple[int, dict]], bool]:
+        """バスの再送ログから last_event_id より後のイベントを読み出す。"""
+        return self._bus.read_after(last_event_id)
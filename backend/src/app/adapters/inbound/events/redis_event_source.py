@@ -0,0 +1,43 @@
+"""Redis による EventSource の実装。
+
+購読は RedisEventSubscriber（job_events チャンネル）、
+再送は上限付きの Redis Stream（job_events:log）から行う。
+"""
+
+import json
+
+import redis.asyncio as aioredis
+
+from app.adapters.inbound.events.event_source import EventHandler, EventSource
+from app.adapters.inbound.events.redis_event_subscriber import RedisEventSubscriber
+from app.adapters.outbound.messaging.redis_event_publisher import EVENT_LOG_STREAM
+
+
+class RedisEventSource(EventSource):
+    """Redis Pub/Sub と再送ログを使った EventSource。"""
+
+    def __init__(self, redis: aioredis.Redis) -> None:
+        self._redis = redis
+
+    async def run(self, handler: EventHandler) -> None:
+        """job_events チャンネルを購読し、イベントを handler に渡し続ける。"""
+        await RedisEventSubscriber(self._redis, handler).run()
+
+    async def read_after(
+        self, last_event_id: int
+    ) -> tuple[list[tuple[int, dict]], bool]:
+        """再送ログ（job_events:log）から last_event_id より後のイベントを読み出す。"""
+        oldest = await self._redis.xrange(EVENT_LOG_STREAM, count=1)
+        entries = await self._redis.xrange(
+            EVENT_LOG_STREAM, min=f"{last_event_id + 1}-0", max="+"
+        )
+        gap = bool(oldest) and _entry_event_id(oldest[0][0]) > last_event_id + 1
+        return [
+            (_entry_event_id(entry_id), json.loads(fields[b"data"]))
+            for entry_id, fields in entries
+        ], gap
+
+
+def _entry_event_id(entry_id: bytes) -> int:
+    """再送ログのエントリ ID（"<event_id>-0"）からイベント ID を取り出す。"""
+    return int(entry_id.split(b"-", 1)[0])
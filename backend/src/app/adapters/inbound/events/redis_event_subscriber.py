@@ -0,0 +1,62 @@
+"""Redis Pub/Sub のドメインイベント購読（プライマリアダプター）。
+
+job_events チャンネルを 1 つの接続で Subscribe し、
+受信したイベント（JSON をデコードした dict）をハンドラーに渡す。
+pubsub.listen() でメッセージの到着までブロックするため、待機中に CPU を使わず、
+到着したイベントは遅延なくハンドラーに渡される。
+Redis との接続が切れた場合は、一定時間待ってから購読し直す。
+"""
+
+import asyncio
+import json
+import logging
+import traceback
+
+import redis.asyncio as aioredis
+
+from app.adapters.inbound.events.event_source import EventHandler
+from app.adapters.outbound.messaging.redis_event_publisher import CHANNEL
+
+logger = logging.getLogger(__name__)
+
+RESUBSCRIBE_DELAY_SECONDS = 1.0
+"""接続エラー後に購読し直すまでの待ち時間（秒）。"""
+
+
+class RedisEventSubscriber:
+    """job_events チャンネルを購読し、イベントをハンドラーに渡すサブスクライバー。"""
+
+    def __init__(self, redis: aioredis.Redis, handler: EventHandler) -> None:
+        self._redis = redis
+        self._handler = handler
+
+    async def run(self) -> None:
+        """キャンセルされるまでイベントを受信し続ける。"""
+        while True:
+            try:
+                await self._consume()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.error(
+                    "Event subscription failed, resubscribing: %s",
+                    traceback.format_exc(),
+                )
+                await asyncio.sleep(RESUBSCRIBE_DELAY_SECONDS)
+
+    async def _consume(self) -> None:
+        """1 つの Pub/Sub 接続でイベントを受信する。"""
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(CHANNEL)
+        try:
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    await self._handler(json.loads(message["data"]))
+        finally:
+            # 接続エラーの後は unsubscribe() も失敗しうるが、接続は必ずプールに返す
+            try:
+                await pubsub.unsubscribe(CHANNEL)
+            except Exception:
+                pass  # 既に切断されている
+            finally:
+                await pubsub.aclose()
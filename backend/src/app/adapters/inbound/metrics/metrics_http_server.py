@@ -0,0 +1,50 @@
+"""ワーカー・リレー用の最小限のメトリクス HTTP リスナー（プライマリアダプター）。
+
+FastAPI を持たないプロセスでも Prometheus からスクレイプできるよう、
+asyncio.start_server で GET /metrics だけに応答する。
+リクエストごとに接続を閉じる（Connection: close）単純な実装で、
+スクレイプ以外の用途は想定しない。
+"""
+
+import asyncio
+import logging
+
+from app.adapters.outbound.metrics.registry import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+"""Prometheus のテキスト形式の Content-Type。"""
+
+READ_TIMEOUT_SECONDS = 5.0
+"""リクエストヘッダーの受信を待つ上限（秒）。"""
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """1 件のリクエストに応答して接続を閉じる。"""
+    try:
+        head = await asyncio.wait_for(
+            reader.readuntil(b"\r\n\r\n"), timeout=READ_TIMEOUT_SECONDS
+        )
+        method, path, *_ = head.split(b"\r\n", 1)[0].decode("latin-1").split(" ")
+        if method == "GET" and path.split("?", 1)[0] == "/metrics":
+            status, body = "200 OK", REGISTRY.render().encode()
+        else:
+            status, body = "404 Not Found", b"Not Found\n"
+        writer.write(
+            f"HTTP/1.1 {status}\r\nContent-Type: {CONTENT_TYPE}\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+            + body
+        )
+        await writer.drain()
+    except (TimeoutError, ValueError, asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_metrics_server(port: int) -> asyncio.Server:
+    """0.0.0.0:port で GET /metrics に応答するサーバーを起動して返す。"""
+    server = await asyncio.start_server(_handle, "0.0.0.0", port)
+    logger.info("Serving metrics on :%d/metrics", port)
+    return server
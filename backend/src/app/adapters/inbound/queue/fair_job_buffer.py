@@ -0,0 +1,93 @@
+"""優先度と投入者で実行順を決める、ワーカーのローカルバッファ。
+
+JobDispatcher が JobQueue から取り出したジョブを積み、ランナーが次に実行する
+ジョブを取り出す。到着順（FIFO）ではなく、以下の 2 段階で選ぶ。
+
+    1. 優先度: 待っているジョブがある優先度の中から、PRIORITY_WEIGHTS の比率で選ぶ
+       （スムーズ重み付きラウンドロビン、PriorityPicker）。HIGH が詰まっていても
+       LOW は重みの分だけ進む
+    2. 投入者: 選んだ優先度の中で、投入者ごとのキューを 1 件ずつ順番に回す
+       （ラウンドロビン）。1 人が大量に投入しても、他の投入者のジョブは待たされない
+
+同じ投入者・同じ優先度のジョブは到着順に実行する。
+
+バッファで並べ替えられるのは取り出し済みのジョブだけのため、JobQueue の実装も
+同じ PriorityPicker と投入者ごとのラウンドロビンで取り出す（RedisStreamJobQueue、
+InMemoryJobQueue）。
+"""
+
+from collections import OrderedDict, deque
+from collections.abc import Iterable
+
+from app.adapters.inbound.queue.job_buffer import JobBuffer
+from app.domain.models.priority import JobPriority
+from app.ports.job_queue import JobDelivery
+
+PRIORITY_WEIGHTS: dict[JobPriority, int] = {
+    JobPriority.HIGH: 8,
+    JobPriority.NORMAL: 3,
+    JobPriority.LOW: 1,
+}
+"""優先度ごとの配分の重み。すべての優先度が待っている間、この比率で取り出す。"""
+
+
+class PriorityPicker:
+    """待っているジョブがある優先度から、重みの比率で次の優先度を選ぶ。
+
+    スムーズ重み付きラウンドロビン: 各優先度に重みの分だけ持ち分を足し、
+    最も多いものを選んで合計分を引く。待っているジョブが無い優先度は持ち分を 0 に戻す
+    （空の間に溜め込まない）。
+    """
+
+    def __init__(self, weights: dict[JobPriority, int] = PRIORITY_WEIGHTS) -> None:
+        self._weights = weights
+        self._credits = dict.fromkeys(JobPriority, 0)
+
+    def pick(self, waiting: Iterable[JobPriority]) -> JobPriority:
+        """waiting（1 つ以上）から次に取り出す優先度を選ぶ。"""
+        waiting = set(waiting)
+        total = 0
+        for priority in JobPriority:
+            if priority in waiting:
+                self._credits[priority] += self._weights[priority]
+                total += self._weights[priority]
+            else:
+                self._credits[priority] = 0
+        chosen = max(waiting, key=lambda p: (self._credits[p], self._weights[p]))
+        self._credits[chosen] -= total
+        return chosen
+
+
+class FairJobBuffer(JobBuffer):
+    """優先度ごとの重み付きラウンドロビンと、投入者ごとのラウンドロビンで取り出すバッファ。"""
+
+    def __init__(self, weights: dict[JobPriority, int] = PRIORITY_WEIGHTS) -> None:
+        super().__init__()
+        self._picker = PriorityPicker(weights)
+        self._queues: dict[JobPriority, OrderedDict[str, deque[JobDelivery]]] = {
+            priority: OrderedDict() for priority in JobPriority
+        }
+        self._sizes = dict.fromkeys(JobPriority, 0)
+
+    def qsize_by_priority(self) -> dict[JobPriority, int]:
+        """優先度ごとの、バッファで待っているジョブ数。"""
+        return dict(self._sizes)
+
+    def _push(self, delivery: JobDelivery) -> None:
+        """ジョブを投入者のキューの末尾に積む。"""
+        submitters = self._queues[delivery.priority]
+        submitters.setdefault(delivery.submitter, deque()).append(delivery)
+        self._sizes[delivery.priority] += 1
+
+    def _pop(self) -> JobDelivery:
+        """重みで選んだ優先度の先頭の投入者からジョブを 1 件取り出し、その投入者を末尾に回す。"""
+        priority = self._picker.pick(p for p in JobPriority if self._sizes[p])
+        submitters = self._queues[priority]
+        submitter, deliveries = next(iter(submitters.items()))
+        delivery = deliveries.popleft()
+        if deliveries:
+            submitters.move_to_end(submitter)
+        else:
+            del submitters[submitter]
+        self._sizes[priority] -= 1
+        return delivery
@@ -0,0 +1,70 @@
+"""プロセス内のジョブキューの実装（ADAPTER_MODE=memory 用）。
+
+JobQueue ポートの具象クラス。
+InMemoryEventBus を購読し、JobCreated が配信されたジョブを FairJobBuffer に積む。
+同じプロセスの JobDispatcher がそこからジョブを受け取る（Redis Streams の実装と同じく、
+優先度の重みと投入者の順番で取り出す。1 人の大量投入や HIGH の滞留があっても、
+他の投入者や LOW のジョブも取り出される）。
+
+プロセスが落ちればジョブもストアごと失われるため、ack・所有権の延長・再配信は行わない。
+"""
+
+import asyncio
+import uuid
+
+from app.adapters.inbound.queue.fair_job_buffer import FairJobBuffer
+from app.adapters.outbound.messaging.in_memory_event_bus import InMemoryEventBus
+from app.domain.models.job import JobId
+from app.domain.models.priority import DEFAULT_SUBMITTER, JobPriority
+from app.ports.job_queue import JobDelivery, JobQueue
+
+RECEIVE_WAIT_SECONDS = 2.0
+"""receive() でジョブを待つ最大時間（秒）。"""
+
+
+class InMemoryJobQueue(JobQueue):
+    """InMemoryEventBus の JobCreated をジョブとして配信する JobQueue の実装。"""
+
+    def __init__(self, bus: InMemoryEventBus) -> None:
+        self._bus = bus
+        self._buffer = FairJobBuffer()
+        bus.subscribe(self._on_event)
+
+    async def receive(self, max_count: int) -> list[JobDelivery]:
+        """優先度の重みと投入者の順番でジョブを最大 max_count 件受け取る。
+
+        無ければ最大 RECEIVE_WAIT_SECONDS 待つ。
+        """
+        try:
+            deliveries = [
+                await asyncio.wait_for(self._buffer.get(), timeout=RECEIVE_WAIT_SECONDS)
+            ]
+        except TimeoutError:
+            return []
+        while len(deliveries) < max_count and self._buffer.qsize():
+            deliveries.append(self._buffer.get_nowait())
+        return deliveries
+
+    async def ack(self, delivery: JobDelivery) -> None:
+        """取り出した時点でキューから消えているため、何もしない。"""
+        return None
+
+    async def extend(self, deliveries: list[JobDelivery]) -> None:
+        """他のワーカーに再配信されることは無いため、何もしない。"""
+        return None
+
+    async def close(self) -> None:
+        """バスの購読を解除する。"""
+        self._bus.unsubscribe(self._on_event)
+
+    async def _on_event(self, data: dict) -> None:
+        """JobCreated を受けたら、そのジョブをバッファに積む。"""
+        if data["event_type"] == "JobCreated":
+            delivery = JobDelivery(
+                job_id=JobId(uuid.UUID(data["job_id"])),
+                delivery_id=str(data["event_id"]),
+                trace_parent=data.get("trace_parent"),
+                priority=JobPriority(data.get("priority", "NORMAL")),
+                submitter=data.get("submitter", DEFAULT_SUBMITTER),
+            )
+            self._buffer.put_nowait(delivery)
@@ -0,0 +1,90 @@
+"""ワーカーのローカルバッファの基底クラスと、到着順（FIFO）の実装。
+
+JobDispatcher は JobQueue から取り出したジョブをバッファに積み、ランナーが
+次に実行するジョブをバッファから取り出す。どの順で取り出すかはバッファの実装で決まる
+（既定は優先度と投入者で選ぶ FairJobBuffer）。
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections import deque
+
+from app.domain.models.priority import JobPriority
+from app.ports.job_queue import JobDelivery
+
+
+class JobBuffer(ABC):
+    """実行待ちのジョブを積むバッファ。
+
+    asyncio.Queue と同じく put_nowait() / get() / get_nowait() / qsize() を持つ
+    （上限は持たない。バッファに積む数は JobDispatcher が取り出す数で制限する）。
+    取り出す順は _pop() で決める。
+    """
+
+    def __init__(self) -> None:
+        self._not_empty = asyncio.Event()
+
+    @abstractmethod
+    def qsize_by_priority(self) -> dict[JobPriority, int]:
+        """優先度ごとの、バッファで待っているジョブ数。"""
+        ...
+
+    def qsize(self) -> int:
+        """バッファで待っているジョブ数。"""
+        return sum(self.qsize_by_priority().values())
+
+    def put_nowait(self, delivery: JobDelivery) -> None:
+        """ジョブを積む。"""
+        self._push(delivery)
+        self._not_empty.set()
+
+    async def get(self) -> JobDelivery:
+        """次に実行するジョブを取り出す。空であれば積まれるまで待つ。"""
+        while not self.qsize():
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self._pop()
+
+    def get_nowait(self) -> JobDelivery:
+        """次に実行するジョブを待たずに取り出す。
+
+        Raises:
+            asyncio.QueueEmpty: バッファが空の場合。
+        """
+        if not self.qsize():
+            raise asyncio.QueueEmpty
+        return self._pop()
+
+    @abstractmethod
+    def _push(self, delivery: JobDelivery) -> None:
+        """ジョブをバッファに加える。"""
+        ...
+
+    @abstractmethod
+    def _pop(self) -> JobDelivery:
+        """次に実行するジョブを 1 件取り出す（空でないときだけ呼ばれる）。"""
+        ...
+
+
+class FifoJobBuffer(JobBuffer):
+    """優先度・投入者を使わず、到着順に取り出すバッファ。"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._deliveries: deque[JobDelivery] = deque()
+        self._sizes = dict.fromkeys(JobPriority, 0)
+
+    def qsize_by_priority(self) -> dict[JobPriority, int]:
+        """優先度ごとの、バッファで待っているジョブ数。"""
+        return dict(self._sizes)
+
+    def _push(self, delivery: JobDelivery) -> None:
+        """ジョブを末尾に積む。"""
+        self._deliveries.append(delivery)
+        self._sizes[delivery.priority] += 1
+
+    def _pop(self) -> JobDelivery:
+        """先頭のジョブを取り出す。"""
+        delivery = self._deliveries.popleft()
+        self._sizes[delivery.priority] -= 1
+        return delivery
@@ -0,0 +1,196 @@
+"""ジョブキューからの取り出しと並行実行数を制御するディスパッチャー。
+
+ワーカーのメインループとして、JobQueue から受け取ったジョブを
+ローカルのバッファ（JobBuffer）に積み、決まった数のランナータスクで実行する。
+ランナーが次に実行するジョブはバッファの実装で決まる。既定の FairJobBuffer は
+到着順ではなく、優先度の重みと投入者の順番で選ぶ（到着順にするなら FifoJobBuffer を渡す）。
+
+バックプレッシャーの仕組み:
+    - 同時に実行するジョブは最大 concurrency 件
+    - 実行待ちのジョブはローカルバッファに最大 buffer_size 件
+    - 両方が埋まっている間は JobQueue から新しいジョブを取り出さない
+      （取り出されなかったジョブは他のワーカーが受け取れる）
+
+停止の仕組み:
+    stop() が呼ばれると新しいジョブの取り出しをやめ、取り出し済みのジョブが
+    終わるのを最大 shutdown_grace 秒待ってから残りのタスクを停止する。
+"""
+
+import asyncio
+import logging
+import traceback
+from collections.abc import Awaitable, Callable
+
+from app.adapters.inbound.queue.fair_job_buffer import FairJobBuffer
+from app.adapters.inbound.queue.job_buffer import JobBuffer
+from app.domain.models.priority import JobPriority
+from app.ports.job_queue import JobDelivery, JobQueue
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[JobDelivery], Awaitable[None]]
+"""1 件のジョブを処理するコルーチン関数。正常に戻ったジョブは ack される。"""
+
+RECEIVE_RETRY_DELAY_SECONDS = 1.0
+"""JobQueue からの取り出しに失敗したとき、再試行するまでの待ち時間（秒）。"""
+
+
+class JobDispatcher:
+    """並行実行数に上限を設けて JobQueue のジョブを処理するディスパッチャー。
+
+    Args:
+        buffer: 実行待ちのジョブを積むバッファ（省略時は FairJobBuffer）。
+
+    Attributes:
+        in_flight: 実行中のジョブ数。
+        queued: ローカルバッファで実行を待っているジョブ数。
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        handler: JobHandler,
+        concurrency: int,
+        buffer_size: int,
+        batch_size: int,
+        extend_interval: float,
+        stats_interval: float,
+        shutdown_grace: float,
+        buffer: JobBuffer | None = None,
+    ) -> None:
+        self._queue = queue
+        self._handler = handler
+        self._concurrency = concurrency
+        self._capacity = concurrency + buffer_size
+        self._batch_size = batch_size
+        self._extend_interval = extend_interval
+        self._stats_interval = stats_interval
+        self._shutdown_grace = shutdown_grace
+        self._stopping = asyncio.Event()
+        self._buffer = buffer if buffer is not None else FairJobBuffer()
+        self._owned: dict[str, JobDelivery] = {}
+        self._slot_freed = asyncio.Event()
+        self.in_flight = 0
+
+    @property
+    def queued(self) -> int:
+        """ローカルバッファで実行を待っているジョブ数。"""
+        return self._buffer.qsize()
+
+    @property
+    def queued_by_priority(self) -> dict[JobPriority, int]:
+        """優先度ごとの、ローカルバッファで実行を待っているジョブ数。"""
+        return self._buffer.qsize_by_priority()
+
+    def stop(self) -> None:
+        """新しいジョブの取り出しをやめ、run() の終了処理を開始させる。"""
+        self._stopping.set()
+
+    async def run(self) -> None:
+        """ランナーと補助タスクを起動し、stop() が呼ばれるまで取り出しを続ける。
+
+        停止時（またはキャンセル時）は起動したタスクをすべて停止する。
+        ack されていないジョブは JobQueue の再配信に任せる。
+        """
+        tasks = [
+            asyncio.create_task(self._run_worker()) for _ in range(self._concurrency)
+        ]
+        tasks.append(asyncio.create_task(self._extend_owned()))
+        tasks.append(asyncio.create_task(self._log_stats()))
+        fetch = asyncio.create_task(self._fetch_loop())
+        stopping = asyncio.create_task(self._stopping.wait())
+        try:
+            await asyncio.wait({fetch, stopping}, return_when=asyncio.FIRST_COMPLETED)
+            fetch.cancel()
+            await asyncio.gather(fetch, return_exceptions=True)
+            await self._drain()
+        finally:
+            stopping.cancel()
+            fetch.cancel()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(fetch, stopping, *tasks, return_exceptions=True)
+
+    async def _drain(self) -> None:
+        """取り出し済みのジョブが終わるのを最大 shutdown_grace 秒待つ。"""
+        logger.info(
+            "Dispatcher stopping: waiting for %d job(s) (grace=%.0fs)",
+            len(self._owned),
+            self._shutdown_grace,
+        )
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._shutdown_grace
+        while self._owned and loop.time() < deadline:
+            self._slot_freed.clear()
+            try:
+                await asyncio.wait_for(
+                    self._slot_freed.wait(), timeout=deadline - loop.time()
+                )
+            except TimeoutError:
+                break
+        if self._owned:
+            logger.info(
+                "Dispatcher stopped with %d unfinished job(s); "
+                "they will be redelivered",
+                len(self._owned),
+            )
+
+    async def _fetch_loop(self) -> None:
+        """空きがある分だけ JobQueue からジョブを取り出し、バッファに積む。"""
+        while True:
+            free = self._capacity - len(self._owned)
+            if free <= 0:
+                self._slot_freed.clear()
+                await self._slot_freed.wait()
+                continue
+            try:
+                deliveries = await self._queue.receive(min(free, self._batch_size))
+            except Exception:
+                logger.error("Failed to receive jobs: %s", traceback.format_exc())
+                await asyncio.sleep(RECEIVE_RETRY_DELAY_SECONDS)
+                continue
+            for delivery in deliveries:
+                self._owned[delivery.delivery_id] = delivery
+                self._buffer.put_nowait(delivery)
+
+    async def _run_worker(self) -> None:
+        """バッファからジョブを 1 件ずつ取り出して実行するランナー。"""
+        while True:
+            delivery = await self._buffer.get()
+            self.in_flight += 1
+            try:
+                await self._handler(delivery)
+                await self._queue.ack(delivery)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # ack せず、JobQueue の再配信に任せる
+                logger.error(
+                    "Unhandled error for job %s: %s",
+                    delivery.job_id,
+                    traceback.format_exc(),
+                )
+            finally:
+                self.in_flight -= 1
+                self._owned.pop(delivery.delivery_id, None)
+                self._slot_freed.set()
+
+    async def _extend_owned(self) -> None:
+        """取り出し済みジョブの所有権を定期的に延長し、他のワーカーへの再配信を防ぐ。"""
+        while True:
+            await asyncio.sleep(self._extend_interval)
+            try:
+                await self._queue.extend(list(self._owned.values()))
+            except Exception:
+                logger.error("Failed to extend owned jobs: %s", traceback.format_exc())
+
+    async def _log_stats(self) -> None:
+        """実行中・待機中のジョブ数を定期的にログ出力する（レプリカ数の見積もり用）。"""
+        while True:
+            await asyncio.sleep(self._stats_interval)
+            logger.info(
+                "Dispatcher stats: in_flight=%d/%d queued=%d",
+                self.in_flight,
+                self._concurrency,
+                self.queued,
+            )
@@ -0,0 +1,150 @@
+"""実行予定時刻付きのジョブを、予定時刻になったら実行待ちにするスケジューラー。
+
+ワーカーのタスクとして 1 つだけ動き、予定時刻の近いジョブだけをヒープ
+（予定時刻の昇順）に持つ。ジョブごとのタスクやタイマーは作らない。
+
+    - DB からは予定時刻が SCHEDULER_HORIZON_SECONDS 秒先までのジョブを、
+      (status, run_at) のインデックスで予定時刻の昇順に最大 SCHEDULER_BATCH_SIZE 件読む。
+      それより先の予定のジョブは、何件あっても読まない
+    - ヒープの先頭の予定時刻まで眠り、時刻になったものをまとめて release に渡す
+    - 読み込んだ範囲内の予定時刻で作成されたジョブは、JobScheduled イベント
+      （add()）でヒープに加える。範囲外のものは次の読み込みで拾う
+    - 読み込みは、ヒープが空になったとき（まとめて読み切れなかった続きがあれば
+      すぐに）と、SCHEDULER_HORIZON_SECONDS の半分ごとに行う
+
+複数のワーカーが同じジョブを同時に release しても、実行待ちにするのは
+1 つだけ（ReleaseScheduledJobsUseCase の compare-and-set）。キャンセルされたジョブは
+ヒープに残っていても release 時にスキップされる。
+"""
+
+import asyncio
+import heapq
+import logging
+import os
+import traceback
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+
+from app.domain.models.job import JobId
+
+logger = logging.getLogger(__name__)
+
+SCHEDULER_HORIZON_SECONDS = float(os.environ.get("SCHEDULER_HORIZON_SECONDS", "60"))
+"""ヒープに読み込む予定時刻の範囲（現在時刻から何秒先までか）。"""
+SCHEDULER_BATCH_SIZE = int(os.environ.get("SCHEDULER_BATCH_SIZE", "1000"))
+"""1 回の読み込み・release で扱うジョブの最大数。"""
+SCHEDULER_RETRY_DELAY_SECONDS = 1.0
+"""読み込み・release に失敗したとき、再試行するまでの待ち時間（秒）。"""
+
+LoadDue = Callable[[datetime, int], Awaitable[list[tuple[datetime, JobId]]]]
+"""予定時刻が指定日時より前のジョブを、(予定時刻, ジョブ ID) の昇順で最大件数まで返す。"""
+Release = Callable[[list[JobId]], Awaitable[None]]
+"""予定時刻になったジョブを実行待ちにする。"""
+
+
+class JobScheduler:
+    """予定時刻の近いジョブだけをヒープに持ち、時刻になったら release に渡す。
+
+    Args:
+        load_due: DB から予定時刻の近いジョブを読む。
+        release: 予定時刻になったジョブを実行待ちにする。
+        horizon: ヒープに読み込む予定時刻の範囲（秒）。
+        batch_size: 1 回の読み込み・release で扱うジョブの最大数。
+    """
+
+    def __init__(
+        self,
+        load_due: LoadDue,
+        release: Release,
+        horizon: float = SCHEDULER_HORIZON_SECONDS,
+        batch_size: int = SCHEDULER_BATCH_SIZE,
+    ) -> None:
+        self._load_due = load_due
+        self._release = release
+        self._horizon = timedelta(seconds=horizon)
+        self._batch_size = batch_size
+        self._heap: list[tuple[datetime, str]] = []
+        self._known: set[str] = set()
+        self._loaded_until = datetime.min.replace(tzinfo=timezone.utc)
+        self._next_load = self._loaded_until
+        self._wakeup = asyncio.Event()
+
+    @property
+    def pending(self) -> int:
+        """ヒープで予定時刻を待っているジョブ数。"""
+        return len(self._heap)
+
+    def add(self, job_id: JobId, run_at: datetime) -> None:
+        """作成された予定付きのジョブを知らせる（JobScheduled イベントから呼ぶ）。
+
+        読み込み済みの範囲内であればヒープに加える。範囲外なら何もしない
+        （次の読み込みで DB から拾う）。
+        """
+        if run_at < self._loaded_until:
+            self._push(run_at, str(job_id))
+            self._wakeup.set()
+
+    async def run(self) -> None:
+        """キャンセルされるまで、予定時刻になったジョブを release し続ける。"""
+        while True:
+            now = datetime.now(timezone.utc)
+            try:
+                if not self._heap or now >= self._next_load:
+                    await self._load(now)
+                due = self._pop_due(now)
+                if due:
+                    await self._release(due)
+                    continue
+            except Exception:
+                logger.error("Scheduler failed: %s", traceback.format_exc())
+                await asyncio.sleep(SCHEDULER_RETRY_DELAY_SECONDS)
+                continue
+            await self._sleep(now)
+
+    async def _load(self, now: datetime) -> None:
+        """予定時刻が horizon 先までのジョブを DB から読み、ヒープに加える。
+
+        読み込み中に add() されたジョブも取りこぼさないよう、範囲は読む前に広げておく。
+        batch_size 件で読み切れなかった場合、読めたのは最後の 1 件の予定時刻まで
+        （それ以降の予定で作成されたジョブは add() では加えず、次の読み込みに任せる）。
+        """
+        due_before = now + self._horizon
+        self._loaded_until = max(self._loaded_until, due_before)
+        loaded = await self._load_due(due_before, self._batch_size)
+        for run_at, job_id in loaded:
+            self._push(run_at, str(job_id))
+        if len(loaded) >= self._batch_size:
+            self._loaded_until = loaded[-1][0]
+        self._next_load = now + self._horizon / 2
+
+    def _push(self, run_at: datetime, job_id: str) -> None:
+        """ヒープにジョブを加える（既にあれば何もしない）。
+
+        ジョブ ID は文字列で持つ（読み込みとイベントで型が揃わなくても重複しないように）。
+        """
+        if job_id not in self._known:
+            self._known.add(job_id)
+            heapq.heappush(self._heap, (run_at, job_id))
+
+    def _pop_due(self, now: datetime) -> list[JobId]:
+        """予定時刻になったジョブを最大 batch_size 件ヒープから取り出す。"""
+        due: list[JobId] = []
+        while self._heap and self._heap[0][0] <= now and len(due) < self._batch_size:
+            _, job_id = heapq.heappop(self._heap)
+            self._known.discard(job_id)
+            due.append(JobId(uuid.UUID(job_id)))
+        return due
+
+    async def _sleep(self, now: datetime) -> None:
+        """ヒープの先頭の予定時刻か次の読み込みまで、または add() されるまで眠る。"""
+        until = self._next_load
+        if self._heap:
+            until = min(until, self._heap[0][0])
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(
+                self._wakeup.wait(), timeout=(until - now).total_seconds()
+            )
+        except TimeoutError:
+            pass
@@ -0,0 +1,92 @@
+"""Redis Pub/Sub によるジョブキューの実装（プライマリアダプター）。
+
+JobQueue ポートの具象クラス。JOB_QUEUE_MODE=pubsub のときに使用する従来方式。
+job_events チャンネルの JobCreated をそのままジョブとして扱うため、
+全ワーカーが同じジョブを受け取り、ワーカー不在中のジョブは失われる。
+ack / extend は何もしない。
+
+pubsub.listen() で JobCreated の到着までブロックして待つ。
+接続エラーなどで listen() が終わった場合は Pub/Sub 接続を作り直して例外を送出し、
+次の receive() で購読し直す（JobDispatcher が一定時間待ってから呼び直す）。
+"""
+
+import json
+import uuid
+from collections.abc import AsyncIterator
+
+import redis.asyncio as aioredis
+
+from app.adapters.outbound.messaging.redis_event_publisher import CHANNEL
+from app.domain.models.job import JobId
+from app.domain.models.priority import DEFAULT_SUBMITTER, JobPriority
+from app.ports.job_queue import JobDelivery, JobQueue
+
+
+class RedisPubSubJobQueue(JobQueue):
+    """Redis Pub/Sub の JobCreated イベントを使った JobQueue の実装。"""
+
+    def __init__(self, redis: aioredis.Redis) -> None:
+        self._redis = redis
+        self._pubsub = redis.pubsub()
+        self._messages: AsyncIterator[dict] | None = None
+
+    async def receive(self, max_count: int) -> list[JobDelivery]:
+        """次の JobCreated イベントが届くまで待ち、1 件のジョブとして返す。
+
+        Raises:
+            ConnectionError: 購読が終了した場合。次の呼び出しで購読し直す。
+        """
+        if self._messages is None:
+            await self._pubsub.subscribe(CHANNEL)
+            self._messages = self._pubsub.listen()
+
+        while True:
+            try:
+                message = await anext(self._messages)
+            except StopAsyncIteration:
+                await self._reset()
+                raise ConnectionError("Pub/Sub subscription ended") from None
+            except Exception:
+                # 例外を送出した listen() は再開できないため、接続ごと作り直す
+                await self._reset()
+                raise
+            if message["type"] != "message":
+                continue
+            data = json.loads(message["data"])
+            if data.get("event_type") == "JobCreated":
+                return [
+                    JobDelivery(
+                        job_id=JobId(uuid.UUID(data["job_id"])),
+                        delivery_id=data["job_id"],
+                        trace_parent=data.get("trace_parent"),
+                        priority=JobPriority(data.get("priority", "NORMAL")),
+                        submitter=data.get("submitter", DEFAULT_SUBMITTER),
+                    )
+                ]
+
+    async def ack(self, delivery: JobDelivery) -> None:
+        """Pub/Sub には ack の仕組みが無いため、何もしない。"""
+        return None
+
+    async def extend(self, deliveries: list[JobDelivery]) -> None:
+        """Pub/Sub には所有権の概念が無いため、何もしない。"""
+        return None
+
+    async def _reset(self) -> None:
+        """壊れた Pub/Sub 接続を閉じ、購読し直せるよう新しい接続を用意する。"""
+        self._messages = None
+        try:
+            await self._pubsub.aclose()
+        except Exception:
+            pass  # 既に切断されている
+        self._pubsub = self._redis.pubsub()
+
+    async def close(self) -> None:
+        """購読を解除し、Pub/Sub 接続を閉じる。"""
+        try:
+            if self._messages is not None:
+                await self._pubsub.unsubscribe(CHANNEL)
+        except Exception:
+            pass  # 既に切断されている
+        finally:
+            await self._pubsub.aclose()
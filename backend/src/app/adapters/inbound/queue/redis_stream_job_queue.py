@@ -0,0 +1,400 @@
+"""Redis Streams によるジョブキューの実装（プライマリアダプター）。
+
+JobQueue ポートの具象クラス。
+RedisEventPublisher が優先度・投入者ごとのストリーム（job_queue_stream()）に追加したジョブを、
+コンシューマグループ経由で「1 件につき 1 ワーカー」に配信する。
+
+配信の仕組み:
+    1. XREADGROUP で未配信のエントリを受け取る（他のワーカーには配信されない）。
+       どのストリームから何件読むかは FairJobBuffer と同じ規則で決める
+       - 優先度: ジョブが残っている優先度から、PRIORITY_WEIGHTS の比率で選ぶ
+         （HIGH が大量に溜まっていても、LOW は重みの分だけ取り出される）
+       - 投入者: 選んだ優先度の中で、投入者ごとのストリームを順番に回す
+         （1 人が大量に投入しても、他の投入者のジョブはその後ろに並ばない）
+       どのストリームにも無ければ、job_queue:notify への追加を最大 JOB_QUEUE_BLOCK_MS 待つ
+    2. 処理が終わったら XACK + XDEL でストリームから取り除く。空になった投入者の
+       ストリームは、投入者の集合（JOB_QUEUE_SUBMITTERS）から外して削除する
+    3. ack されないまま JOB_QUEUE_CLAIM_IDLE_MS を超えたエントリは
+       XAUTOCLAIM で別のワーカーが引き継ぐ（クラッシュ・デプロイ時の再配信）
+    4. 実行中のワーカーは extend()（XCLAIM）で所有権を延長し、
+       長時間ジョブが再配信されないようにする
+"""
+
+import logging
+import os
+import socket
+import time
+import uuid
+from collections import Counter, OrderedDict
+
+import redis.asyncio as aioredis
+from redis.exceptions import ResponseError
+
+from app.adapters.inbound.queue.fair_job_buffer import PriorityPicker
+from app.adapters.outbound.messaging.redis_event_publisher import (
+    JOB_QUEUE_NOTIFY_SIZE,
+    JOB_QUEUE_NOTIFY_STREAM,
+    JOB_QUEUE_STREAMS,
+    JOB_QUEUE_SUBMITTERS,
+    job_queue_stream,
+)
+from app.domain.models.job import JobId
+from app.domain.models.priority import DEFAULT_SUBMITTER, JobPriority
+from app.ports.job_queue import JobDelivery, JobQueue
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUE_GROUP = os.environ.get("JOB_QUEUE_GROUP", "workers")
+"""ワーカーが所属するコンシューマグループ名。"""
+
+JOB_QUEUE_CONSUMER = os.environ.get(
+    "JOB_QUEUE_CONSUMER", f"{socket.gethostname()}-{os.getpid()}"
+)
+"""グループ内でこのワーカーを識別するコンシューマ名。"""
+
+JOB_QUEUE_BLOCK_MS = int(os.environ.get("JOB_QUEUE_BLOCK_MS", "2000"))
+"""ジョブの追加を待つ最大時間（ミリ秒）。ソケットタイムアウト未満にする。"""
+
+JOB_QUEUE_CLAIM_IDLE_MS = int(os.environ.get("JOB_QUEUE_CLAIM_IDLE_MS", "60000"))
+"""ack されないエントリを他のワーカーが引き継ぐまでのアイドル時間（ミリ秒）。"""
+
+# 投入者のストリームが空（未配信・未 ack のエントリが無い）なら、投入者の集合から外して
+# ストリームを削除する。パブリッシャーの追加（XADD + SADD のトランザクション）と
+# 入れ違いにならないよう、確認と削除をアトミックに行う。
+_DROP_SUBMITTER_SCRIPT = """
+if redis.call('XLEN', KEYS[1]) == 0 then
+  redis.call('SREM', KEYS[2], ARGV[1])
+  redis.call('DEL', KEYS[1])
+  return 1
+end
+return 0
+"""
+
+StreamKey = tuple[JobPriority, str]
+"""ジョブキューのストリームを表す (優先度, 投入者) の組。"""
+
+
+class RedisStreamJobQueue(JobQueue):
+    """Redis Streams のコンシューマグループを使った JobQueue の実装。
+
+    配信 ID（JobDelivery.delivery_id）は「エントリ ID@ストリーム名」とする
+    （ストリームごとに採番されるエントリ ID は、ストリームをまたぐと重複しうるため）。
+    """
+
+    def __init__(
+        self,
+        redis: aioredis.Redis,
+        group: str = JOB_QUEUE_GROUP,
+        consumer: str = JOB_QUEUE_CONSUMER,
+    ) -> None:
+        self._redis = redis
+        self._group = group
+        self._consumer = consumer
+        self._picker = PriorityPicker()
+        self._submitters: dict[JobPriority, OrderedDict[str, None]] = {
+            priority: OrderedDict.fromkeys([DEFAULT_SUBMITTER])
+            for priority in JobPriority
+        }
+        self._drop_script = redis.register_script(_DROP_SUBMITTER_SCRIPT)
+        self._notify_id: str | None = None
+        self._next_claim_at = 0.0
+
+    async def receive(self, max_count: int) -> list[JobDelivery]:
+        """ジョブを受け取る。
+
+        一定間隔で、アイドル時間を超えた他ワーカーの未 ack エントリを先に引き継ぐ。
+        続いて、優先度の重みと投入者の順番で選んだストリームから、待たずに最大
+        max_count 件まで読む。どのストリームにも無ければ、ジョブが追加されるまで
+        最大 JOB_QUEUE_BLOCK_MS 待ってから読み直す。
+        """
+        await self._ensure_group()
+
+        if time.monotonic() >= self._next_claim_at:
+            self._next_claim_at = time.monotonic() + JOB_QUEUE_CLAIM_IDLE_MS / 1000
+            claimed = await self._claim_stale(max_count)
+            if claimed:
+                return claimed
+
+        deliveries = await self._read_fair(max_count)
+        if deliveries or not await self._wait_for_jobs():
+            return deliveries
+        return await self._read_fair(max_count)
+
+    async def ack(self, delivery: JobDelivery) -> None:
+        """エントリを ack し、ストリームからも削除する。"""
+        entry_id, stream = _split_delivery_id(delivery.delivery_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.xack(stream, self._group, entry_id)
+            pipe.xdel(stream, entry_id)
+            await pipe.execute()
+
+    async def extend(self, deliveries: list[JobDelivery]) -> None:
+        """XCLAIM（JUSTID）でアイドル時間をリセットし、所有権を延長する。"""
+        by_stream: dict[str, list[str]] = {}
+        for delivery in deliveries:
+            entry_id, stream = _split_delivery_id(delivery.delivery_id)
+            by_stream.setdefault(stream, []).append(entry_id)
+        for stream, entry_ids in by_stream.items():
+            await self._redis.xclaim(
+                stream,
+                self._group,
+                self._consumer,
+                min_idle_time=0,
+                message_ids=entry_ids,
+                justid=True,
+            )
+
+    async def close(self) -> None:
+        """Redis クライアントは呼び出し元が所有するため、ここでは何もしない。"""
+        return None
+
+    async def _ensure_group(self) -> None:
+        """優先度ごとのストリームにコンシューマグループが無ければ作成する（ストリームも同時に作成）。
+
+        待機に使う job_queue:notify の読み始めの位置（最新のエントリ）もここで決める。
+        投入者ごとのストリームのグループは、初めて読むときに作成する。
+        """
+        if self._notify_id is not None:
+            return
+        for stream in JOB_QUEUE_STREAMS.values():
+            await self._create_group(stream, mkstream=True)
+        latest = await self._redis.xrevrange(JOB_QUEUE_NOTIFY_STREAM, count=1)
+        self._notify_id = _decode(latest[0][0]) if latest else "0-0"
+
+    async def _create_group(self, stream: str, mkstream: bool) -> bool:
+        """stream にコンシューマグループを作成する。
+
+        Returns:
+            グループがある（作成した・既にあった）なら True。
+            mkstream=False でストリームが無ければ False。
+        """
+        try:
+            await self._redis.xgroup_create(
+                stream, self._group, id="0", mkstream=mkstream
+            )
+            logger.info(
+                "Created consumer group '%s' on stream '%s'", self._group, stream
+            )
+        except ResponseError as e:
+            if "BUSYGROUP" in str(e):
+                return True
+            if not mkstream and "requires the key to exist" in str(e):
+                return False
+            raise
+        return True
+
+    async def _refresh_submitters(self) -> None:
+        """優先度ごとの投入者の集合を読み、順番待ちの投入者を入れ替える。
+
+        新しい投入者は末尾に加え、集合から外れた投入者は取り除く（既定の投入者は常に残す）。
+        """
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key in JOB_QUEUE_SUBMITTERS.values():
+                pipe.smembers(key)
+            members = await pipe.execute()
+        for priority, names in zip(JOB_QUEUE_SUBMITTERS, members):
+            active = {_decode(name) for name in names} | {DEFAULT_SUBMITTER}
+            rotation = self._submitters[priority]
+            for submitter in list(rotation):
+                if submitter not in active:
+                    del rotation[submitter]
+            for submitter in sorted(active.difference(rotation)):
+                rotation[submitter] = None
+
+    async def _read_fair(self, max_count: int) -> list[JobDelivery]:
+        """優先度の重みと投入者の順番で選んだストリームから、最大 max_count 件を待たずに読む。
+
+        まず max_count 件を優先度に割り当て、各優先度の中で投入者のストリームに割り当てる。
+        割り当てた件数より少なかったストリームは空とみなし、足りない分は同じ優先度の
+        他の投入者に、その優先度のストリームがすべて空なら他の優先度に割り当て直す
+        （すべてのストリームが空になるか max_count 件読めるまで）。
+        """
+        await self._refresh_submitters()
+        deliveries: list[JobDelivery] = []
+        exhausted: set[StreamKey] = set()
+        wanted: Counter[JobPriority] = Counter()
+        while True:
+            waiting = [
+                priority
+                for priority, rotation in self._submitters.items()
+                if any((priority, s) not in exhausted for s in rotation)
+            ]
+            wanted = Counter({p: n for p, n in wanted.items() if p in waiting})
+            for _ in range(max_count - len(deliveries) - wanted.total()):
+                if not waiting:
+                    break
+                wanted[self._picker.pick(waiting)] += 1
+            if not wanted:
+                break
+            plan = self._plan(wanted, exhausted)
+            read = await self._read_streams(plan)
+            for key, count in plan.items():
+                deliveries.extend(read[key])
+                wanted[key[0]] -= len(read[key])
+                if len(read[key]) < count:
+                    exhausted.add(key)
+            wanted = +wanted
+        await self._drop_drained(
+            [key for key in exhausted if key[1] != DEFAULT_SUBMITTER]
+        )
+        return deliveries
+
+    def _plan(
+        self, wanted: Counter[JobPriority], exhausted: set[StreamKey]
+    ) -> Counter[StreamKey]:
+        """優先度ごとの件数を、その優先度の投入者のストリームに順番に 1 件ずつ割り当てる。"""
+        plan: Counter[StreamKey] = Counter()
+        for priority, count in wanted.items():
+            rotation = self._submitters[priority]
+            for _ in range(count):
+                submitter = next(s for s in rotation if (priority, s) not in exhausted)
+                rotation.move_to_end(submitter)
+                plan[(priority, submitter)] += 1
+        return plan
+
+    async def _read_streams(
+        self, plan: Counter[StreamKey]
+    ) -> dict[StreamKey, list[JobDelivery]]:
+        """割り当てた件数ずつ、各ストリームからパイプラインでまとめて待たずに読む。
+
+        グループが無い投入者のストリーム（初めて読む・空になって削除された後に
+        追加された）は、グループを作成して読み直す。
+        """
+        keys = list(plan)
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for priority, submitter in keys:
+                pipe.xreadgroup(
+                    self._group,
+                    self._consumer,
+                    {job_queue_stream(priority, submitter): ">"},
+                    count=plan[(priority, submitter)],
+                )
+            responses = await pipe.execute(raise_on_error=False)
+
+        read: dict[StreamKey, list[JobDelivery]] = {}
+        for (priority, submitter), response in zip(keys, responses):
+            stream = job_queue_stream(priority, submitter)
+            if isinstance(response, ResponseError):
+                if "NOGROUP" not in str(response):
+                    raise response
+                if await self._create_group(stream, mkstream=False):
+                    response = await self._redis.xreadgroup(
+                        self._group,
+                        self._consumer,
+                        {stream: ">"},
+                        count=plan[(priority, submitter)],
+                    )
+                else:
+                    response = None
+            read[(priority, submitter)] = [
+                self._to_delivery(entry_id, fields, stream, priority, False)
+                for _, entries in response or []
+                for entry_id, fields in entries
+            ]
+        return read
+
+    async def _drop_drained(self, keys: list[StreamKey]) -> None:
+        """空になった投入者のストリームを、投入者の集合から外して削除する。"""
+        if not keys:
+            return
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for priority, submitter in keys:
+                await self._drop_script(
+                    keys=[
+                        job_queue_stream(priority, submitter),
+                        JOB_QUEUE_SUBMITTERS[priority],
+                    ],
+                    args=[submitter],
+                    client=pipe,
+                )
+            dropped = await pipe.execute()
+        for (priority, submitter), was_dropped in zip(keys, dropped):
+            if was_dropped:
+                self._submitters[priority].pop(submitter, None)
+
+    async def _wait_for_jobs(self) -> bool:
+        """job_queue:notify に前回以降のエントリが追加されるまで最大 JOB_QUEUE_BLOCK_MS 待つ。
+
+        Returns:
+            追加された（ジョブキューを読み直すべき）なら True。
+        """
+        response = await self._redis.xread(
+            {JOB_QUEUE_NOTIFY_STREAM: self._notify_id},
+            count=JOB_QUEUE_NOTIFY_SIZE,
+            block=JOB_QUEUE_BLOCK_MS,
+        )
+        if not response:
+            return False
+        self._notify_id = _decode(response[0][1][-1][0])
+        return True
+
+    async def _claim_stale(self, max_count: int) -> list[JobDelivery]:
+        """アイドル時間を超えた未 ack エントリを、優先度の高いストリームから順に引き継ぐ。"""
+        await self._refresh_submitters()
+        deliveries: list[JobDelivery] = []
+        for priority, rotation in self._submitters.items():
+            for submitter in list(rotation):
+                if len(deliveries) >= max_count:
+                    break
+                stream = job_queue_stream(priority, submitter)
+                try:
+                    response = await self._redis.xautoclaim(
+                        stream,
+                        self._group,
+                        self._consumer,
+                        min_idle_time=JOB_QUEUE_CLAIM_IDLE_MS,
+                        start_id="0-0",
+                        count=max_count - len(deliveries),
+                    )
+                except ResponseError as e:
+                    if "NOGROUP" not in str(e):
+                        raise
+                    continue  # まだ誰も読んでいないストリーム
+                entries = response[1] if response else []
+                deliveries.extend(
+                    self._to_delivery(entry_id, fields, stream, priority, True)
+                    for entry_id, fields in entries
+                    if fields
+                )
+        if deliveries:
+            logger.info("Reclaimed %d stale job(s) from other workers", len(deliveries))
+        return deliveries
+
+    @staticmethod
+    def _to_delivery(
+        entry_id: bytes | str,
+        fields: dict,
+        stream: str,
+        priority: JobPriority,
+        redelivered: bool,
+    ) -> JobDelivery:
+        """ストリームのエントリを JobDelivery に変換する。
+
+        優先度は読んだストリームで決まり、配信 ID には ack するストリーム名を含める。
+        投入者が無いエントリ（投入者を載せる前に追加されたもの）は既定値になる。
+        """
+        return JobDelivery(
+            job_id=JobId(uuid.UUID(_field(fields, "job_id"))),
+            delivery_id=f"{_decode(entry_id)}@{stream}",
+            redelivered=redelivered,
+            trace_parent=_field(fields, "trace_parent"),
+            priority=priority,
+            submitter=_field(fields, "submitter") or DEFAULT_SUBMITTER,
+        )
+
+
+def _split_delivery_id(delivery_id: str) -> tuple[str, str]:
+    """配信 ID を (エントリ ID, ストリーム名) に分ける。"""
+    entry_id, _, stream = delivery_id.partition("@")
+    return entry_id, stream
+
+
+def _decode(value: bytes | str) -> str:
+    """Redis の応答の値を文字列にする。"""
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _field(fields: dict, name: str) -> str | None:
+    """ストリームのエントリからフィールドの値を文字列で取り出す（無ければ None）。"""
+    value = fields.get(name.encode(), fields.get(name))
+    return _decode(value) if value is not None else None
@@ -0,0 +1,43 @@
+"""実行中ジョブのレジストリ。
+
+ワーカープロセス内で実行中のジョブを JobId で管理し、
+キャンセル要求（JobCancelled イベントや DB の再確認）を該当ジョブに即座に伝える。
+各ジョブは asyncio.Event を待機しており、cancel() でその Event がセットされる。
+"""
+
+import asyncio
+import uuid
+
+from app.domain.models.job import JobId
+
+
+class RunningJobRegistry:
+    """実行中ジョブのキャンセル通知を管理するレジストリ。"""
+
+    def __init__(self) -> None:
+        self._jobs: dict[str, asyncio.Event] = {}
+
+    def register(self, job_id: JobId) -> asyncio.Event:
+        """ジョブを登録し、キャンセル時にセットされる Event を返す。"""
+        event = asyncio.Event()
+        self._jobs[str(job_id)] = event
+        return event
+
+    def unregister(self, job_id: JobId) -> None:
+        """ジョブの登録を解除する。"""
+        self._jobs.pop(str(job_id), None)
+
+    def cancel(self, job_id: JobId | str) -> bool:
+        """ジョブにキャンセルを通知する。このプロセスで実行中でなければ False。"""
+        event = self._jobs.get(str(job_id))
+        if event is None:
+            return False
+        event.set()
+        return True
+
+    def job_ids(self) -> list[JobId]:
+        """実行中ジョブの ID 一覧を返す。"""
+        return [JobId(uuid.UUID(job_id)) for job_id in self._jobs]
+
+    def __len__(self) -> int:
+        return len(self._jobs)
@@ -0,0 +1,201 @@
+"""SSE クライアントへのイベント配信ハブ。
+
+API プロセスにつき 1 つだけイベントの受信元（EventSource。通常は Redis の
+job_events チャンネル、ADAPTER_MODE=memory ではプロセス内のバス）を購読し、
+受信したイベントを SSE 接続ごとの有界キュー（asyncio.Queue）に配る。
+SSE 接続が何本あっても、Redis への購読接続は 1 本で済む。
+
+購読の絞り込み:
+    購読はジョブ ID（ジョブ単位のストリーム）やイベント種別で絞り込める。
+    ハブはジョブ ID → 購読、イベント種別 → 購読 のインデックスを持ち、
+    1 イベントの配信コストは「該当する購読の数」に比例する（全購読は走査しない）。
+
+再接続時の再送:
+    イベントには単調増加する event_id が振られており、SSE の id: 行として送る。
+    再接続したクライアント（Last-Event-ID）には、上限付きの再送ログ
+    （EventSource.read_after）から取りこぼした分だけを replay() で返す。
+
+遅いクライアントの扱い:
+    キューが埋まったクライアントは切断する（ハブ全体を止めないため）。
+    ブラウザの EventSource は自動的に再接続する。
+"""
+
+import asyncio
+import json
+import logging
+from collections import defaultdict
+
+from app.adapters.inbound.events.event_source import EventSource
+
+logger = logging.getLogger(__name__)
+
+Frame = tuple[int | None, str]
+"""SSE フレームとそのイベント ID の組。"""
+
+
+class SseSubscription:
+    """1 本の SSE 接続に対応する購読。
+
+    Attributes:
+        queue: 送信待ちの (event_id, SSE フレーム)。None はストリーム終了の合図。
+        job_id: 対象のジョブ ID。None なら全ジョブ。
+        event_types: 対象のイベント種別。None なら全種別。
+        dropped: キューが溢れてハブから切り離された場合は True。
+    """
+
+    def __init__(
+        self,
+        queue_size: int,
+        job_id: str | None = None,
+        event_types: frozenset[str] | None = None,
+    ) -> None:
+        self.queue: asyncio.Queue[Frame | None] = asyncio.Queue(maxsize=queue_size)
+        self.job_id = job_id
+        self.event_types = event_types
+        self.dropped = False
+
+    def matches(self, data: dict) -> bool:
+        """イベントがこの購読の絞り込み条件に合うか判定する。"""
+        if self.job_id is not None and data["job_id"] != self.job_id:
+            return False
+        return self.event_types is None or data["event_type"] in self.event_types
+
+    def offer(self, frame: Frame) -> bool:
+        """フレームをキューに積む。キューが埋まっていれば積まずに False を返す。"""
+        try:
+            self.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    def close(self) -> None:
+        """キューに残ったフレームを捨て、ストリーム終了の合図を積む。"""
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+
+class EventHub:
+    """1 つの Redis 購読を全 SSE 接続に配るハブ。
+
+    main.lifespan で start() / stop() される。
+    """
+
+    def __init__(self, source: EventSource, client_queue_size: int) -> None:
+        self._source = source
+        self._client_queue_size = client_queue_size
+        self._subscriptions: set[SseSubscription] = set()
+        self._all_events: set[SseSubscription] = set()
+        self._by_event_type: dict[str, set[SseSubscription]] = defaultdict(set)
+        self._by_job_id: dict[str, set[SseSubscription]] = defaultdict(set)
+        self._task: asyncio.Task | None = None
+
+    @property
+    def client_count(self) -> int:
+        """接続中の SSE クライアント数。"""
+        return len(self._subscriptions)
+
+    async def start(self) -> None:
+        """イベントの購読を開始する。"""
+        self._task = asyncio.create_task(self._source.run(self._dispatch))
+
+    async def stop(self) -> None:
+        """イベントの購読を止め、全クライアントのストリームを終了させる。"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        for subscription in list(self._subscriptions):
+            subscription.close()
+            self.unsubscribe(subscription)
+
+    def subscribe(
+        self,
+        job_id: str | None = None,
+        event_types: frozenset[str] | None = None,
+    ) -> SseSubscription:
+        """新しい SSE 接続を登録する。
+
+        Args:
+            job_id: 指定した場合、そのジョブのイベントだけを受け取る。
+            event_types: 指定した場合、その種別のイベントだけを受け取る。
+        """
+        subscription = SseSubscription(self._client_queue_size, job_id, event_types)
+        self._subscriptions.add(subscription)
+        if job_id is not None:
+            self._by_job_id[job_id].add(subscription)
+        elif event_types is None:
+            self._all_events.add(subscription)
+        else:
+            for event_type in event_types:
+                self._by_event_type[event_type].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: SseSubscription) -> None:
+        """SSE 接続の登録を解除し、インデックスからも取り除く。"""
+        self._subscriptions.discard(subscription)
+        if subscription.job_id is not None:
+            self._discard(self._by_job_id, subscription.job_id, subscription)
+        elif subscription.event_types is None:
+            self._all_events.discard(subscription)
+        else:
+            for event_type in subscription.event_types:
+                self._discard(self._by_event_type, event_type, subscription)
+
+    async def replay(
+        self, subscription: SseSubscription, last_event_id: int
+    ) -> tuple[list[Frame], bool]:
+        """last_event_id より後のイベントのうち、購読の条件に合うものを返す。
+
+        Returns:
+            (再送するフレーム, 取りこぼしが再送ログの保持範囲を超えていれば True)
+        """
+        entries, gap = await self._source.read_after(last_event_id)
+        frames = [
+            (event_id, self._encode(data))
+            for event_id, data in entries
+            if subscription.matches(data)
+        ]
+        return frames, gap
+
+    async def _dispatch(self, data: dict) -> None:
+        """受信したイベントを該当する購読にだけ配る。
+
+        SSE 形式への変換は、配信先がある場合にイベントごとに 1 回だけ行う。
+        """
+        event_type = data["event_type"]
+        targets = [*self._all_events, *self._by_event_type.get(event_type, ())]
+        for subscription in self._by_job_id.get(data["job_id"], ()):
+            if (
+                subscription.event_types is None
+                or event_type in subscription.event_types
+            ):
+                targets.append(subscription)
+        if not targets:
+            return
+
+        frame = (data.get("event_id"), self._encode(data))
+        for subscription in targets:
+            if not subscription.offer(frame):
+                logger.warning("Dropping slow SSE client (queue full)")
+                subscription.dropped = True
+                subscription.close()
+                self.unsubscribe(subscription)
+
+    @staticmethod
+    def _encode(data: dict) -> str:
+        """イベントを SSE 形式（id / event / data 行）に変換する。"""
+        event_id = data.get("event_id")
+        head = f"id: {event_id}\n" if event_id is not None else ""
+        return f"{head}event: {data['event_type']}\ndata: {json.dumps(data)}\n\n"
+
+    @staticmethod
+    def _discard(
+        index: dict[str, set[SseSubscription]], key: str, subscription: SseSubscription
+    ) -> None:
+        """インデックスから購読を取り除き、空になったキーを削除する。"""
+        subscriptions = index.get(key)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del index[key]
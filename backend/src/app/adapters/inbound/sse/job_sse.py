@@ -1,62 +1,155 @@
 """SSE（Server-Sent Events）エンドポイント（プライマリアダプター）。
 
 ヘキサゴナルアーキテクチャのプライマリアダプター（入力側）として、
-Redis Pub/Sub のドメインイベントを購読し、SSE ストリームに変換して
+Redis Pub/Sub のドメインイベントを SSE ストリームに変換して
 ブラウザにリアルタイム配信する。
 
+エンドポイント:
+    GET /api/jobs/stream            全ジョブのイベント（event_type / status で絞り込み可）
+    GET /api/jobs/{job_id}/stream   指定したジョブのイベントのみ
+
 接続の仕組み:
-    1. クライアントが GET /api/jobs/stream に接続する
-    2. サーバーが Redis の job_events チャンネルを Subscribe する
-    3. イベントを受信するたびに SSE 形式でクライアントに送信する
-    4. クライアントが切断したらリソースをクリーンアップする
+    1. クライアントがストリームに接続する
+    2. EventHub（プロセスで 1 つの Redis 購読）に、絞り込み条件付きで購読を登録する
+    3. ハブが配ったイベントを SSE 形式でクライアントに送信する
+       （一定時間イベントが無ければ、接続維持用のコメント行を送る）
+    4. クライアントが切断するとジェネレーターがキャンセルされ、
+       ハブから購読を解除する
+
+再接続時の再送:
+    各イベントは id: 行（単調増加の event_id）付きで送られる。
+    EventSource が再接続時に送る Last-Event-ID ヘッダー（または last_event_id
+    クエリパラメータ）があれば、取りこぼした分だけを再送ログから先に送る。
+    取りこぼしが再送ログの保持範囲を超えている場合は Resync イベントを送り、
+    クライアントに一覧の再取得を促す。
 """
 
 import asyncio
-import json
+import os
+import uuid
 
-import redis.asyncio as aioredis
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Header, HTTPException, Query, Request
 from starlette.responses import StreamingResponse
 
-from app.adapters.outbound.messaging.redis_event_publisher import CHANNEL
+from app.adapters.inbound.sse.event_hub import EventHub, Frame, SseSubscription
+from app.adapters.outbound.job_storage import open_job_storage
+from app.domain.events.job_events import (
+    DomainEvent,
+    JobCancelled,
+    JobCompleted,
+    JobCreated,
+    JobFailed,
+    JobScheduled,
+    JobStarted,
+)
+from app.domain.exceptions import JobNotFoundError
+from app.domain.models.job import JobId, JobStatus
+from app.usecases.get_job import GetJobUseCase
+
+SSE_HEARTBEAT_SECONDS = float(os.environ.get("SSE_HEARTBEAT_SECONDS", "15"))
+"""イベントが無いときに接続維持用のコメント行を送る間隔（秒）。"""
+
+EVENT_TYPES = frozenset(cls.__name__ for cls in DomainEvent.__subclasses__())
+"""絞り込みに指定できるイベント種別。"""
+
+STATUS_EVENT_TYPES: dict[JobStatus, str] = {
+    JobStatus.SCHEDULED: JobScheduled.__name__,
+    JobStatus.PENDING: JobCreated.__name__,
+    JobStatus.RUNNING: JobStarted.__name__,
+    JobStatus.COMPLETED: JobCompleted.__name__,
+    JobStatus.FAILED: JobFailed.__name__,
+    JobStatus.CANCELLED: JobCancelled.__name__,
+}
+"""ステータスと、そのステータスへの遷移時に発行されるイベント種別の対応。"""
 
 router = APIRouter(prefix="/api/jobs", tags=["sse"])
 
 
-@router.get("/stream")
-async def job_stream(request: Request) -> StreamingResponse:
-    """GET /api/jobs/stream - ドメインイベントを SSE で配信する。
+def _parse_event_types(
+    event_types: list[str] | None, statuses: list[str] | None
+) -> frozenset[str] | None:
+    """クエリパラメータを、購読するイベント種別の集合に変換する。
 
-    Content-Type: text/event-stream のレスポンスを返し、
-    接続を維持したままイベントデータを逐次送信する。
+    どちらも未指定なら None（全種別）を返す。
+
+    Raises:
+        HTTPException: 不明なイベント種別・ステータスが指定された場合（400）。
+    """
+    if not event_types and not statuses:
+        return None
+    selected = set(event_types or [])
+    unknown = selected - EVENT_TYPES
+    if unknown:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown event_type: {sorted(unknown)}"
+        )
+    for value in statuses or []:
+        try:
+            selected.add(STATUS_EVENT_TYPES[JobStatus(value.upper())])
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Unknown status: {value}")
+    return frozenset(selected)
+
+
+def _parse_last_event_id(*values: str | None) -> int | None:
+    """Last-Event-ID（ヘッダーまたはクエリ）を整数に変換する。無効な値は無視する。"""
+    for value in values:
+        if value is not None and value.strip().isdigit():
+            return int(value)
+    return None
+
+
+async def _stream_response(
+    hub: EventHub, subscription: SseSubscription, last_event_id: int | None
+) -> StreamingResponse:
+    """購読に配られたイベントを SSE で送り続けるレスポンスを返す。
+
+    last_event_id が指定されていれば、取りこぼした分を先に再送する。
+    購読はハブに登録済みのため、再送の取得中に届いたイベントもキューに残り、
+    再送済みの ID より後のものだけが送られる。
     """
-    redis: aioredis.Redis = request.app.state.redis
-    pubsub = redis.pubsub()
-    await pubsub.subscribe(CHANNEL)
+    replayed: list[Frame] = []
+    if last_event_id is not None:
+        try:
+            replayed, gap = await hub.replay(subscription, last_event_id)
+        except BaseException:
+            hub.unsubscribe(subscription)
+            raise
+        if gap:
+            replayed.insert(0, (None, "event: Resync\ndata: {}\n\n"))
 
     async def event_generator():
-        """Redis Pub/Sub からイベントを受信し、SSE 形式に変換して yield する。
+        """再送分とハブから配られたイベントを yield する。
 
         SSE の出力形式:
+            id: 42
             event: JobStarted
-            data: {"event_type": "JobStarted", "job_id": "<uuid>", "timestamp": "<ISO8601>"}
+            data: {"event_id": 42, "event_type": "JobStarted", "job_id": "<uuid>", ...}
         """
+        sent_up_to = last_event_id
         try:
+            for event_id, frame in replayed:
+                if event_id is not None:
+                    sent_up_to = event_id
+                yield frame
             while True:
-                if await request.is_disconnected():
+                try:
+                    frame = await asyncio.wait_for(
+                        subscription.queue.get(), timeout=SSE_HEARTBEAT_SECONDS
+                    )
+                except TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if frame is None:
                     break
-                message = await pubsub.get_message(
-                    ignore_subscribe_messages=True, timeout=1.0
-                )
-                if message and message["type"] == "message":
-                    data = json.loads(message["data"])
-                    event_type = data["event_type"]
-                    yield f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
-                else:
-                    await asyncio.sleep(0.1)
+                event_id, data = frame
+                if sent_up_to is not None and event_id is not None:
+                    if event_id <= sent_up_to:
+                        continue
+                    sent_up_to = event_id
+                yield data
         finally:
-            await pubsub.unsubscribe(CHANNEL)
-            await pubsub.aclose()
+            hub.unsubscribe(subscription)
 
     return StreamingResponse(
         event_generator(),
@@ -66,3 +159,55 @@ async def job_stream(request: Request) -> StreamingResponse:
             "Connection": "keep-alive",
         },
     )
+
+
+@router.get("/stream")
+async def job_stream(
+    request: Request,
+    event_type: list[str] | None = Query(default=None),
+    status: list[str] | None = Query(default=None),
+    last_event_id: str | None = Query(default=None),
+    last_event_id_header: str | None = Header(default=None, alias="Last-Event-ID"),
+) -> StreamingResponse:
+    """GET /api/jobs/stream - ドメインイベントを SSE で配信する。
+
+    Content-Type: text/event-stream のレスポンスを返し、
+    接続を維持したままイベントデータを逐次送信する。
+    event_type（例: JobCompleted）や status（例: FAILED）を指定すると、
+    該当するイベントだけがサーバー側で絞り込まれて届く（複数指定可）。
+    """
+    hub: EventHub = request.app.state.event_hub
+    subscription = hub.subscribe(event_types=_parse_event_types(event_type, status))
+    return await _stream_response(
+        hub, subscription, _parse_last_event_id(last_event_id_header, last_event_id)
+    )
+
+
+@router.get("/{job_id}/stream")
+async def single_job_stream(
+    job_id: str,
+    request: Request,
+    event_type: list[str] | None = Query(default=None),
+    status: list[str] | None = Query(default=None),
+    last_event_id: str | None = Query(default=None),
+    last_event_id_header: str | None = Header(default=None, alias="Last-Event-ID"),
+) -> StreamingResponse:
+    """GET /api/jobs/{job_id}/stream - 指定したジョブのイベントだけを SSE で配信する。
+
+    ジョブが存在しない場合は 404 を返す。
+    存在確認の JobStorage はストリーム開始前に閉じ、接続中は DB を使わない。
+    """
+    event_types = _parse_event_types(event_type, status)
+    async with open_job_storage() as storage:
+        try:
+            job = await GetJobUseCase(storage.repository).execute(
+                JobId(uuid.UUID(job_id))
+            )
+        except JobNotFoundError:
+            raise HTTPException(status_code=404, detail="Job not found")
+
+    hub: EventHub = request.app.state.event_hub
+    subscription = hub.subscribe(job_id=str(job.id), event_types=event_types)
+    return await _stream_response(
+        hub, subscription, _parse_last_event_id(last_event_id_header, last_event_id)
+    )
@@ -0,0 +1,98 @@
+"""ジョブの永続化とイベント配信の実装を ADAPTER_MODE で切り替える。
+
+API・ワーカー・SSE は、リポジトリとパブリッシャーを直接組み立てずに
+open_job_storage()（FastAPI では Depends(get_job_storage)）で受け取る。
+同じ JobStorage のリポジトリとパブリッシャーは 1 つのトランザクションを共有し、
+イベントはジョブの保存と同時に確定する。
+
+    postgres（既定）: PostgresJobRepository + OutboxEventPublisher
+                      （アウトボックスリレーが Redis に配信する）
+    memory:           InMemoryJobRepository + InMemoryEventPublisher
+                      （保存時にプロセス内のバスへ直接配信する。外部 I/O なし）
+
+送信できなかった通知の保存先（NotificationDeadLetterStore）も、
+同じモードで open_dead_letter_store() が返す。
+"""
+
+import os
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+from app.adapters.outbound.messaging.in_memory_event_bus import (
+    InMemoryEventBus,
+    InMemoryEventPublisher,
+)
+from app.adapters.outbound.messaging.outbox_event_publisher import (
+    OutboxEventPublisher,
+)
+from app.adapters.outbound.persistence.database import async_session
+from app.adapters.outbound.persistence.in_memory_job_repository import (
+    InMemoryJobRepository,
+    InMemoryJobStore,
+    InMemorySession,
+)
+from app.adapters.outbound.persistence.in_memory_notification_dead_letter_store import (
+    InMemoryNotificationDeadLetterStore,
+)
+from app.adapters.outbound.persistence.postgres_job_repository import (
+    PostgresJobRepository,
+)
+from app.adapters.outbound.persistence.postgres_notification_dead_letter_store import (
+    PostgresNotificationDeadLetterStore,
+)
+from app.ports.event_publisher import EventPublisher
+from app.ports.notification_dead_letter_store import (
+    NotificationDeadLetter,
+    NotificationDeadLetterStore,
+)
+from app.ports.repository import JobRepository
+
+ADAPTER_MODE = os.environ.get("ADAPTER_MODE", "postgres")
+"""永続化とイベント配信の実装。postgres（PostgreSQL + Redis）または memory（プロセス内）。"""
+
+memory_store = InMemoryJobStore()
+"""memory モードでプロセス全体が共有するジョブの保存先。"""
+
+memory_bus = InMemoryEventBus()
+"""memory モードでプロセス全体が共有するイベントバス。"""
+
+memory_dead_letters: list[NotificationDeadLetter] = []
+"""memory モードでプロセス全体が共有するデッドレターの保存先。"""
+
+
+@dataclass(frozen=True)
+class JobStorage:
+    """1 つのトランザクションを共有するリポジトリとパブリッシャーの組。"""
+
+    repository: JobRepository
+    publisher: EventPublisher
+
+
+@asynccontextmanager
+async def open_job_storage() -> AsyncIterator[JobStorage]:
+    """ADAPTER_MODE に対応する JobStorage を開き、抜けるときに閉じる。"""
+    if ADAPTER_MODE == "memory":
+        session = InMemorySession(memory_store, memory_bus.publish_all)
+        yield JobStorage(
+            InMemoryJobRepository(session), InMemoryEventPublisher(session)
+        )
+        return
+    async with async_session() as session:
+        yield JobStorage(PostgresJobRepository(session), OutboxEventPublisher(session))
+
+
+@asynccontextmanager
+async def open_dead_letter_store() -> AsyncIterator[NotificationDeadLetterStore]:
+    """ADAPTER_MODE に対応する NotificationDeadLetterStore を開き、抜けるときに閉じる。"""
+    if ADAPTER_MODE == "memory":
+        yield InMemoryNotificationDeadLetterStore(memory_dead_letters)
+        return
+    async with async_session() as session:
+        yield PostgresNotificationDeadLetterStore(session)
+
+
+async def get_job_storage() -> AsyncGenerator[JobStorage, None]:
+    """FastAPI の Depends で使用する JobStorage のファクトリ（リクエストごとに開く）。"""
+    async with open_job_storage() as storage:
+        yield storage
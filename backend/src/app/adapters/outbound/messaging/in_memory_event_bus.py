@@ -0,0 +1,101 @@
+"""プロセス内のイベントバスとイベントパブリッシャーの実装（ADAPTER_MODE=memory 用）。
+
+InMemoryEventBus は Redis の job_events チャンネルと再送ログ（job_events:log）の代わりに、
+同じプロセス内の購読者（SSE の EventHub、ジョブキュー、ワーカーのキャンセル検知）へ
+イベントを直接渡す。メッセージの形式・event_id の採番は RedisEventPublisher と同じ。
+
+InMemoryEventPublisher は EventPublisher ポートの具象クラスで、OutboxEventPublisher と
+同じく書き込むだけで配信はしない。イベントは InMemorySession に溜まり、
+リポジトリの save() / add_all() が成功した時点でバスに配信される。
+"""
+
+import logging
+import traceback
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+from app.adapters.outbound.messaging.redis_event_publisher import (
+    EVENT_REPLAY_SIZE,
+    event_payload,
+)
+from app.adapters.outbound.persistence.in_memory_job_repository import (
+    InMemorySession,
+)
+from app.domain.events.job_events import DomainEvent
+from app.ports.event_publisher import EventPublisher
+from app.ports.tracer import current_traceparent
+
+logger = logging.getLogger(__name__)
+
+EventHandler = Callable[[dict], Awaitable[None]]
+"""配信されたイベント 1 件（JSON と同じ形の dict）を処理するコルーチン関数。"""
+
+
+class InMemoryEventBus:
+    """プロセス内の購読者にイベントを配るバス。
+
+    直近 replay_size 件は再送用に保持し、read_after() で取り出せる。
+    """
+
+    def __init__(self, replay_size: int = EVENT_REPLAY_SIZE) -> None:
+        self._last_event_id = 0
+        self._log: deque[tuple[int, dict]] = deque(maxlen=replay_size)
+        self._handlers: list[EventHandler] = []
+
+    def subscribe(self, handler: EventHandler) -> None:
+        """購読者を登録する。"""
+        self._handlers.append(handler)
+
+    def unsubscribe(self, handler: EventHandler) -> None:
+        """購読者の登録を解除する。"""
+        self._handlers.remove(handler)
+
+    async def publish_all(self, events: list[DomainEvent]) -> None:
+        """イベントに event_id を振り、再送ログに残してから全購読者に渡す。
+
+        購読者の例外はログに残して無視する（他の購読者への配信を止めない）。
+        """
+        trace_parent = current_traceparent()
+        for event in events:
+            self._last_event_id += 1
+            data = {
+                "event_id": self._last_event_id,
+                **event_payload(event, event.trace_parent or trace_parent),
+            }
+            self._log.append((self._last_event_id, data))
+            for handler in list(self._handlers):
+                try:
+                    await handler(data)
+                except Exception:
+                    logger.error(
+                        "Event handler failed for %s: %s",
+                        data["event_type"],
+                        traceback.format_exc(),
+                    )
+
+    def read_after(self, last_event_id: int) -> tuple[list[tuple[int, dict]], bool]:
+        """last_event_id より後のイベントを返す。
+
+        Returns:
+            ((event_id, イベント) のリスト, 取りこぼしが保持範囲を超えていれば True)
+        """
+        gap = bool(self._log) and self._log[0][0] > last_event_id + 1
+        return [entry for entry in self._log if entry[0] > last_event_id], gap
+
+
+class InMemoryEventPublisher(EventPublisher):
+    """InMemorySession にイベントを溜める EventPublisher の実装。
+
+    配信はセッションの commit（リポジトリの保存成功時）に行われる。
+    """
+
+    def __init__(self, session: InMemorySession) -> None:
+        self._session = session
+
+    async def publish(self, event: DomainEvent) -> None:
+        """ドメインイベントをセッションに溜める。"""
+        self._session.pending_events.append(event)
+
+    async def publish_all(self, events: list[DomainEvent]) -> None:
+        """複数のドメインイベントをセッションに溜める。"""
+        self._session.pending_events.extend(events)
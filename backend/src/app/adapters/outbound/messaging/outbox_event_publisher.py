@@ -0,0 +1,143 @@
+"""トランザクショナルアウトボックスによるイベントパブリッシャーの実装。
+
+EventPublisher ポートの具象クラス。
+ドメインイベントを Redis に直接送らず、PostgreSQL の event_outbox テーブルに書き込む。
+書き込みはリポジトリと同じセッション（トランザクション）で行われ、
+ジョブの保存（commit）と同時に確定する。
+
+各行には書き込んだ処理のトレースコンテキストも残し、リレーが配信するイベントに引き継ぐ。
+JobCreated の行には優先度と投入者も残し、ジョブキューのエントリに載せられるようにする。
+JobScheduled の行には実行予定時刻を残し、ワーカーのスケジューラーに届ける。
+
+確定したイベントはアウトボックスリレー（app.outbox_relay）が drain_outbox() で
+まとめて取り出し、RedisEventPublisher で配信してから削除する。
+配信後・削除前にリレーが落ちた場合は再配信される（at-least-once）。
+"""
+
+import time
+import uuid
+
+from sqlalchemy import delete, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.outbound.metrics.app_metrics import EVENT_PUBLISH_SECONDS
+from app.adapters.outbound.persistence.models import OutboxRow
+from app.domain.events.job_events import DomainEvent, JobCreated, JobId, JobScheduled
+from app.domain.models.priority import JobPriority
+from app.ports.event_publisher import EventPublisher
+from app.ports.tracer import current_traceparent, get_tracer, traced
+
+OUTBOX_CHANNEL = "event_outbox"
+"""アウトボックスへの書き込みをリレーに知らせる PostgreSQL の NOTIFY チャンネル名。"""
+
+EVENT_CLASSES: dict[str, type[DomainEvent]] = {
+    cls.__name__: cls for cls in DomainEvent.__subclasses__()
+}
+"""イベント種別名からドメインイベントのクラスへの対応。"""
+
+
+class OutboxEventPublisher(EventPublisher):
+    """event_outbox テーブルにイベントを書き込む EventPublisher の実装。
+
+    書き込むだけで commit はしない。ユースケースは save() の前に publish() し、
+    save() の commit でジョブの状態とイベントを同時に確定させる。
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def publish(self, event: DomainEvent) -> None:
+        """ドメインイベントをアウトボックスに書き込む（commit は呼び出し側）。"""
+        await self.publish_all([event])
+
+    @traced
+    async def publish_all(self, events: list[DomainEvent]) -> None:
+        """複数のドメインイベントを 1 つの INSERT 文でアウトボックスに書き込む。
+
+        同じトランザクションで NOTIFY も送り、commit 時にリレーを起こす。
+        """
+        if not events:
+            return
+        start = time.perf_counter()
+        trace_parent = current_traceparent()
+        await self._session.execute(
+            insert(OutboxRow),
+            [
+                _to_row_values(event, event.trace_parent or trace_parent)
+                for event in events
+            ],
+        )
+        await self._session.execute(text(f"NOTIFY {OUTBOX_CHANNEL}"))
+        EVENT_PUBLISH_SECONDS.observe(time.perf_counter() - start, "outbox")
+
+
+async def drain_outbox(
+    session: AsyncSession, publisher: EventPublisher, batch_size: int
+) -> int:
+    """確定済みのイベントを最大 batch_size 件取り出して配信し、アウトボックスから削除する。
+
+    行は FOR UPDATE SKIP LOCKED で取るため、リレーを複数動かしても
+    同じイベントを同時に配信することはない。
+
+    Returns:
+        配信したイベント数。
+    """
+    async with session.begin():
+        rows = (
+            (
+                await session.execute(
+                    select(OutboxRow)
+                    .order_by(OutboxRow.id)
+                    .limit(batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+            )
+            .scalars()
+            .all()
+        )
+        if not rows:
+            return 0
+        with get_tracer().span("drain_outbox", events=len(rows)):
+            await publisher.publish_all([_to_event(row) for row in rows])
+            await session.execute(
+                delete(OutboxRow).where(OutboxRow.id.in_([row.id for row in rows]))
+            )
+    return len(rows)
+
+
+def _to_row_values(event: DomainEvent, trace_parent: str | None) -> dict:
+    """ドメインイベントを event_outbox テーブルのカラム値に変換する。"""
+    values = {
+        "event_type": event.event_type,
+        "job_id": str(event.job_id),
+        "occurred_at": event.timestamp,
+        "trace_parent": trace_parent,
+        "priority": None,
+        "submitter": None,
+        "run_at": None,
+    }
+    if isinstance(event, JobCreated):
+        values["priority"] = event.priority.value
+        values["submitter"] = event.submitter
+    if isinstance(event, JobScheduled):
+        values["run_at"] = event.run_at
+    return values
+
+
+def _to_event(row: OutboxRow) -> DomainEvent:
+    """_to_row_values の逆変換。
+
+    優先度・投入者のカラムが追加される前に書き込まれた JobCreated は既定値になる。
+    """
+    values = {
+        "job_id": JobId(uuid.UUID(row.job_id)),
+        "timestamp": row.occurred_at,
+        "trace_parent": row.trace_parent,
+    }
+    if row.priority is not None:
+        values["priority"] = JobPriority(row.priority)
+    if row.submitter is not None:
+        values["submitter"] = row.submitter
+    if row.run_at is not None:
+        values["run_at"] = row.run_at
+    return EVENT_CLASSES[row.event_type](**values)
@@ -3,18 +3,120 @@
 EventPublisher ポートの具象クラス。
 ドメインイベントを JSON シリアライズし、Redis の job_events チャンネルに Publish する。
 ワーカーや SSE エンドポイントがこのチャンネルを Subscribe してイベントを受信する。
+
+各イベントには単調増加するイベント ID（event_id）が振られ、
+直近 EVENT_REPLAY_SIZE 件程度は上限付きの Redis Stream（job_events:log）にも残る。
+SSE の再接続時（Last-Event-ID）は、このストリームから取りこぼした分だけを再送する。
+
+JOB_QUEUE_MODE=stream の場合、JobCreated は優先度・投入者ごとのジョブキューのストリーム
+（job_queue_stream()）にも追加され、ワーカーはコンシューマグループ経由でジョブを 1 件ずつ受け取る。
+ワーカーはジョブを読み込まずに、読むストリームを選ぶことで実行順（優先度の重みと
+投入者の順番）を決める。
+
+メッセージとジョブキューのエントリには、イベントを発行した処理の
+トレースコンテキスト（trace_parent）を載せ、受け取った側のスパンを親子でつなぐ。
 """
 
 import json
+import os
+import time
 
 import redis.asyncio as aioredis
 
-from app.domain.events.job_events import DomainEvent
+from app.adapters.outbound.metrics.app_metrics import EVENT_PUBLISH_SECONDS
+from app.domain.events.job_events import DomainEvent, JobCreated, JobScheduled
+from app.domain.models.priority import DEFAULT_SUBMITTER, JobPriority
 from app.ports.event_publisher import EventPublisher
+from app.ports.tracer import current_traceparent, traced
 
 CHANNEL = "job_events"
 """Redis Pub/Sub のチャンネル名。全ドメインイベントがこのチャンネルで配信される。"""
 
+EVENT_SEQUENCE_KEY = "job_events:seq"
+"""イベント ID の採番に使うカウンターのキー名。"""
+
+EVENT_LOG_STREAM = "job_events:log"
+"""再送用に直近のイベントを保持する Redis Stream のキー名。"""
+
+EVENT_REPLAY_SIZE = int(os.environ.get("EVENT_REPLAY_SIZE", "10000"))
+"""job_events:log に保持するイベントのおおよその上限件数。"""
+
+JOB_QUEUE_STREAM = "job_queue"
+"""ワーカーが実行するジョブ（NORMAL）を保持する Redis Stream のキー名。"""
+
+JOB_QUEUE_STREAMS: dict[JobPriority, str] = {
+    JobPriority.HIGH: f"{JOB_QUEUE_STREAM}:high",
+    JobPriority.NORMAL: JOB_QUEUE_STREAM,
+    JobPriority.LOW: f"{JOB_QUEUE_STREAM}:low",
+}
+"""優先度ごとの、既定の投入者のジョブキューのストリーム名。
+
+NORMAL は優先度を導入する前と同じストリームを使う（残っているエントリもそのまま読める）。
+既定以外の投入者のジョブは、投入者ごとのストリーム（job_queue_stream()）に追加する。
+"""
+
+JOB_QUEUE_SUBMITTERS: dict[JobPriority, str] = {
+    priority: f"{stream}:submitters" for priority, stream in JOB_QUEUE_STREAMS.items()
+}
+"""優先度ごとの、投入者ごとのストリームにジョブが残っている投入者の集合（Redis Set）のキー名。"""
+
+JOB_QUEUE_NOTIFY_STREAM = f"{JOB_QUEUE_STREAM}:notify"
+"""ジョブの追加をワーカーに知らせる Redis Stream のキー名（待機中のワーカーを起こす）。"""
+
+JOB_QUEUE_NOTIFY_SIZE = 1000
+"""job_queue:notify に保持するおおよその上限件数。"""
+
+JOB_QUEUE_MODE = os.environ.get("JOB_QUEUE_MODE", "stream")
+"""ジョブの配信方式。stream（Redis Streams）または pubsub（従来の Pub/Sub）。"""
+
+PUBLISH_BATCH_SIZE = 1000
+"""publish_all() が 1 つのパイプライン（MULTI/EXEC）で送るイベント数の上限。"""
+
+# イベント ID の採番・再送ログへの追加・Publish を 1 往復かつアトミックに行う。
+# 採番と XADD の間に他のパブリッシャーが割り込むと ID の順序が崩れるため、
+# Lua スクリプトで 1 つのコマンドとして実行する。
+_PUBLISH_SCRIPT = """
+local id = redis.call('INCR', KEYS[1])
+local message = '{"event_id": ' .. id .. ', ' .. string.sub(ARGV[1], 2)
+redis.call('XADD', KEYS[2], 'MAXLEN', '~', ARGV[2], id .. '-0', 'data', message)
+redis.call('PUBLISH', ARGV[3], message)
+return id
+"""
+_SCRIPT_KEYS = [EVENT_SEQUENCE_KEY, EVENT_LOG_STREAM]
+
+
+def job_queue_stream(priority: JobPriority, submitter: str) -> str:
+    """ジョブを追加するジョブキューのストリーム名。
+
+    既定の投入者は優先度のストリーム（JOB_QUEUE_STREAMS）、それ以外は投入者ごとの
+    ストリームになる（1 人が大量に投入しても、他の投入者のジョブはその後ろに並ばない）。
+    """
+    if submitter == DEFAULT_SUBMITTER:
+        return JOB_QUEUE_STREAMS[priority]
+    return f"{JOB_QUEUE_STREAMS[priority]}:submitter:{submitter}"
+
+
+def event_payload(event: DomainEvent, trace_parent: str | None) -> dict:
+    """配信するメッセージの本体（event_id を除く）を返す。
+
+    event_id は配信する側（Lua スクリプト・InMemoryEventBus）が先頭に付ける。
+    JobCreated には優先度と投入者も含める（ジョブキューとして購読する側が使う）。
+    JobScheduled には実行予定時刻も含める（ワーカーのスケジューラーが使う）。
+    """
+    payload = {
+        "event_type": event.event_type,
+        "job_id": str(event.job_id),
+        "timestamp": event.timestamp.isoformat(),
+    }
+    if isinstance(event, JobCreated):
+        payload["priority"] = event.priority.value
+        payload["submitter"] = event.submitter
+    if isinstance(event, JobScheduled) and event.run_at is not None:
+        payload["run_at"] = event.run_at.isoformat()
+    if trace_parent:
+        payload["trace_parent"] = trace_parent
+    return payload
+
 
 class RedisEventPublisher(EventPublisher):
     """Redis Pub/Sub を使った EventPublisher の実装。
@@ -25,18 +127,81 @@ class RedisEventPublisher(EventPublisher):
 
     def __init__(self, redis: aioredis.Redis) -> None:
         self._redis = redis
+        self._publish_script = redis.register_script(_PUBLISH_SCRIPT)
 
+    @traced
     async def publish(self, event: DomainEvent) -> None:
         """ドメインイベントを JSON 形式で Redis チャンネルに Publish する。
 
         メッセージ形式:
-            {"event_type": "JobCreated", "job_id": "<uuid>", "timestamp": "<ISO8601>"}
+            {"event_id": 42, "event_type": "JobCreated", "job_id": "<uuid>",
+             "timestamp": "<ISO8601>", "trace_parent": "00-<trace_id>-<span_id>-01"}
+
+        stream モードの JobCreated は、ジョブキューへの追加と Publish を
+        1 つのトランザクション（MULTI/EXEC）で行う。
         """
-        message = json.dumps(
-            {
-                "event_type": event.event_type,
-                "job_id": str(event.job_id),
-                "timestamp": event.timestamp.isoformat(),
-            }
+        if JOB_QUEUE_MODE == "stream" and isinstance(event, JobCreated):
+            await self.publish_all([event])
+            return
+        start = time.perf_counter()
+        await self._publish_script(
+            keys=_SCRIPT_KEYS,
+            args=self._script_args(event, event.trace_parent or current_traceparent()),
         )
-        await self._redis.publish(CHANNEL, message)
+        EVENT_PUBLISH_SECONDS.observe(time.perf_counter() - start, "redis")
+
+    @traced
+    async def publish_all(self, events: list[DomainEvent]) -> None:
+        """複数のドメインイベントをパイプラインでまとめて Publish する。
+
+        PUBLISH_BATCH_SIZE 件ごとに 1 つのトランザクション（MULTI/EXEC）として
+        送るため、Redis との往復はイベント数ではなくバッチ数に比例する。
+        stream モードの JobCreated は、ジョブキューへの追加（投入者の登録と、
+        待機中のワーカーを起こす job_queue:notify への追加）も同じバッチに含める。
+        """
+        started = time.perf_counter()
+        trace_parent = current_traceparent()
+        for start in range(0, len(events), PUBLISH_BATCH_SIZE):
+            async with self._redis.pipeline(transaction=True) as pipe:
+                enqueued = False
+                for event in events[start : start + PUBLISH_BATCH_SIZE]:
+                    event_trace = event.trace_parent or trace_parent
+                    if JOB_QUEUE_MODE == "stream" and isinstance(event, JobCreated):
+                        self._enqueue(pipe, event, event_trace)
+                        enqueued = True
+                    await self._publish_script(
+                        keys=_SCRIPT_KEYS,
+                        args=self._script_args(event, event_trace),
+                        client=pipe,
+                    )
+                if enqueued:
+                    pipe.xadd(
+                        JOB_QUEUE_NOTIFY_STREAM,
+                        {"jobs": 1},
+                        maxlen=JOB_QUEUE_NOTIFY_SIZE,
+                        approximate=True,
+                    )
+                await pipe.execute()
+        EVENT_PUBLISH_SECONDS.observe(time.perf_counter() - started, "redis")
+
+    @staticmethod
+    def _enqueue(
+        pipe: aioredis.client.Pipeline, event: JobCreated, trace_parent: str | None
+    ) -> None:
+        """JobCreated のジョブを、優先度・投入者のストリームに追加するコマンドを積む。
+
+        既定以外の投入者は、ワーカーが読むストリームを見つけられるよう
+        優先度ごとの投入者の集合（JOB_QUEUE_SUBMITTERS）にも登録する。
+        """
+        entry = {"job_id": str(event.job_id), "submitter": event.submitter}
+        if trace_parent:
+            entry["trace_parent"] = trace_parent
+        pipe.xadd(job_queue_stream(event.priority, event.submitter), entry)
+        if event.submitter != DEFAULT_SUBMITTER:
+            pipe.sadd(JOB_QUEUE_SUBMITTERS[event.priority], event.submitter)
+
+    @staticmethod
+    def _script_args(event: DomainEvent, trace_parent: str | None) -> list:
+        """Publish スクリプトに渡す引数（メッセージ、再送ログの上限、チャンネル）。"""
+        message = json.dumps(event_payload(event, trace_parent))
+        return [message, EVENT_REPLAY_SIZE, CHANNEL]
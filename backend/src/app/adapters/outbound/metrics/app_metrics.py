@@ -0,0 +1,132 @@
+"""アプリケーション全体のメトリクス定義。
+
+API・ワーカー・リレーの各プロセスが同じ定義を使い、
+それぞれのプロセスで記録した値を /metrics から出力する。
+"""
+
+from app.adapters.outbound.metrics.registry import (
+    REGISTRY,
+    Counter,
+    Gauge,
+    Histogram,
+)
+from app.adapters.outbound.persistence.database import pool_stats
+
+JOB_DURATION_BUCKETS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 3600.0)
+"""キュー待ち時間・実行時間用のバケット境界（秒）。"""
+
+HTTP_REQUEST_SECONDS = REGISTRY.register(
+    Histogram(
+        "jobworker_http_request_duration_seconds",
+        "REST API のリクエスト処理時間（ルートごと）",
+        labels=("method", "route", "status"),
+    )
+)
+JOB_QUEUE_WAIT_SECONDS = REGISTRY.register(
+    Histogram(
+        "jobworker_job_queue_wait_seconds",
+        "ジョブの作成から実行開始までの時間（created_at→started_at、優先度ごと）",
+        labels=("priority",),
+        buckets=JOB_DURATION_BUCKETS,
+    )
+)
+JOB_EXECUTION_SECONDS = REGISTRY.register(
+    Histogram(
+        "jobworker_job_execution_seconds",
+        "ジョブの実行開始から終了までの時間（終了時のステータスごと）",
+        labels=("status",),
+        buckets=JOB_DURATION_BUCKETS,
+    )
+)
+WORKER_JOBS_IN_FLIGHT = REGISTRY.register(
+    Gauge("jobworker_worker_jobs_in_flight", "ワーカーで実行中のジョブ数")
+)
+WORKER_JOBS_QUEUED = REGISTRY.register(
+    Gauge(
+        "jobworker_worker_jobs_queued",
+        "ワーカーのローカルバッファで実行を待っているジョブ数（優先度ごと）",
+        labels=("priority",),
+    )
+)
+SCHEDULER_JOBS_PENDING = REGISTRY.register(
+    Gauge(
+        "jobworker_scheduler_jobs_pending",
+        "ワーカーのスケジューラーが予定時刻を待っているジョブ数（読み込み済みの範囲内）",
+    )
+)
+JOBS_BY_STATUS = REGISTRY.register(
+    Gauge("jobworker_jobs", "ステータスごとのジョブ数", labels=("status",))
+)
+EVENT_PUBLISH_SECONDS = REGISTRY.register(
+    Histogram(
+        "jobworker_event_publish_duration_seconds",
+        "ドメインイベントの配信にかかった時間（パブリッシャーごと、1 回の呼び出し単位）",
+        labels=("publisher",),
+    )
+)
+NOTIFICATION_SEND_SECONDS = REGISTRY.register(
+    Histogram(
+        "jobworker_notification_send_duration_seconds",
+        "通知の送信にかかった時間（チャネルごと）",
+        labels=("channel",),
+    )
+)
+NOTIFICATION_FAILURES = REGISTRY.register(
+    Counter(
+        "jobworker_notification_failures_total",
+        "通知の送信に失敗した回数（チャネルごと）",
+        labels=("channel",),
+    )
+)
+NOTIFICATION_RATE_LIMITED = REGISTRY.register(
+    Counter(
+        "jobworker_notification_rate_limited_total",
+        "通知の送信がレート制限（429）を受けて再送した回数（チャネルごと）",
+        labels=("channel",),
+    )
+)
+NOTIFICATION_RETRIES = REGISTRY.register(
+    Counter(
+        "jobworker_notification_retries_total",
+        "送信に失敗した通知をバックオフ後に再送した回数（チャネルごと）",
+        labels=("channel",),
+    )
+)
+NOTIFICATION_DEAD_LETTERS = REGISTRY.register(
+    Counter(
+        "jobworker_notification_dead_letters_total",
+        "送信を諦めてデッドレターに記録した通知の数（チャネルごと）",
+        labels=("channel",),
+    )
+)
+NOTIFICATION_QUEUE_DEPTH = REGISTRY.register(
+    Gauge("jobworker_notification_queue_depth", "送信待ちの通知の数")
+)
+SSE_CLIENTS = REGISTRY.register(
+    Gauge("jobworker_sse_clients", "接続中の SSE クライアント数")
+)
+DB_POOL_CONNECTIONS = REGISTRY.register(
+    Gauge(
+        "jobworker_db_pool_connections",
+        "DB コネクションプールの接続数（state: checked_out / checked_in / overflow）",
+        labels=("state",),
+    )
+)
+DB_POOL_WAIT_SECONDS_MAX = REGISTRY.register(
+    Gauge("jobworker_db_pool_wait_seconds_max", "DB 接続の取得にかかった時間の最大値")
+)
+DB_POOL_TIMEOUTS = REGISTRY.register(
+    Gauge("jobworker_db_pool_timeouts", "DB 接続の取得がタイムアウトした回数（累計）")
+)
+
+
+def _collect_pool_stats() -> None:
+    """スクレイプ時に DB コネクションプールの現在値をゲージに反映する。"""
+    stats = pool_stats()
+    for state in ("checked_out", "checked_in", "overflow"):
+        DB_POOL_CONNECTIONS.set(stats[state], state)
+    DB_POOL_WAIT_SECONDS_MAX.set(stats["wait_seconds_max"])
+    DB_POOL_TIMEOUTS.set(stats["timeouts"])
+
+
+REGISTRY.add_collector(_collect_pool_stats)
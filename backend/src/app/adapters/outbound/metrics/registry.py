@@ -0,0 +1,173 @@
+"""Prometheus 形式のメトリクスを集計する最小限のレジストリ。
+
+外部ライブラリやサービスに依存せず、プロセス内でカウンター・ゲージ・
+ヒストグラムを集計し、Prometheus のテキスト形式（version 0.0.4）で出力する。
+
+ホットパスでの負荷:
+    observe() / inc() はラベル値のタプルで辞書を 1 回引き、数値を足すだけ。
+    asyncio の単一スレッドから呼ばれる前提のため、ロックは取らない。
+    文字列の組み立ては render()（スクレイプ時）にだけ行う。
+"""
+
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from typing import TypeVar
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""ヒストグラムの既定のバケット境界（秒）。"""
+
+
+class _Metric:
+    """ラベル付きメトリクスの共通部分。"""
+
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labels: Iterable[str] = ()) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(labels)
+
+    def _label_text(self, values: tuple[str, ...], extra: str = "") -> str:
+        """ラベルを {a="x",b="y"} 形式に変換する。"""
+        pairs = [
+            f'{name}="{_escape(value)}"'
+            for name, value in zip(self.label_names, values, strict=True)
+        ]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def samples(self) -> list[str]:
+        """出力するサンプル行を返す。"""
+        raise NotImplementedError
+
+    def render(self) -> str:
+        """HELP / TYPE 行とサンプル行を返す。"""
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """単調増加するカウンター。"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: Iterable[str] = ()) -> None:
+        super().__init__(name, help_text, labels)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        """カウンターを amount だけ増やす。"""
+        self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def samples(self) -> list[str]:
+        return [
+            f"{self.name}{self._label_text(values)} {value}"
+            for values, value in self._values.items()
+        ]
+
+
+class Gauge(_Metric):
+    """任意の値を取るゲージ。"""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, labels: Iterable[str] = ()) -> None:
+        super().__init__(name, help_text, labels)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def set(self, value: float, *label_values: str) -> None:
+        """ゲージの値を設定する。"""
+        self._values[label_values] = value
+
+    def samples(self) -> list[str]:
+        return [
+            f"{self.name}{self._label_text(values)} {value}"
+            for values, value in self._values.items()
+        ]
+
+
+class Histogram(_Metric):
+    """値の分布をバケットごとの件数で集計するヒストグラム。"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: Iterable[str] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help_text, labels)
+        self._buckets = buckets
+        # ラベル値 → [バケットごとの件数..., 合計値, 件数]
+        self._values: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        """値を 1 件記録する。"""
+        state = self._values.get(label_values)
+        if state is None:
+            state = self._values[label_values] = [0.0] * (len(self._buckets) + 2)
+        index = bisect_left(self._buckets, value)
+        if index < len(self._buckets):
+            state[index] += 1
+        state[-2] += value
+        state[-1] += 1
+
+    def samples(self) -> list[str]:
+        lines = []
+        for values, state in self._values.items():
+            cumulative = 0.0
+            for bound, count in zip(self._buckets, state, strict=False):
+                cumulative += count
+                label = self._label_text(values, f'le="{bound}"')
+                lines.append(f"{self.name}_bucket{label} {cumulative}")
+            label = self._label_text(values, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{label} {state[-1]}")
+            lines.append(f"{self.name}_sum{self._label_text(values)} {state[-2]}")
+            lines.append(f"{self.name}_count{self._label_text(values)} {state[-1]}")
+        return lines
+
+
+M = TypeVar("M", bound=_Metric)
+
+
+class MetricsRegistry:
+    """メトリクスの登録先。render() でまとめてテキスト形式に変換する。
+
+    コレクターはスクレイプのたびに呼ばれる関数で、接続数などの
+    現在値をゲージに反映するのに使う（ホットパスで更新しなくて済む）。
+    """
+
+    def __init__(self) -> None:
+        self._metrics: list[_Metric] = []
+        self._collectors: list[Callable[[], None]] = []
+
+    def register(self, metric: M) -> M:
+        """メトリクスを登録して返す。"""
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """スクレイプ時に呼ぶコレクターを登録する。"""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """全メトリクスを Prometheus のテキスト形式で返す。"""
+        for collector in self._collectors:
+            collector()
+        return "\n".join(metric.render() for metric in self._metrics) + "\n"
+
+
+def _escape(value: str) -> str:
+    """ラベル値のバックスラッシュ・ダブルクォート・改行をエスケープする。"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+REGISTRY = MetricsRegistry()
+"""プロセス全体で共有するレジストリ。"""
@@ -0,0 +1,108 @@
+"""完了・失敗通知をまとめて送る NotificationSender のデコレーター（ダイジェスト）。
+
+NOTIFICATION_DIGEST_CHANNELS に含まれるチャネルでは、NotificationSenderFactory が
+送信アダプターをこのクラスで包む（既定では無効）。
+
+終了した（COMPLETED / FAILED の）ジョブの通知はすぐには送らずに溜め、
+最初の 1 件から NOTIFICATION_DIGEST_WINDOW_SECONDS 秒経つか、
+NOTIFICATION_DIGEST_MAX_JOBS 件溜まった時点で send_digest() の 1 回にまとめて送る。
+開始通知など、それ以外の通知はそのまま委譲する。
+
+大量のジョブが短時間に終わっても、外部への送信回数は
+「窓ごとに 1 回」か「MAX_JOBS 件ごとに 1 回」の多い方で済む。
+"""
+
+import asyncio
+import logging
+import os
+import traceback
+
+from app.domain.models.job import Job, JobStatus
+from app.ports.notification_sender import NotificationSender
+
+logger = logging.getLogger(__name__)
+
+NOTIFICATION_DIGEST_CHANNELS = frozenset(
+    channel.strip().upper()
+    for channel in os.environ.get("NOTIFICATION_DIGEST_CHANNELS", "").split(",")
+    if channel.strip()
+)
+"""ダイジェストにまとめるチャネル（カンマ区切り。例: EMAIL,DISCORD）。空なら無効。"""
+NOTIFICATION_DIGEST_WINDOW_SECONDS = float(
+    os.environ.get("NOTIFICATION_DIGEST_WINDOW_SECONDS", "10")
+)
+"""最初の通知が溜まってからダイジェストを送るまでの最大時間（秒）。"""
+NOTIFICATION_DIGEST_MAX_JOBS = int(os.environ.get("NOTIFICATION_DIGEST_MAX_JOBS", "50"))
+"""1 つのダイジェストにまとめる最大件数。溜まった時点で窓を待たずに送る。"""
+
+DIGEST_STATUSES = frozenset({JobStatus.COMPLETED, JobStatus.FAILED})
+"""ダイジェストにまとめる通知のステータス。"""
+
+
+class DigestNotificationSender(NotificationSender):
+    """終了通知を溜めて、別の NotificationSender の send_digest() でまとめて送る。
+
+    Args:
+        inner: 委譲先。
+        window: 最初の通知が溜まってから送るまでの最大時間（秒）。
+        max_jobs: 1 つのダイジェストにまとめる最大件数。
+    """
+
+    def __init__(
+        self,
+        inner: NotificationSender,
+        window: float = NOTIFICATION_DIGEST_WINDOW_SECONDS,
+        max_jobs: int = NOTIFICATION_DIGEST_MAX_JOBS,
+    ) -> None:
+        self._inner = inner
+        self._window = window
+        self._max_jobs = max_jobs
+        self._pending: list[Job] = []
+        self._timer: asyncio.Task | None = None
+
+    async def send(self, job: Job) -> str | None:
+        """終了通知なら溜め、それ以外は委譲先ですぐに送る。
+
+        溜めた通知が max_jobs 件に達した場合は、この呼び出しの中でまとめて送る。
+        """
+        if job.status not in DIGEST_STATUSES:
+            return await self._inner.send(job)
+        self._pending.append(job)
+        if len(self._pending) >= self._max_jobs:
+            self._cancel_timer()
+            await self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+        return None
+
+    async def close(self) -> None:
+        """溜まっている通知をすぐに送る（シャットダウン時）。"""
+        self._cancel_timer()
+        await self._flush()
+
+    async def _flush_later(self) -> None:
+        """窓の時間だけ待ってから、溜まった通知を送る。"""
+        await asyncio.sleep(self._window)
+        # 送信中にキャンセルされないよう、送り始める前にタイマーを外す
+        self._timer = None
+        await self._flush()
+
+    def _cancel_timer(self) -> None:
+        """待機中のタイマーを止める。"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    async def _flush(self) -> None:
+        """溜まった通知を send_digest() で送る。失敗はログに残して捨てる。"""
+        jobs, self._pending = self._pending, []
+        if not jobs:
+            return
+        try:
+            await self._inner.send_digest(jobs)
+        except Exception:
+            logger.error(
+                "Failed to send notification digest for %d jobs: %s",
+                len(jobs),
+                traceback.format_exc(),
+            )
@@ -3,23 +3,86 @@
 Discord Webhook 経由でジョブの開始・完了・失敗通知を送信する。
 フォーラムチャネルの場合、開始通知で新しいスレッドを作成し、
 完了・失敗通知では同じスレッドに返信する。
+
+HTTP クライアントは送信ごとに作らず、プロセスで 1 つを共有する
+（create_discord_http_client()。NotificationSenderFactory が作成・クローズする）。
+HTTP/2 と keep-alive で接続を使い回すため、通知ごとの TCP・TLS の確立が無くなる。
+HTTP/2 では 1 接続に複数のリクエストが多重化されるため、
+同時リクエスト数は接続数の上限とは別にセマフォで制限する。
+
+Discord のレート制限には DiscordRateLimiter（Webhook ごとのトークンバケット）で従い、
+429 を受けた場合は Retry-After だけ待ってから最大 DISCORD_MAX_RETRIES 回まで再送する。
+
+ダイジェスト（send_digest）は複数ジョブを 1 つの埋め込み（embed）にまとめて 1 回で送る。
 """
 
+import asyncio
 import logging
 import os
+from collections import Counter
 
 import httpx
 
+from app.adapters.outbound.metrics.app_metrics import NOTIFICATION_RATE_LIMITED
+from app.adapters.outbound.notification.discord_rate_limiter import (
+    DiscordRateLimiter,
+)
 from app.domain.models.job import Job, JobStatus
 from app.ports.notification_sender import NotificationSender
 
 logger = logging.getLogger(__name__)
 
 DISCORD_WEBHOOK_URL = os.environ.get("DISCORD_WEBHOOK_URL", "")
+DISCORD_MAX_CONCURRENCY = int(os.environ.get("DISCORD_MAX_CONCURRENCY", "10"))
+"""Discord への同時リクエスト数（と接続数）の上限。"""
+DISCORD_HTTP_TIMEOUT_SECONDS = float(
+    os.environ.get("DISCORD_HTTP_TIMEOUT_SECONDS", "5")
+)
+"""Discord への 1 リクエストのタイムアウト（秒）。"""
+DISCORD_KEEPALIVE_SECONDS = float(os.environ.get("DISCORD_KEEPALIVE_SECONDS", "60"))
+"""使われていない接続を保持しておく時間（秒）。"""
+DISCORD_MAX_RETRIES = int(os.environ.get("DISCORD_MAX_RETRIES", "5"))
+"""レート制限（429）を受けた通知を再送する最大回数。"""
+
+EMBED_DESCRIPTION_LIMIT = 4096
+"""Discord の埋め込みの説明文の最大文字数。"""
+
+
+def create_discord_http_client() -> httpx.AsyncClient:
+    """Discord への送信で共有する HTTP クライアント（HTTP/2、接続プール付き）を作る。"""
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=DISCORD_MAX_CONCURRENCY,
+            max_keepalive_connections=DISCORD_MAX_CONCURRENCY,
+            keepalive_expiry=DISCORD_KEEPALIVE_SECONDS,
+        ),
+        timeout=DISCORD_HTTP_TIMEOUT_SECONDS,
+    )
 
 
 class DiscordNotificationSender(NotificationSender):
-    """Discord Webhook を使った通知送信の実装。"""
+    """Discord Webhook を使った通知送信の実装。
+
+    Args:
+        client: 共有する HTTP クライアント。クローズは呼び出し側が行う。
+        webhook_url: 送信先の Webhook URL。
+        max_concurrency: 同時に送信するリクエスト数の上限。
+        max_retries: 429 を受けたときに再送する最大回数。
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        webhook_url: str = DISCORD_WEBHOOK_URL,
+        max_concurrency: int = DISCORD_MAX_CONCURRENCY,
+        max_retries: int = DISCORD_MAX_RETRIES,
+    ) -> None:
+        self._client = client
+        self._webhook_url = webhook_url
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_retries = max_retries
+        self._rate_limiter = DiscordRateLimiter()
 
     async def send(self, job: Job) -> str | None:
         """ジョブの状態に基づいて Discord 通知を送信する。
@@ -34,39 +97,110 @@ class DiscordNotificationSender(NotificationSender):
                 content += f"\nError: {job.result.error}"
 
         payload: dict = {"content": content}
-        url = DISCORD_WEBHOOK_URL
+        url = self._webhook_url
         thread_id: str | None = None
 
         thread_name = os.environ.get("DISCORD_WEBHOOK_THREAD_NAME", "")
 
         if job.discord_thread_id:
             # 既存スレッドに返信
-            url = f"{DISCORD_WEBHOOK_URL}?thread_id={job.discord_thread_id}"
+            url = f"{self._webhook_url}?thread_id={job.discord_thread_id}"
         elif thread_name:
             # 新しいスレッドを作成（開始通知時）
             payload["thread_name"] = thread_name
-            url = f"{DISCORD_WEBHOOK_URL}?wait=true"
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=payload)
-            if not response.is_success:
-                logger.error(
-                    "Discord API error for job %s: %s %s",
-                    job.id,
-                    response.status_code,
-                    response.text,
-                )
-            response.raise_for_status()
-
-            # ?wait=true の場合、レスポンスにスレッドIDが含まれる
-            if thread_name and not job.discord_thread_id:
-                data = response.json()
-                thread_id = data.get("channel_id")
-                logger.info(
-                    "Discord thread created for job %s: thread_id=%s",
-                    job.id,
-                    thread_id,
-                )
+            url = f"{self._webhook_url}?wait=true"
+
+        response = await self._post(url, payload)
+        if not response.is_success:
+            logger.error(
+                "Discord API error for job %s: %s %s",
+                job.id,
+                response.status_code,
+                response.text,
+            )
+        response.raise_for_status()
+
+        # ?wait=true の場合、レスポンスにスレッドIDが含まれる
+        if thread_name and not job.discord_thread_id:
+            data = response.json()
+            thread_id = data.get("channel_id")
+            logger.info(
+                "Discord thread created for job %s: thread_id=%s",
+                job.id,
+                thread_id,
+            )
 
         logger.info("Discord notification sent for job %s", job.id)
         return thread_id
+
+    async def send_digest(self, jobs: list[Job]) -> None:
+        """複数のジョブの通知を 1 つの埋め込みにまとめて送信する。
+
+        説明文にジョブを 1 行ずつ並べ、収まらない分は件数だけ表示する。
+        ステータスごとの件数はフィールドに出す。
+        フォーラムチャネルの場合は、ダイジェストごとに新しいスレッドを作成する。
+        """
+        counts = Counter(job.status.value for job in jobs)
+        embed = {
+            "title": f"[JobWorker] {len(jobs)} jobs finished",
+            "description": _digest_lines(jobs),
+            "fields": [
+                {"name": status, "value": str(n), "inline": True}
+                for status, n in sorted(counts.items())
+            ],
+        }
+        payload: dict = {"embeds": [embed]}
+        thread_name = os.environ.get("DISCORD_WEBHOOK_THREAD_NAME", "")
+        if thread_name:
+            payload["thread_name"] = f"{thread_name} ({len(jobs)} jobs)"
+
+        response = await self._post(self._webhook_url, payload)
+        if not response.is_success:
+            logger.error(
+                "Discord API error for digest of %d jobs: %s %s",
+                len(jobs),
+                response.status_code,
+                response.text,
+            )
+        response.raise_for_status()
+        logger.info("Discord digest sent for %d jobs", len(jobs))
+
+    async def _post(self, url: str, payload: dict) -> httpx.Response:
+        """レート制限に従って送信する。429 なら待ってから再送し、最後のレスポンスを返す。"""
+        retries = 0
+        while True:
+            await self._rate_limiter.acquire(self._webhook_url)
+            response = None
+            try:
+                async with self._semaphore:
+                    response = await self._client.post(url, json=payload)
+            finally:
+                retry_after = self._rate_limiter.release(self._webhook_url, response)
+            if retry_after is None or retries == self._max_retries:
+                return response
+            retries += 1
+            NOTIFICATION_RATE_LIMITED.inc("DISCORD")
+            logger.warning(
+                "Discord rate limited, retrying in %.2fs (attempt %d/%d)",
+                retry_after,
+                retries,
+                self._max_retries,
+            )
+
+
+def _digest_lines(jobs: list[Job]) -> str:
+    """ダイジェストの説明文。EMBED_DESCRIPTION_LIMIT に収まるだけジョブを並べる。"""
+    lines: list[str] = []
+    length = 0
+    for i, job in enumerate(jobs):
+        line = f"`{job.id}` **{job.status.value}**"
+        if job.result:
+            line += f" - {job.result.message}"
+        after = len(jobs) - i - 1
+        reserve = len(f"\n… and {len(jobs) - i} more") if after else 0
+        if length + len(line) + reserve > EMBED_DESCRIPTION_LIMIT:
+            lines.append(f"… and {len(jobs) - i} more")
+            break
+        lines.append(line)
+        length += len(line) + 1
+    return "\n".join(lines)
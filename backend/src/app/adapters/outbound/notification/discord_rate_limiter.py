@@ -0,0 +1,148 @@
+"""Discord Webhook のレート制限に従って送信を待たせるスケジューラー。
+
+Webhook ごとに 1 つのトークンバケットを持つ。バケットの容量・残数・リセット時刻は
+レスポンスの X-RateLimit-Limit / X-RateLimit-Remaining / X-RateLimit-Reset-After で
+毎回更新し、残数が 0 ならリセットまで次の送信を待たせる。
+
+429 を受けた場合は Retry-After（またはボディの retry_after）の間そのバケットを止める。
+X-RateLimit-Global が付いていれば全 Webhook を止める。
+
+待っている送信は asyncio.Lock の待ち行列に並ぶため、到着順に送られる。
+待つのは送信するコルーチンだけで、ワーカーのジョブ実行は止めない。
+"""
+
+import asyncio
+import os
+import time
+
+import httpx
+
+DISCORD_RATE_LIMIT_DEFAULT = int(os.environ.get("DISCORD_RATE_LIMIT_DEFAULT", "5"))
+"""ヘッダーを受け取るまで仮定するバケットの容量（リセット間隔あたりの送信数）。"""
+DISCORD_RATE_LIMIT_WINDOW_SECONDS = float(
+    os.environ.get("DISCORD_RATE_LIMIT_WINDOW_SECONDS", "2")
+)
+"""ヘッダーを受け取るまで仮定するリセット間隔（秒）。"""
+
+
+class TokenBucket:
+    """1 つの Webhook のレート制限の状態。
+
+    時刻は time.monotonic() の値で持つ（サーバーとの時計のずれの影響を受けない）。
+    ヘッダーの残数は、そのレスポンスより後に届く送信中のリクエスト分を差し引いて使う。
+    """
+
+    def __init__(
+        self,
+        limit: int = DISCORD_RATE_LIMIT_DEFAULT,
+        window: float = DISCORD_RATE_LIMIT_WINDOW_SECONDS,
+    ) -> None:
+        self._limit = limit
+        self._window = window
+        self._remaining = limit
+        self._reset_at = 0.0
+        self._in_flight = 0
+        self._lock = asyncio.Lock()
+        self._updated = asyncio.Event()
+
+    async def acquire(self) -> None:
+        """トークンを 1 つ取る。残っていなければリセット時刻まで待つ。"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now >= self._reset_at:
+                    self._remaining = self._limit
+                    self._reset_at = now + self._window
+                if self._remaining > 0:
+                    self._remaining -= 1
+                    self._in_flight += 1
+                    return
+                # ヘッダーでリセット時刻が早まることがあるため、更新されたら計算し直す
+                self._updated.clear()
+                try:
+                    await asyncio.wait_for(
+                        self._updated.wait(), timeout=self._reset_at - now
+                    )
+                except TimeoutError:
+                    pass
+
+    def release(self, headers: httpx.Headers | None) -> None:
+        """送信が終わったことを記録し、X-RateLimit-* ヘッダーで状態を更新する。
+
+        Args:
+            headers: レスポンスのヘッダー。送信自体が失敗した場合は None。
+        """
+        self._in_flight -= 1
+        self._updated.set()
+        if headers is None:
+            return
+        limit = headers.get("X-RateLimit-Limit")
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset_after = headers.get("X-RateLimit-Reset-After")
+        if limit is not None:
+            self._limit = int(limit)
+        if remaining is not None and reset_after is not None:
+            if int(remaining) == self._limit - 1:
+                # 窓の最初のリクエストなので、Reset-After が窓の長さになる
+                self._window = float(reset_after)
+            self._remaining = max(0, int(remaining) - self._in_flight)
+            self._reset_at = time.monotonic() + float(reset_after)
+
+    def block(self, retry_after: float) -> None:
+        """429 を受けたので、retry_after 秒後まで送信を止める。"""
+        self._remaining = 0
+        self._reset_at = max(self._reset_at, time.monotonic() + retry_after)
+
+
+class DiscordRateLimiter:
+    """Webhook ごとのトークンバケットと、グローバルなレート制限を管理する。
+
+    送信 1 回ごとに acquire() と release() を 1 回ずつ呼ぶ。
+    """
+
+    def __init__(self) -> None:
+        self._buckets: dict[str, TokenBucket] = {}
+        self._global_blocked_until = 0.0
+
+    async def acquire(self, webhook_url: str) -> None:
+        """webhook_url に送信してよくなるまで待ち、トークンを 1 つ取る。"""
+        while (delay := self._global_blocked_until - time.monotonic()) > 0:
+            await asyncio.sleep(delay)
+        await self._bucket(webhook_url).acquire()
+
+    def release(
+        self, webhook_url: str, response: httpx.Response | None
+    ) -> float | None:
+        """送信の結果をバケットに反映する。
+
+        Returns:
+            429 の場合は再送までの待ち時間（秒）、それ以外は None。
+        """
+        bucket = self._bucket(webhook_url)
+        bucket.release(response.headers if response is not None else None)
+        if response is None or response.status_code != 429:
+            return None
+        retry_after = _retry_after(response)
+        if response.headers.get("X-RateLimit-Global"):
+            self._global_blocked_until = time.monotonic() + retry_after
+        else:
+            bucket.block(retry_after)
+        return retry_after
+
+    def _bucket(self, webhook_url: str) -> TokenBucket:
+        """webhook_url のバケットを返す。無ければ作る。"""
+        bucket = self._buckets.get(webhook_url)
+        if bucket is None:
+            bucket = self._buckets[webhook_url] = TokenBucket()
+        return bucket
+
+
+def _retry_after(response: httpx.Response) -> float:
+    """429 のレスポンスから再送までの待ち時間（秒）を読み取る。"""
+    header = response.headers.get("Retry-After")
+    if header is not None:
+        return float(header)
+    try:
+        return float(response.json().get("retry_after", 1.0))
+    except ValueError:
+        return 1.0
@@ -2,14 +2,19 @@
 
 SMTP 経由でジョブの完了・失敗通知を送信する。
 ローカル開発では MailPit を SMTP サーバーとして使用する。
+
+SMTP 接続はメールごとに開かず、プロセスで 1 つの SmtpConnectionPool を共有する
+（create_smtp_pool()。NotificationSenderFactory が作成・クローズする）。
 """
 
 import logging
 import os
+from collections import Counter
 from email.message import EmailMessage
 
-import aiosmtplib
-
+from app.adapters.outbound.notification.smtp_connection_pool import (
+    SmtpConnectionPool,
+)
 from app.domain.models.job import Job
 from app.ports.notification_sender import NotificationSender
 
@@ -21,8 +26,20 @@ EMAIL_FROM = os.environ.get("NOTIFICATION_EMAIL_FROM", "noreply@jobworker.local"
 EMAIL_TO = os.environ.get("NOTIFICATION_EMAIL_TO", "user@jobworker.local")
 
 
+def create_smtp_pool() -> SmtpConnectionPool:
+    """通知メールの送信で共有する SMTP のコネクションプールを作る。"""
+    return SmtpConnectionPool(SMTP_HOST, SMTP_PORT)
+
+
 class EmailNotificationSender(NotificationSender):
-    """SMTP を使った通知送信の実装。"""
+    """SMTP を使った通知送信の実装。
+
+    Args:
+        pool: 共有する SMTP のコネクションプール。クローズは呼び出し側が行う。
+    """
+
+    def __init__(self, pool: SmtpConnectionPool) -> None:
+        self._pool = pool
 
     async def send(self, job: Job) -> str | None:
         """ジョブの状態に基づいて Email 通知を送信する。"""
@@ -31,13 +48,31 @@ class EmailNotificationSender(NotificationSender):
         msg["To"] = EMAIL_TO
         msg["Subject"] = f"[JobWorker] Job {job.id} - {job.status.value}"
 
-        body = f"Job ID: {job.id}\nStatus: {job.status.value}\n"
-        if job.result:
-            body += f"Message: {job.result.message}\n"
-            if job.result.error:
-                body += f"Error: {job.result.error}\n"
-        msg.set_content(body)
+        msg.set_content(_describe(job))
 
-        await aiosmtplib.send(msg, hostname=SMTP_HOST, port=SMTP_PORT)
+        await self._pool.send_message(msg)
         logger.info("Email notification sent for job %s", job.id)
         return None
+
+    async def send_digest(self, jobs: list[Job]) -> None:
+        """複数のジョブの通知を 1 通のメールにまとめて送信する。"""
+        counts = Counter(job.status.value for job in jobs)
+        summary = ", ".join(f"{status} {n}" for status, n in sorted(counts.items()))
+        msg = EmailMessage()
+        msg["From"] = EMAIL_FROM
+        msg["To"] = EMAIL_TO
+        msg["Subject"] = f"[JobWorker] {len(jobs)} jobs finished ({summary})"
+        msg.set_content("\n".join(_describe(job) for job in jobs))
+
+        await self._pool.send_message(msg)
+        logger.info("Email digest sent for %d jobs", len(jobs))
+
+
+def _describe(job: Job) -> str:
+    """メール本文に載せるジョブ 1 件分の内容。"""
+    body = f"Job ID: {job.id}\nStatus: {job.status.value}\n"
+    if job.result:
+        body += f"Message: {job.result.message}\n"
+        if job.result.error:
+            body += f"Error: {job.result.error}\n"
+    return body
@@ -0,0 +1,56 @@
+"""送信時間・失敗回数・スパンを記録する NotificationSender のデコレーター。
+
+NotificationSenderFactory が各チャネルの実装をこのクラスで包むため、
+呼び出し側（ワーカー）は計測を意識せずに send() を呼べる。
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from app.adapters.outbound.metrics.app_metrics import (
+    NOTIFICATION_FAILURES,
+    NOTIFICATION_SEND_SECONDS,
+)
+from app.domain.models.job import Job
+from app.domain.models.notification import NotificationChannel
+from app.ports.notification_sender import NotificationSender
+from app.ports.tracer import get_tracer
+
+
+class InstrumentedNotificationSender(NotificationSender):
+    """別の NotificationSender に送信を委譲し、チャネルごとに計測する。"""
+
+    def __init__(self, inner: NotificationSender, channel: NotificationChannel) -> None:
+        self._inner = inner
+        self._channel = channel.value
+
+    async def send(self, job: Job) -> str | None:
+        """委譲先で送信し、所要時間を記録する。例外は失敗として数えてから再送出する。"""
+        with self._measure("send", job_id=str(job.id)):
+            return await self._inner.send(job)
+
+    async def send_digest(self, jobs: list[Job]) -> None:
+        """委譲先でまとめて送信し、send() と同じく 1 回の送信として記録する。"""
+        with self._measure("send_digest", jobs=len(jobs)):
+            await self._inner.send_digest(jobs)
+
+    @contextmanager
+    def _measure(self, method: str, **attributes: Any) -> Iterator[None]:
+        """委譲先の呼び出し 1 回をスパンにし、所要時間と失敗を記録する。"""
+        start = time.perf_counter()
+        try:
+            with get_tracer().span(
+                f"{type(self._inner).__name__}.{method}",
+                channel=self._channel,
+                **attributes,
+            ):
+                yield
+        except Exception:
+            NOTIFICATION_FAILURES.inc(self._channel)
+            raise
+        finally:
+            NOTIFICATION_SEND_SECONDS.observe(
+                time.perf_counter() - start, self._channel
+            )
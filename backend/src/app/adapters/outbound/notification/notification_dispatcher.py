@@ -0,0 +1,232 @@
+"""ジョブの実行とは別に通知を送るディスパッチャー。
+
+ワーカーは通知を submit() でキューに入れるだけで、送信の完了を待たない。
+SMTP サーバーが遅い・Discord が落ちているといった場合でも、
+ジョブの実行と DB セッションは通知の送信時間の影響を受けない。
+
+    - キューは最大 NOTIFICATION_QUEUE_SIZE 件。溢れた通知は送らずにデッドレターに記録する
+      （submit() は待たないため、キューが詰まってもジョブの処理は止まらない）
+    - NOTIFICATION_WORKERS 個のタスクがキューから取り出して送る
+    - 送信に失敗した通知は指数バックオフ（ジッター付き）で待って再送し、
+      NOTIFICATION_MAX_ATTEMPTS 回失敗したらデッドレターに記録する
+    - 開始通知で作成された Discord のスレッド ID は、on_thread_created で書き戻す
+
+同じジョブの開始通知と終了通知の順序は、submit() の after で保つ。
+終了通知は開始通知の送信が終わるまで待ち、作成されたスレッドに返信する
+（待つのはディスパッチャーのタスクで、ジョブの実行ではない）。
+"""
+
+import asyncio
+import logging
+import os
+import random
+import traceback
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from app.adapters.outbound.metrics.app_metrics import (
+    NOTIFICATION_DEAD_LETTERS,
+    NOTIFICATION_RETRIES,
+)
+from app.adapters.outbound.notification.notification_sender_factory import (
+    NotificationSenderFactory,
+)
+from app.domain.models.job import Job, JobId
+from app.domain.models.notification import NotificationChannel
+from app.ports.notification_dead_letter_store import NotificationDeadLetter
+
+logger = logging.getLogger(__name__)
+
+NOTIFICATION_QUEUE_SIZE = int(os.environ.get("NOTIFICATION_QUEUE_SIZE", "1000"))
+"""送信待ちの通知の最大数。溢れた通知はデッドレターに記録する。"""
+NOTIFICATION_WORKERS = int(os.environ.get("NOTIFICATION_WORKERS", "10"))
+"""通知を送るタスクの数（同時に送信する通知の最大数）。"""
+NOTIFICATION_MAX_ATTEMPTS = int(os.environ.get("NOTIFICATION_MAX_ATTEMPTS", "4"))
+"""1 件の通知の送信を試みる最大回数。すべて失敗したらデッドレターに記録する。"""
+NOTIFICATION_RETRY_BASE_SECONDS = float(
+    os.environ.get("NOTIFICATION_RETRY_BASE_SECONDS", "1")
+)
+"""最初の再送までの待ち時間（秒）。再送ごとに 2 倍になる。"""
+NOTIFICATION_RETRY_MAX_SECONDS = float(
+    os.environ.get("NOTIFICATION_RETRY_MAX_SECONDS", "30")
+)
+"""再送までの待ち時間の上限（秒）。"""
+
+
+@dataclass
+class _Notification:
+    """キューに入っている 1 件の通知。"""
+
+    job: Job
+    after: asyncio.Future[str | None] | None
+    done: asyncio.Future[str | None]
+
+
+class NotificationDispatcher:
+    """通知をキューに溜め、別タスクで再送付きで送る。
+
+    Args:
+        senders: 送信アダプターのファクトリ（start() 済みのもの）。
+        on_thread_created: 開始通知で Discord のスレッドが作成されたときに呼ぶ。
+        on_dead_letter: 送信を諦めた通知を記録する。
+        workers: 通知を送るタスクの数。
+        queue_size: 送信待ちの通知の最大数。
+        max_attempts: 1 件の通知の送信を試みる最大回数。
+        retry_base: 最初の再送までの待ち時間（秒）。
+        retry_max: 再送までの待ち時間の上限（秒）。
+    """
+
+    def __init__(
+        self,
+        senders: NotificationSenderFactory,
+        on_thread_created: Callable[[JobId, str], Awaitable[None]],
+        on_dead_letter: Callable[[NotificationDeadLetter], Awaitable[None]],
+        workers: int = NOTIFICATION_WORKERS,
+        queue_size: int = NOTIFICATION_QUEUE_SIZE,
+        max_attempts: int = NOTIFICATION_MAX_ATTEMPTS,
+        retry_base: float = NOTIFICATION_RETRY_BASE_SECONDS,
+        retry_max: float = NOTIFICATION_RETRY_MAX_SECONDS,
+    ) -> None:
+        self._senders = senders
+        self._on_thread_created = on_thread_created
+        self._on_dead_letter = on_dead_letter
+        self._worker_count = workers
+        self._queue: asyncio.Queue[_Notification] = asyncio.Queue(queue_size)
+        self._max_attempts = max_attempts
+        self._retry_base = retry_base
+        self._retry_max = retry_max
+        self._workers: list[asyncio.Task] = []
+        self._in_flight = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """送信待ち（送信中を含む）の通知の数。"""
+        return self._queue.qsize() + self._in_flight
+
+    def start(self) -> None:
+        """通知を送るタスクを起動する。"""
+        self._workers = [
+            asyncio.create_task(self._work()) for _ in range(self._worker_count)
+        ]
+
+    async def stop(self, grace: float) -> None:
+        """キューに残っている通知を最大 grace 秒送り、残りは捨てて止める。"""
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=grace)
+        except TimeoutError:
+            logger.warning("Dropping %d unsent notifications", self.queue_depth)
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def submit(
+        self, job: Job, after: asyncio.Future[str | None] | None = None
+    ) -> asyncio.Future[str | None]:
+        """job の現在の状態の通知をキューに入れる。送信は待たない。
+
+        Args:
+            job: 通知するジョブ（以降、呼び出し側で変更しないこと）。
+            after: 先に送る同じジョブの通知（submit() の戻り値）。
+                その送信が終わってから送り、作成されたスレッドに返信する。
+
+        Returns:
+            送信が終わると完了する Future。結果は作成された Discord のスレッド ID
+            （無い場合や、送れずにデッドレターに記録した場合は None）。
+        """
+        done: asyncio.Future[str | None] = asyncio.get_running_loop().create_future()
+        if job.notification_channel == NotificationChannel.NONE:
+            done.set_result(None)
+            return done
+        try:
+            self._queue.put_nowait(_Notification(job, after, done))
+        except asyncio.QueueFull:
+            done.set_result(None)
+            await self._dead_letter(job, 0, "notification queue is full")
+        return done
+
+    async def _work(self) -> None:
+        """キューから通知を取り出して送り続ける。"""
+        while True:
+            notification = await self._queue.get()
+            self._in_flight += 1
+            try:
+                await self._deliver(notification)
+            except Exception:
+                logger.error(
+                    "Failed to dispatch notification for job %s: %s",
+                    notification.job.id,
+                    traceback.format_exc(),
+                )
+            finally:
+                if not notification.done.done():
+                    notification.done.set_result(None)
+                self._in_flight -= 1
+                self._queue.task_done()
+
+    async def _deliver(self, notification: _Notification) -> None:
+        """先行する通知を待ってから送り、スレッド ID を書き戻す。"""
+        job = notification.job
+        if notification.after is not None:
+            thread_id = await asyncio.shield(notification.after)
+            if thread_id and not job.discord_thread_id:
+                job.discord_thread_id = thread_id
+
+        thread_id = await self._send_with_retry(job)
+        notification.done.set_result(thread_id)
+        if thread_id and not job.discord_thread_id:
+            await self._on_thread_created(job.id, thread_id)
+
+    async def _send_with_retry(self, job: Job) -> str | None:
+        """送信し、失敗したらバックオフして再送する。すべて失敗したらデッドレターに記録する。"""
+        channel = job.notification_channel
+        for attempt in range(1, self._max_attempts + 1):
+            try:
+                return await self._senders.create(channel).send(job)
+            except Exception:
+                error = traceback.format_exc()
+            if attempt == self._max_attempts:
+                break
+            delay = min(self._retry_max, self._retry_base * 2 ** (attempt - 1))
+            delay *= random.uniform(0.5, 1.0)
+            NOTIFICATION_RETRIES.inc(channel.value)
+            logger.warning(
+                "Failed to send %s notification for job %s, retrying in %.1fs "
+                "(attempt %d/%d)",
+                job.status.value,
+                job.id,
+                delay,
+                attempt,
+                self._max_attempts,
+            )
+            await asyncio.sleep(delay)
+        await self._dead_letter(job, self._max_attempts, error)
+        return None
+
+    async def _dead_letter(self, job: Job, attempts: int, error: str) -> None:
+        """送れなかった通知をデッドレターに記録する。記録の失敗はログに残す。"""
+        NOTIFICATION_DEAD_LETTERS.inc(job.notification_channel.value)
+        logger.error(
+            "Giving up %s notification for job %s after %d attempts: %s",
+            job.status.value,
+            job.id,
+            attempts,
+            error,
+        )
+        letter = NotificationDeadLetter(
+            job_id=job.id,
+            channel=job.notification_channel,
+            job_status=job.status,
+            attempts=attempts,
+            error=error,
+            failed_at=datetime.now(timezone.utc),
+        )
+        try:
+            await self._on_dead_letter(letter)
+        except Exception:
+            logger.error(
+                "Failed to store dead letter for job %s: %s",
+                job.id,
+                traceback.format_exc(),
+            )
@@ -1,29 +1,91 @@
 """通知アダプターのファクトリ。
 
 NotificationChannel の値に基づいて適切な NotificationSender 実装を返す。
+実際に送信するチャネルの実装は InstrumentedNotificationSender で包み、
+送信時間と失敗回数をチャネルごとに記録する。
+NOTIFICATION_DIGEST_CHANNELS に含まれるチャネルは、さらに DigestNotificationSender で包み、
+終了通知をまとめて送る。
+
+送信アダプターは呼び出しごとに作らず、start() で 1 つずつ作って使い回す。
+Discord の HTTP クライアントと SMTP のコネクションプールもここで作り、stop() で閉じる。
+ファクトリはワーカーのライフサイクル（worker.serve()）が所有する。
 """
 
+import httpx
+
+from app.adapters.outbound.notification.digest_notification_sender import (
+    NOTIFICATION_DIGEST_CHANNELS,
+    DigestNotificationSender,
+)
 from app.adapters.outbound.notification.discord_notification_sender import (
     DiscordNotificationSender,
+    create_discord_http_client,
 )
 from app.adapters.outbound.notification.email_notification_sender import (
     EmailNotificationSender,
+    create_smtp_pool,
+)
+from app.adapters.outbound.notification.instrumented_notification_sender import (
+    InstrumentedNotificationSender,
 )
 from app.adapters.outbound.notification.null_notification_sender import (
     NullNotificationSender,
 )
+from app.adapters.outbound.notification.smtp_connection_pool import (
+    SmtpConnectionPool,
+)
 from app.domain.models.notification import NotificationChannel
 from app.ports.notification_sender import NotificationSender
 
 
 class NotificationSenderFactory:
-    """NotificationChannel に基づいて NotificationSender を生成するファクトリ。"""
-
-    @staticmethod
-    def create(channel: NotificationChannel) -> NotificationSender:
-        """指定されたチャネルに対応する NotificationSender を返す。"""
-        if channel == NotificationChannel.EMAIL:
-            return EmailNotificationSender()
-        if channel == NotificationChannel.DISCORD:
-            return DiscordNotificationSender()
-        return NullNotificationSender()
+    """NotificationChannel に基づいて NotificationSender を返すファクトリ。"""
+
+    def __init__(self) -> None:
+        self._http_client: httpx.AsyncClient | None = None
+        self._smtp_pool: SmtpConnectionPool | None = None
+        self._senders: dict[NotificationChannel, NotificationSender] = {}
+        self._digests: list[DigestNotificationSender] = []
+        self._null_sender = NullNotificationSender()
+
+    def start(self) -> None:
+        """共有する接続（HTTP クライアント・SMTP プール）と各チャネルの送信アダプターを作る。"""
+        self._http_client = create_discord_http_client()
+        self._smtp_pool = create_smtp_pool()
+        senders: dict[NotificationChannel, NotificationSender] = {
+            NotificationChannel.EMAIL: EmailNotificationSender(self._smtp_pool),
+            NotificationChannel.DISCORD: DiscordNotificationSender(self._http_client),
+        }
+        for channel, inner in senders.items():
+            sender: NotificationSender = InstrumentedNotificationSender(inner, channel)
+            if channel.value in NOTIFICATION_DIGEST_CHANNELS:
+                digest = DigestNotificationSender(sender)
+                self._digests.append(digest)
+                sender = digest
+            self._senders[channel] = sender
+
+    async def stop(self) -> None:
+        """溜まっているダイジェストを送ってから、共有する接続を閉じる。"""
+        self._senders = {}
+        for digest in self._digests:
+            await digest.close()
+        self._digests = []
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        if self._smtp_pool is not None:
+            await self._smtp_pool.close()
+            self._smtp_pool = None
+
+    def create(self, channel: NotificationChannel) -> NotificationSender:
+        """指定されたチャネルに対応する NotificationSender を返す。
+
+        Raises:
+            RuntimeError: start() の前、または stop() の後に呼ばれた場合。
+        """
+        if channel == NotificationChannel.NONE:
+            return self._null_sender
+        sender = self._senders.get(channel)
+        if sender is None:
+            raise RuntimeError("NotificationSenderFactory is not started")
+        return sender
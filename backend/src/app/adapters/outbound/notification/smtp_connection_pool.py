@@ -0,0 +1,138 @@
+"""SMTP のコネクションプール。
+
+メールごとに接続・EHLO・STARTTLS・切断を繰り返さないよう、
+少数の SMTP 接続を保持して 1 つの接続で複数のメールを送る。
+EmailNotificationSender がプロセスで 1 つのプールを共有する
+（NotificationSenderFactory が作成・クローズする）。
+
+接続の管理:
+    - 同時に使う接続は最大 size 本（空きが無ければ送信は待つ）
+    - 最後に使ってから check_idle 秒以上経った接続は、使う前に NOOP で確認する
+    - 送信時にサーバーから切断されていた場合は、新しい接続で 1 回だけ送り直す
+    - 1 つの接続で max_messages 通送ったら QUIT して作り直す（サーバー側の上限対策）
+    - 送信に失敗した接続は再利用せずに閉じる
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from email.message import EmailMessage
+
+import aiosmtplib
+
+SMTP_POOL_SIZE = int(os.environ.get("SMTP_POOL_SIZE", "3"))
+"""プールが保持する SMTP 接続の最大数（同時に送信できるメールの数）。"""
+SMTP_POOL_CHECK_IDLE_SECONDS = float(
+    os.environ.get("SMTP_POOL_CHECK_IDLE_SECONDS", "30")
+)
+"""この時間（秒）以上使われていない接続は、使う前に NOOP で生きているか確認する。"""
+SMTP_POOL_MAX_MESSAGES = int(os.environ.get("SMTP_POOL_MAX_MESSAGES", "100"))
+"""1 つの接続で送るメールの最大数。"""
+SMTP_TIMEOUT_SECONDS = float(os.environ.get("SMTP_TIMEOUT_SECONDS", "10"))
+"""SMTP の接続・各コマンドのタイムアウト（秒）。"""
+
+
+@dataclass
+class _PooledConnection:
+    """プールが保持する 1 本の SMTP 接続。"""
+
+    smtp: aiosmtplib.SMTP
+    messages: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class SmtpConnectionPool:
+    """SMTP 接続を使い回してメールを送るプール。
+
+    Args:
+        hostname: SMTP サーバーのホスト名。
+        port: SMTP サーバーのポート。
+        size: 同時に使う接続の最大数。
+        check_idle: 使う前に NOOP で確認するまでの未使用時間（秒）。
+        max_messages: 1 つの接続で送るメールの最大数。
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        size: int = SMTP_POOL_SIZE,
+        check_idle: float = SMTP_POOL_CHECK_IDLE_SECONDS,
+        max_messages: int = SMTP_POOL_MAX_MESSAGES,
+    ) -> None:
+        self._hostname = hostname
+        self._port = port
+        self._check_idle = check_idle
+        self._max_messages = max_messages
+        self._slots = asyncio.Semaphore(size)
+        # 最後に使った接続から使う（使われない接続は放置され、次に使うときに確認される）
+        self._idle: list[_PooledConnection] = []
+
+    async def send_message(self, message: EmailMessage) -> None:
+        """プールの接続でメールを 1 通送る。"""
+        async with self._slots:
+            conn = await self._checkout()
+            try:
+                await self._send_on(conn, message)
+            except aiosmtplib.SMTPServerDisconnected:
+                # 使っていない間にサーバーが切断していた。新しい接続で 1 回だけ送り直す
+                conn = await self._connect()
+                await self._send_on(conn, message)
+            await self._checkin(conn)
+
+    async def close(self) -> None:
+        """保持している接続をすべて QUIT して閉じる。"""
+        idle, self._idle = self._idle, []
+        await asyncio.gather(*(self._quit(conn) for conn in idle))
+
+    async def _checkout(self) -> _PooledConnection:
+        """空いている接続を取り出す。無ければ新しく接続する。
+
+        しばらく使っていない接続は NOOP で確認し、応答が無ければ捨てる。
+        """
+        while self._idle:
+            conn = self._idle.pop()
+            if not conn.smtp.is_connected:
+                continue
+            if time.monotonic() - conn.last_used < self._check_idle:
+                return conn
+            try:
+                await conn.smtp.noop()
+                return conn
+            except (aiosmtplib.SMTPException, OSError):
+                conn.smtp.close()
+        return await self._connect()
+
+    async def _checkin(self, conn: _PooledConnection) -> None:
+        """使い終わった接続をプールに戻す。上限まで送った接続は閉じる。"""
+        if conn.messages >= self._max_messages:
+            await self._quit(conn)
+        else:
+            self._idle.append(conn)
+
+    async def _connect(self) -> _PooledConnection:
+        """新しい SMTP 接続を開く（サーバーが対応していれば STARTTLS する）。"""
+        smtp = aiosmtplib.SMTP(
+            hostname=self._hostname, port=self._port, timeout=SMTP_TIMEOUT_SECONDS
+        )
+        await smtp.connect()
+        return _PooledConnection(smtp)
+
+    async def _send_on(self, conn: _PooledConnection, message: EmailMessage) -> None:
+        """conn でメールを送る。失敗した接続は閉じてから例外を再送出する。"""
+        try:
+            await conn.smtp.send_message(message)
+        except Exception:
+            conn.smtp.close()
+            raise
+        conn.messages += 1
+        conn.last_used = time.monotonic()
+
+    @staticmethod
+    async def _quit(conn: _PooledConnection) -> None:
+        """接続を QUIT で閉じる。応答が無ければそのまま切断する。"""
+        try:
+            await conn.smtp.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            conn.smtp.close()
@@ -0,0 +1,226 @@
+"""プロセス内メモリによるジョブリポジトリの実装。
+
+JobRepository ポートの具象クラス（ADAPTER_MODE=memory 用）。
+外部 I/O を一切行わないため、ドメイン層・ユースケース層そのものの
+オーバーヘッドの計測や、DB を置けない環境での単一プロセス実行に使う。
+
+データ構造:
+    InMemoryJobStore がプロセス全体で 1 つだけジョブを保持する。
+        - ID → Job の辞書（find_by_id は O(1)）
+        - (created_at, id) の昇順に並んだインデックス（bisect で挿入・範囲検索）
+    一覧・エクスポートはインデックスを末尾から（降順に）たどり、
+    作成日時の範囲は二分探索で絞ってから走査する。
+
+トランザクション:
+    InMemorySession が PostgreSQL のセッションに相当する。
+    InMemoryEventPublisher が書き込んだイベントはセッションに溜まり、
+    save() / add_all() の成功時（commit）に配信され、競合時（rollback）に捨てられる。
+    ストアの操作は await を挟まないため、asyncio の単一スレッド上ではアトミックに行われる。
+"""
+
+import heapq
+from bisect import bisect_left, insort
+from collections import Counter
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from dataclasses import replace
+from datetime import datetime, timezone
+
+from app.domain.events.job_events import DomainEvent
+from app.domain.exceptions import ConcurrencyConflictError
+from app.domain.models.job import Job, JobId, JobStatus
+from app.ports.repository import (
+    JobCursor,
+    JobFilter,
+    JobPage,
+    JobQuery,
+    JobRepository,
+)
+from app.ports.tracer import traced
+
+IndexKey = tuple[datetime, str]
+"""作成日時インデックスのキー（created_at, ジョブ ID の文字列）。"""
+
+
+class InMemoryJobStore:
+    """プロセス全体で共有するジョブの保存先。
+
+    保持する Job は呼び出し側と共有しないコピーで、
+    読み出し時にもコピーを返す（呼び出し側の変更が保存前に見えないように）。
+    """
+
+    def __init__(self) -> None:
+        self.jobs: dict[str, Job] = {}
+        self.index: list[IndexKey] = []
+
+    def get(self, job_id: JobId) -> Job | None:
+        """保存されているジョブのコピーを返す。"""
+        job = self.jobs.get(str(job_id))
+        return replace(job, events=[]) if job is not None else None
+
+    def put(self, job: Job) -> None:
+        """ジョブのコピーを保存する。新規ならインデックスにも追加する。"""
+        key = str(job.id)
+        if key not in self.jobs:
+            insort(self.index, (job.created_at, key))
+        self.jobs[key] = replace(job, events=[])
+
+    def scan(self, job_filter: JobFilter, before: IndexKey | None) -> Iterator[Job]:
+        """条件に合うジョブを (created_at, id) の降順に返す。
+
+        before を指定すると、そのキーより前（降順で後ろ）のジョブから始める。
+        """
+        hi = len(self.index) if before is None else bisect_left(self.index, before)
+        if job_filter.created_to is not None:
+            hi = min(hi, bisect_left(self.index, (_aware(job_filter.created_to),)))
+        lo = 0
+        if job_filter.created_from is not None:
+            lo = bisect_left(self.index, (_aware(job_filter.created_from),))
+        statuses = job_filter.statuses
+        channels = job_filter.notification_channels
+        for i in range(hi - 1, lo - 1, -1):
+            job = self.jobs[self.index[i][1]]
+            if statuses and job.status not in statuses:
+                continue
+            if channels and job.notification_channel not in channels:
+                continue
+            yield job
+
+
+class InMemorySession:
+    """InMemoryJobStore に対する 1 つの作業単位（PostgreSQL のセッションに相当）。
+
+    Attributes:
+        store: 保存先。
+        pending_events: commit 時に配信するドメインイベント。
+    """
+
+    def __init__(
+        self,
+        store: InMemoryJobStore,
+        on_commit: Callable[[list[DomainEvent]], Awaitable[None]],
+    ) -> None:
+        self.store = store
+        self.pending_events: list[DomainEvent] = []
+        self._on_commit = on_commit
+
+    async def commit(self) -> None:
+        """溜まったイベントを配信する。"""
+        events, self.pending_events = self.pending_events, []
+        if events:
+            await self._on_commit(events)
+
+    def rollback(self) -> None:
+        """溜まったイベントを捨てる。"""
+        self.pending_events = []
+
+
+class InMemoryJobRepository(JobRepository):
+    """InMemoryJobStore を使った JobRepository の実装。"""
+
+    def __init__(self, session: InMemorySession) -> None:
+        self._session = session
+        self._store = session.store
+
+    @traced
+    async def save(self, job: Job) -> None:
+        """ジョブを保存する。保存済みの version と一致しなければ競合として扱う。
+
+        job の discord_thread_id が None なら、保存済みの値を残す。
+        """
+        stored = self._store.jobs.get(str(job.id))
+        current_version = stored.version if stored is not None else 0
+        if current_version != job.version:
+            self._session.rollback()
+            raise ConcurrencyConflictError(str(job.id), job.version)
+        if stored is not None and job.discord_thread_id is None:
+            job.discord_thread_id = stored.discord_thread_id
+        job.version += 1
+        self._store.put(job)
+        await self._session.commit()
+
+    @traced
+    async def set_discord_thread_id(self, job_id: JobId, thread_id: str) -> None:
+        """保存済みのジョブにスレッド ID が無ければ記録する（version は変えない）。"""
+        stored = self._store.jobs.get(str(job_id))
+        if stored is not None and stored.discord_thread_id is None:
+            stored.discord_thread_id = thread_id
+
+    @traced
+    async def add_all(self, jobs: list[Job]) -> None:
+        """新規ジョブをまとめて保存し、1 回だけ commit する。"""
+        for job in jobs:
+            job.version = 1
+            self._store.put(job)
+        await self._session.commit()
+
+    @traced
+    async def find_by_id(self, job_id: JobId) -> Job | None:
+        """指定された ID のジョブを取得する。見つからなければ None。"""
+        return self._store.get(job_id)
+
+    @traced
+    async def find_by_ids(self, job_ids: list[JobId]) -> list[Job]:
+        """指定された ID のジョブをまとめて取得する。"""
+        jobs = (self._store.get(job_id) for job_id in job_ids)
+        return [job for job in jobs if job is not None]
+
+    @traced
+    async def find_page(self, query: JobQuery) -> JobPage:
+        """条件に合うジョブを (created_at, id) の降順で 1 ページ分取得する。
+
+        インデックス上で前のページの末尾の位置を二分探索し、そこから読み進める。
+        """
+        before = None
+        if query.after is not None:
+            before = (_aware(query.after.created_at), str(query.after.job_id))
+        jobs: list[Job] = []
+        has_more = False
+        for job in self._store.scan(query.job_filter, before):
+            if len(jobs) == query.limit:
+                has_more = True
+                break
+            jobs.append(replace(job, events=[]))
+        next_cursor = None
+        if has_more:
+            last = jobs[-1]
+            next_cursor = JobCursor(created_at=last.created_at, job_id=last.id)
+        return JobPage(jobs=jobs, next_cursor=next_cursor)
+
+    @traced
+    async def find_scheduled(self, due_before: datetime, limit: int) -> list[Job]:
+        """予定時刻が due_before より前の SCHEDULED のジョブを、予定時刻の昇順で取得する。
+
+        予定時刻のインデックスは持たず、全ジョブを走査する。
+        """
+        due_before = _aware(due_before)
+        jobs = [
+            job
+            for job in self._store.jobs.values()
+            if job.status == JobStatus.SCHEDULED and job.run_at < due_before
+        ]
+        due = heapq.nsmallest(limit, jobs, key=lambda job: job.run_at)
+        return [replace(job, events=[]) for job in due]
+
+    @traced
+    async def count_by_status(self) -> dict[JobStatus, int]:
+        """ステータスごとのジョブ数を数える。"""
+        return dict(Counter(job.status for job in self._store.jobs.values()))
+
+    async def stream(self, job_filter: JobFilter) -> AsyncIterator[Job]:
+        """条件に合う全ジョブを (created_at, id) の降順で 1 件ずつ返す。
+
+        位置（インデックスのキー）を覚えて読み進めるため、
+        読み出し中にジョブが追加されても走査は崩れない。
+        """
+        before = None
+        while True:
+            job = next(self._store.scan(job_filter, before), None)
+            if job is None:
+                return
+            before = (job.created_at, str(job.id))
+            yield replace(job, events=[])
+
+
+def _aware(value: datetime) -> datetime:
+    """タイムゾーンの無い日時を UTC とみなす（保存されている日時は UTC 付き）。"""
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
@@ -0,0 +1,21 @@
+"""プロセス内メモリによるデッドレターの保存先の実装（ADAPTER_MODE=memory 用）。"""
+
+from app.ports.notification_dead_letter_store import (
+    NotificationDeadLetter,
+    NotificationDeadLetterStore,
+)
+
+
+class InMemoryNotificationDeadLetterStore(NotificationDeadLetterStore):
+    """リストに追記する NotificationDeadLetterStore の実装。
+
+    Args:
+        letters: 保存先のリスト（プロセス全体で共有する）。
+    """
+
+    def __init__(self, letters: list[NotificationDeadLetter]) -> None:
+        self._letters = letters
+
+    async def add(self, letter: NotificationDeadLetter) -> None:
+        """デッドレターをリストに追加する。"""
+        self._letters.append(letter)
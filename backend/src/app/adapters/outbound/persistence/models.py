@@ -1,13 +1,14 @@
 """SQLAlchemy テーブルモデル定義。
 
-PostgreSQL の jobs テーブルに対応する ORM モデル。
+PostgreSQL の jobs テーブル・event_outbox テーブル・notification_dead_letters テーブルに
+対応する ORM モデル。
 ドメインモデル（Job 集約）とは独立しており、
 PostgresJobRepository 内でドメインモデルとの変換を行う。
 """
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, Integer, String, Text
+from sqlalchemy import BigInteger, DateTime, Identity, Index, Integer, String, Text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -32,9 +33,31 @@ class JobRow(Base):
         completed_at: 完了（失敗・キャンセル含む）日時。
         result_message: 実行結果メッセージ。
         result_error: エラー情報（失敗時のみ）。
+        discord_thread_id: 開始通知で作成された Discord のスレッド ID。
+        priority: 優先度（HIGH, NORMAL, LOW）。
+        submitter: 投入者。
+        run_at: 実行予定時刻（指定されたジョブのみ）。
+        version: 楽観的並行性制御のバージョン。更新ごとに 1 増える。
+
+    インデックス:
+        一覧 API のキーセットページネーション（(created_at, id) の降順）用に、
+        絞り込み条件ごとの複合インデックスを持つ。
+        ワーカーのスケジューラーが予定時刻の近い SCHEDULED のジョブだけを
+        範囲検索できるよう、(status, run_at) のインデックスも持つ。
     """
 
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_created_at_id", "created_at", "id"),
+        Index("ix_jobs_status_created_at_id", "status", "created_at", "id"),
+        Index(
+            "ix_jobs_notification_channel_created_at_id",
+            "notification_channel",
+            "created_at",
+            "id",
+        ),
+        Index("ix_jobs_status_run_at", "status", "run_at"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     status: Mapped[str] = mapped_column(String(20), nullable=False)
@@ -54,3 +77,72 @@ class JobRow(Base):
     result_message: Mapped[str | None] = mapped_column(Text, nullable=True)
     result_error: Mapped[str | None] = mapped_column(Text, nullable=True)
     discord_thread_id: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    priority: Mapped[str] = mapped_column(
+        String(10), nullable=False, server_default="NORMAL"
+    )
+    submitter: Mapped[str] = mapped_column(
+        String(100), nullable=False, server_default="default"
+    )
+    run_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default="1")
+
+
+class OutboxRow(Base):
+    """event_outbox テーブルの ORM モデル（トランザクショナルアウトボックス）。
+
+    ドメインイベントを jobs の更新と同じトランザクションで書き込み、
+    アウトボックスリレー（app.outbox_relay）が Redis に配信した後に削除する。
+
+    Attributes:
+        id: 書き込み順の連番。リレーはこの順に配信する。
+        event_type: イベント種別名（JobCreated 等）。
+        job_id: 対象のジョブ ID（UUID 文字列）。
+        occurred_at: イベントの発生日時。
+        trace_parent: 書き込んだ処理のトレースコンテキスト（W3C traceparent）。
+        priority: JobCreated の優先度（他のイベントでは NULL）。
+        submitter: JobCreated の投入者（他のイベントでは NULL）。
+        run_at: JobScheduled の実行予定時刻（他のイベントでは NULL）。
+    """
+
+    __tablename__ = "event_outbox"
+
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    event_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    job_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    occurred_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    trace_parent: Mapped[str | None] = mapped_column(String(55), nullable=True)
+    priority: Mapped[str | None] = mapped_column(String(10), nullable=True)
+    submitter: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    run_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+
+class NotificationDeadLetterRow(Base):
+    """notification_dead_letters テーブルの ORM モデル。
+
+    再送しても送信できなかった通知を記録する（PostgresNotificationDeadLetterStore）。
+
+    Attributes:
+        id: 書き込み順の連番。
+        job_id: 通知の対象のジョブ ID（UUID 文字列）。
+        channel: 通知チャネル（EMAIL, DISCORD）。
+        job_status: 通知したジョブのステータス。
+        attempts: 送信を試みた回数。
+        error: 最後の送信で発生したエラー。
+        failed_at: 送信を諦めた日時。
+    """
+
+    __tablename__ = "notification_dead_letters"
+
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    job_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
+    channel: Mapped[str] = mapped_column(String(20), nullable=False)
+    job_status: Mapped[str] = mapped_column(String(20), nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False)
+    error: Mapped[str] = mapped_column(Text, nullable=False)
+    failed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -3,12 +3,21 @@
 JobRepository ポートの具象クラス。
 SQLAlchemy の async セッションを使用して PostgreSQL にアクセスし、
 ORM モデル（JobRow）とドメインモデル（Job）の変換を行う。
+
+書き込みは ORM の Unit of Work を経由せず、INSERT ... ON CONFLICT 等の
+1 文で行う（保存前の SELECT は不要）。そのため読み出しは常に
+populate_existing で DB の値を取り直し、セッション内の古い JobRow を使わない。
 """
 
-from sqlalchemy import select
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from sqlalchemy import Select, func, insert, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.outbound.persistence.models import JobRow
+from app.domain.exceptions import ConcurrencyConflictError
 from app.domain.models.job import (
     Job,
     JobId,
@@ -17,7 +26,28 @@ from app.domain.models.job import (
     JobType,
 )
 from app.domain.models.notification import NotificationChannel
-from app.ports.repository import JobRepository
+from app.domain.models.priority import JobPriority
+from app.ports.repository import (
+    JobCursor,
+    JobFilter,
+    JobPage,
+    JobQuery,
+    JobRepository,
+)
+from app.ports.tracer import traced
+
+STREAM_FETCH_SIZE = 500
+"""stream() がサーバーサイドカーソルから 1 回に取り出す行数。"""
+
+MUTABLE_COLUMNS = (
+    "status",
+    "started_at",
+    "completed_at",
+    "result_message",
+    "result_error",
+    "discord_thread_id",
+)
+"""作成後に変わりうるカラム。既存行の保存ではこれらだけを更新する。"""
 
 
 class PostgresJobRepository(JobRepository):
@@ -30,46 +60,191 @@ class PostgresJobRepository(JobRepository):
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
+    @traced
     async def save(self, job: Job) -> None:
-        """ジョブを保存する。既存なら UPDATE、新規なら INSERT を行う。"""
-        row = await self._session.get(JobRow, str(job.id))
-        if row is None:
-            row = JobRow(
-                id=str(job.id),
-                status=job.status.value,
-                duration_seconds=job.job_type.duration_seconds,
-                notification_channel=job.notification_channel.value,
-                created_at=job.created_at,
-                started_at=job.started_at,
-                completed_at=job.completed_at,
-                result_message=job.result.message if job.result else None,
-                result_error=job.result.error if job.result else None,
-                discord_thread_id=job.discord_thread_id,
-            )
-            self._session.add(row)
-        else:
-            row.status = job.status.value
-            row.started_at = job.started_at
-            row.completed_at = job.completed_at
-            row.result_message = job.result.message if job.result else None
-            row.result_error = job.result.error if job.result else None
-            row.discord_thread_id = job.discord_thread_id
+        """ジョブを保存する。既存なら UPDATE、新規なら INSERT を行う。
+
+        INSERT ... ON CONFLICT (id) DO UPDATE ... WHERE version = :v の 1 文で行う
+        compare-and-set。既存行では MUTABLE_COLUMNS だけを更新し、version を 1 進める。
+        discord_thread_id は set_discord_thread_id() が version を進めずに書き込むため、
+        job 側が None なら DB の値を残す。
+        読み込み後に他の処理が更新していた（version が一致しない）場合は、
+        同じトランザクションで書き込んだもの（アウトボックス等）ごと
+        ロールバックして ConcurrencyConflictError をスローする。
+        行ロックは取らない。
+        """
+        stmt = pg_insert(JobRow).values(
+            **self._to_row_values(job), version=job.version + 1
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[JobRow.id],
+            set_={
+                **{column: stmt.excluded[column] for column in MUTABLE_COLUMNS},
+                "discord_thread_id": func.coalesce(
+                    stmt.excluded.discord_thread_id, JobRow.discord_thread_id
+                ),
+                "version": JobRow.version + 1,
+            },
+            where=JobRow.version == job.version,
+        ).returning(JobRow.version)
+        version = (await self._session.execute(stmt)).scalar_one_or_none()
+        if version is None:
+            await self._session.rollback()
+            raise ConcurrencyConflictError(str(job.id), job.version)
         await self._session.commit()
+        job.version = version
 
+    @traced
+    async def set_discord_thread_id(self, job_id: JobId, thread_id: str) -> None:
+        """discord_thread_id が NULL の行だけを UPDATE する（version は変えない）。"""
+        await self._session.execute(
+            update(JobRow)
+            .where(JobRow.id == str(job_id), JobRow.discord_thread_id.is_(None))
+            .values(discord_thread_id=thread_id)
+        )
+        await self._session.commit()
+
+    @traced
+    async def add_all(self, jobs: list[Job]) -> None:
+        """新規ジョブをまとめて INSERT し、1 回だけ commit する。
+
+        ORM の Unit of Work を経由せず、複数行の INSERT 文
+        （SQLAlchemy の insertmanyvalues）でまとめて送る。
+        """
+        if not jobs:
+            return
+        await self._session.execute(
+            insert(JobRow), [{**self._to_row_values(job), "version": 1} for job in jobs]
+        )
+        await self._session.commit()
+        for job in jobs:
+            job.version = 1
+
+    @traced
     async def find_by_id(self, job_id: JobId) -> Job | None:
         """指定された ID のジョブを取得する。見つからなければ None。"""
-        row = await self._session.get(JobRow, str(job_id))
+        row = await self._session.get(JobRow, str(job_id), populate_existing=True)
         if row is None:
             return None
         return self._to_domain(row)
 
-    async def find_all(self) -> list[Job]:
-        """全ジョブを作成日時の降順で取得する。"""
+    @traced
+    async def find_by_ids(self, job_ids: list[JobId]) -> list[Job]:
+        """指定された ID のジョブを 1 回のクエリでまとめて取得する。"""
+        if not job_ids:
+            return []
         result = await self._session.execute(
-            select(JobRow).order_by(JobRow.created_at.desc())
+            select(JobRow)
+            .where(JobRow.id.in_([str(job_id) for job_id in job_ids]))
+            .execution_options(populate_existing=True)
         )
         return [self._to_domain(row) for row in result.scalars().all()]
 
+    @traced
+    async def find_page(self, query: JobQuery) -> JobPage:
+        """条件に合うジョブを (created_at, id) の降順で 1 ページ分取得する。
+
+        OFFSET は使わず、前のページの末尾より後の行を複合インデックスで
+        直接たどる（キーセットページネーション）。ページが深くなっても
+        読み飛ばす行は増えない。次のページの有無は limit + 1 件目で判定する。
+        """
+        stmt = self._filtered(query.job_filter)
+        if query.after is not None:
+            stmt = stmt.where(
+                tuple_(JobRow.created_at, JobRow.id)
+                < tuple_(query.after.created_at, str(query.after.job_id))
+            )
+        stmt = stmt.order_by(JobRow.created_at.desc(), JobRow.id.desc()).limit(
+            query.limit + 1
+        )
+        rows = (await self._session.execute(stmt)).scalars().all()
+
+        jobs = [self._to_domain(row) for row in rows[: query.limit]]
+        next_cursor = None
+        if len(rows) > query.limit:
+            last = jobs[-1]
+            next_cursor = JobCursor(created_at=last.created_at, job_id=last.id)
+        return JobPage(jobs=jobs, next_cursor=next_cursor)
+
+    @traced
+    async def find_scheduled(self, due_before: datetime, limit: int) -> list[Job]:
+        """予定時刻が due_before より前の SCHEDULED のジョブを、予定時刻の昇順で取得する。
+
+        (status, run_at) のインデックスを範囲検索するため、先の予定のジョブが
+        どれだけあっても読む行は limit 件まで。
+        """
+        result = await self._session.execute(
+            select(JobRow)
+            .where(
+                JobRow.status == JobStatus.SCHEDULED.value,
+                JobRow.run_at < due_before,
+            )
+            .order_by(JobRow.run_at)
+            .limit(limit)
+            .execution_options(populate_existing=True)
+        )
+        return [self._to_domain(row) for row in result.scalars().all()]
+
+    @traced
+    async def count_by_status(self) -> dict[JobStatus, int]:
+        """ステータスごとのジョブ数を GROUP BY で数える（status のインデックスを使う）。"""
+        result = await self._session.execute(
+            select(JobRow.status, func.count()).group_by(JobRow.status)
+        )
+        return {JobStatus(status): count for status, count in result.all()}
+
+    async def stream(self, job_filter: JobFilter) -> AsyncIterator[Job]:
+        """条件に合う全ジョブを (created_at, id) の降順で 1 件ずつ返す。
+
+        サーバーサイドカーソル（session.stream）から STREAM_FETCH_SIZE 行ずつ
+        取り出すため、件数が増えてもメモリ使用量は一定に保たれる。
+        """
+        stmt = (
+            self._filtered(job_filter)
+            .order_by(JobRow.created_at.desc(), JobRow.id.desc())
+            .execution_options(yield_per=STREAM_FETCH_SIZE)
+        )
+        result = await self._session.stream_scalars(stmt)
+        async for row in result:
+            yield self._to_domain(row)
+
+    @staticmethod
+    def _filtered(job_filter: JobFilter) -> Select[tuple[JobRow]]:
+        """絞り込み条件を WHERE 句に載せた SELECT 文を返す。"""
+        stmt = select(JobRow).execution_options(populate_existing=True)
+        if job_filter.statuses:
+            stmt = stmt.where(JobRow.status.in_([s.value for s in job_filter.statuses]))
+        if job_filter.notification_channels:
+            stmt = stmt.where(
+                JobRow.notification_channel.in_(
+                    [c.value for c in job_filter.notification_channels]
+                )
+            )
+        if job_filter.created_from is not None:
+            stmt = stmt.where(JobRow.created_at >= job_filter.created_from)
+        if job_filter.created_to is not None:
+            stmt = stmt.where(JobRow.created_at < job_filter.created_to)
+        return stmt
+
+    @staticmethod
+    def _to_row_values(job: Job) -> dict:
+        """ドメインモデル（Job）を jobs テーブルのカラム値に変換する。"""
+        return {
+            "id": str(job.id),
+            "status": job.status.value,
+            "duration_seconds": job.job_type.duration_seconds,
+            "notification_channel": job.notification_channel.value,
+            "created_at": job.created_at,
+            "started_at": job.started_at,
+            "completed_at": job.completed_at,
+            "result_message": job.result.message if job.result else None,
+            "result_error": job.result.error if job.result else None,
+            "discord_thread_id": job.discord_thread_id,
+            "priority": job.priority.value,
+            "submitter": job.submitter,
+            "run_at": job.run_at,
+        }
+
     @staticmethod
     def _to_domain(row: JobRow) -> Job:
         """ORM モデル（JobRow）をドメインモデル（Job）に変換する。"""
@@ -86,4 +261,8 @@ class PostgresJobRepository(JobRepository):
             completed_at=row.completed_at,
             result=result,
             discord_thread_id=row.discord_thread_id,
+            priority=JobPriority(row.priority),
+            submitter=row.submitter,
+            run_at=row.run_at,
+            version=row.version,
         )
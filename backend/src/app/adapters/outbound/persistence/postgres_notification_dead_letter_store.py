@@ -0,0 +1,35 @@
+"""PostgreSQL によるデッドレターの保存先の実装。
+
+NotificationDeadLetterStore ポートの具象クラス。
+notification_dead_letters テーブルに 1 行ずつ INSERT する。
+"""
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.outbound.persistence.models import NotificationDeadLetterRow
+from app.ports.notification_dead_letter_store import (
+    NotificationDeadLetter,
+    NotificationDeadLetterStore,
+)
+
+
+class PostgresNotificationDeadLetterStore(NotificationDeadLetterStore):
+    """PostgreSQL を使った NotificationDeadLetterStore の実装。"""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def add(self, letter: NotificationDeadLetter) -> None:
+        """デッドレターを INSERT して commit する。"""
+        await self._session.execute(
+            insert(NotificationDeadLetterRow).values(
+                job_id=str(letter.job_id),
+                channel=letter.channel.value,
+                job_status=letter.job_status.value,
+                attempts=letter.attempts,
+                error=letter.error,
+                failed_at=letter.failed_at,
+            )
+        )
+        await self._session.commit()
@@ -0,0 +1,70 @@
+"""スパンを JSON Lines 形式でファイルに書き出す Tracer の実装。
+
+Tracer ポートの具象クラス。外部のトレーシング基盤を使わずに、
+1 スパン 1 行の JSON をローカルファイルに追記する。
+API・ワーカー・リレーが同じファイルに書けば、trace_id で
+プロセスをまたいだ 1 つのジョブの流れを追える。
+
+書き込みはファイルのバッファに溜め、このプロセスで最も外側のスパン
+（リクエストやジョブ 1 件の処理）が終わったときと close() のときにまとめてフラッシュする。
+
+TRACE_FILE が設定されている場合のみ、configure_tracing() がこの実装を有効にする。
+"""
+
+import json
+import os
+
+from app.ports.tracer import Span, Tracer, current_traceparent, set_tracer
+
+TRACE_FILE = os.environ.get("TRACE_FILE", "")
+"""スパンを書き出すファイルのパス。空ならトレーシングは無効（NoopTracer）。"""
+
+
+class JsonLinesTracer(Tracer):
+    """スパンを JSON Lines 形式で追記する Tracer。
+
+    出力形式（1 行 1 スパン）:
+        {"trace_id": "...", "span_id": "...", "parent_id": "...", "name": "...",
+         "service": "api", "start_time": 1700000000.123, "duration_ms": 1.234,
+         "attributes": {...}, "error": null}
+    """
+
+    def __init__(self, path: str, service: str) -> None:
+        self._file = open(path, "a", encoding="utf-8")
+        self._service = service
+
+    def export(self, span: Span) -> None:
+        """スパンを 1 行の JSON としてバッファに書く。"""
+        self._file.write(
+            json.dumps(
+                {
+                    "trace_id": span.trace_id,
+                    "span_id": span.span_id,
+                    "parent_id": span.parent_id,
+                    "name": span.name,
+                    "service": self._service,
+                    "start_time": span.start_time,
+                    "duration_ms": round(span.duration * 1000, 3),
+                    "attributes": span.attributes,
+                    "error": span.error,
+                },
+                default=str,
+            )
+            + "\n"
+        )
+        if current_traceparent() is None:
+            self._file.flush()
+
+    def close(self) -> None:
+        """バッファをフラッシュしてファイルを閉じる。"""
+        self._file.close()
+
+
+def configure_tracing(service: str) -> None:
+    """TRACE_FILE が設定されていれば、JsonLinesTracer をプロセスの Tracer にする。
+
+    Args:
+        service: スパンに記録するプロセス名（api / worker / relay）。
+    """
+    if TRACE_FILE:
+        set_tracer(JsonLinesTracer(TRACE_FILE, service))
@@ -8,10 +8,12 @@ Job 集約の状態遷移時に発行されるイベントを定義する。
 from __future__ import annotations
 
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import NewType
 
+from app.domain.models.priority import DEFAULT_SUBMITTER, JobPriority
+
 JobId = NewType("JobId", uuid.UUID)
 
 
@@ -22,10 +24,13 @@ class DomainEvent:
     Attributes:
         job_id: イベントの対象となるジョブの識別子。
         timestamp: イベントが発生した日時（UTC）。
+        trace_parent: イベントを発行した処理のトレースコンテキスト（W3C traceparent）。
+            プロセスをまたいでトレースをつなぐためのメタデータで、ドメインの判断には使わない。
     """
 
     job_id: JobId
     timestamp: datetime
+    trace_parent: str | None = field(default=None, compare=False)
 
     @property
     def event_type(self) -> str:
@@ -33,11 +38,32 @@ class DomainEvent:
         return self.__class__.__name__
 
 
+@dataclass(frozen=True)
+class JobScheduled(DomainEvent):
+    """実行予定時刻付きのジョブが作成され、SCHEDULED 状態になったときに発行される。
+
+    Attributes:
+        run_at: 実行予定時刻（UTC）。ワーカーのスケジューラーはこの時刻に PENDING にする。
+    """
+
+    run_at: datetime | None = None
+
+
 @dataclass(frozen=True)
 class JobCreated(DomainEvent):
-    """ジョブが作成され、PENDING 状態になったときに発行される。"""
+    """ジョブが実行待ち（PENDING 状態）になったときに発行される。
 
-    pass
+    作成時のほか、予定時刻になり SCHEDULED から PENDING になったときにも発行される
+    （どちらの場合も 1 つのジョブにつき 1 回だけ）。ジョブキューはこのイベントでジョブを受け取る。
+    ワーカーがジョブを読み込む前に実行順を決められるよう、優先度と投入者を載せる。
+
+    Attributes:
+        priority: ジョブの優先度。
+        submitter: ジョブの投入者（同じ優先度の中で公平に順番を回す単位）。
+    """
+
+    priority: JobPriority = JobPriority.NORMAL
+    submitter: str = DEFAULT_SUBMITTER
 
 
 @dataclass(frozen=True)
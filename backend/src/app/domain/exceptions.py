@@ -35,6 +35,25 @@ class InvalidStatusTransitionError(DomainError):
         super().__init__(f"Cannot transition from {current.value} to {target.value}")
 
 
+class ConcurrencyConflictError(DomainError):
+    """読み込んだ後に他の処理がジョブを更新しており、保存できなかった場合にスローされる。
+
+    楽観的並行性制御（version による compare-and-set）の競合を表す。
+    呼び出し側は最新の状態を読み直して判断し直す。
+
+    Attributes:
+        job_id: 競合したジョブの ID 文字列。
+        expected_version: 読み込み時のバージョン。
+    """
+
+    def __init__(self, job_id: str, expected_version: int) -> None:
+        self.job_id = job_id
+        self.expected_version = expected_version
+        super().__init__(
+            f"Job {job_id} was modified concurrently (expected version {expected_version})"
+        )
+
+
 class JobNotFoundError(DomainError):
     """指定された JobId に対応するジョブが存在しない場合にスローされる。
 
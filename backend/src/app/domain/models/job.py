@@ -18,10 +18,12 @@ from app.domain.events.job_events import (
     JobCompleted,
     JobCreated,
     JobFailed,
+    JobScheduled,
     JobStarted,
 )
 from app.domain.exceptions import InvalidStatusTransitionError
 from app.domain.models.notification import NotificationChannel
+from app.domain.models.priority import DEFAULT_SUBMITTER, JobPriority
 
 # --- 値オブジェクト（Value Objects） ---
 
@@ -36,11 +38,13 @@ class JobStatus(Enum):
     許可されない遷移を試みると InvalidStatusTransitionError をスローする。
 
     状態遷移図:
+        SCHEDULED → PENDING | CANCELLED
         PENDING  → RUNNING | CANCELLED
         RUNNING  → COMPLETED | FAILED | CANCELLED
         COMPLETED, FAILED, CANCELLED → （遷移不可）
     """
 
+    SCHEDULED = "SCHEDULED"
     PENDING = "PENDING"
     RUNNING = "RUNNING"
     COMPLETED = "COMPLETED"
@@ -53,6 +57,7 @@ class JobStatus(Enum):
     def _get_allowed_transitions() -> dict[JobStatus, set[JobStatus]]:
         """許可される状態遷移の定義を返す。"""
         return {
+            JobStatus.SCHEDULED: {JobStatus.PENDING, JobStatus.CANCELLED},
             JobStatus.PENDING: {JobStatus.RUNNING, JobStatus.CANCELLED},
             JobStatus.RUNNING: {
                 JobStatus.COMPLETED,
@@ -117,18 +122,22 @@ class Job:
     遷移時にドメインイベントを発行する。
 
     外部からジョブの状態を変更するには、必ずこの集約のメソッド
-    （start, complete, fail, cancel）を通す必要がある。
+    （release, start, complete, fail, cancel）を通す必要がある。
 
     Attributes:
         id: ジョブの一意識別子。
         status: 現在のステータス。
         job_type: ジョブの種別（実行秒数）。
         notification_channel: 通知チャネル（NONE / EMAIL / DISCORD）。
+        priority: 優先度（HIGH / NORMAL / LOW）。
+        submitter: 投入者。同じ優先度のジョブは投入者ごとに順番に実行される。
+        run_at: 実行予定時刻。指定されたジョブはこの時刻まで SCHEDULED で待つ。
         discord_thread_id: Discord フォーラムスレッドID（開始通知で作成されたスレッドへの返信に使用）。
         created_at: ジョブの作成日時。
         started_at: ジョブの実行開始日時。
         completed_at: ジョブの完了（または失敗・キャンセル）日時。
         result: ジョブの実行結果。
+        version: 楽観的並行性制御のバージョン。未保存なら 0、保存ごとに 1 増える。
         events: 未配信のドメインイベントリスト。
     """
 
@@ -141,29 +150,49 @@ class Job:
     completed_at: datetime | None = None
     result: JobResult | None = None
     discord_thread_id: str | None = None
+    priority: JobPriority = JobPriority.NORMAL
+    submitter: str = DEFAULT_SUBMITTER
+    run_at: datetime | None = None
+    version: int = 0
     events: list[DomainEvent] = field(default_factory=list, repr=False)
 
     @staticmethod
     def create(
         job_type: JobType,
         notification_channel: NotificationChannel = NotificationChannel.NONE,
+        priority: JobPriority = JobPriority.NORMAL,
+        submitter: str = DEFAULT_SUBMITTER,
+        run_at: datetime | None = None,
     ) -> Job:
         """新しいジョブを作成する（ファクトリメソッド）。
 
-        PENDING 状態で生成され、JobCreated イベントが発行される。
+        run_at が未来の日時なら SCHEDULED 状態で生成され、JobScheduled イベントが発行される。
+        それ以外（未指定・過去の日時）は PENDING 状態で生成され、JobCreated イベントが発行される。
         """
         job_id = JobId(uuid.uuid4())
         now = datetime.now(timezone.utc)
+        scheduled = run_at is not None and run_at > now
         job = Job(
             id=job_id,
-            status=JobStatus.PENDING,
+            status=JobStatus.SCHEDULED if scheduled else JobStatus.PENDING,
             job_type=job_type,
             notification_channel=notification_channel,
             created_at=now,
+            priority=priority,
+            submitter=submitter,
+            run_at=run_at,
         )
-        job.events.append(JobCreated(job_id=job_id, timestamp=now))
+        if scheduled:
+            job.events.append(JobScheduled(job_id=job_id, timestamp=now, run_at=run_at))
+        else:
+            job.events.append(job._created_event(now))
         return job
 
+    def release(self) -> None:
+        """予定時刻になったジョブを実行待ちにする。SCHEDULED → PENDING に遷移し、JobCreated を発行する。"""
+        self.status = self.status.transition_to(JobStatus.PENDING)
+        self.events.append(self._created_event(datetime.now(timezone.utc)))
+
     def start(self) -> None:
         """ジョブの実行を開始する。PENDING → RUNNING に遷移し、JobStarted を発行する。"""
         self.status = self.status.transition_to(JobStatus.RUNNING)
@@ -185,11 +214,20 @@ class Job:
         self.events.append(JobFailed(job_id=self.id, timestamp=self.completed_at))
 
     def cancel(self) -> None:
-        """ジョブをキャンセルする。PENDING/RUNNING → CANCELLED に遷移し、JobCancelled を発行する。"""
+        """ジョブをキャンセルする。SCHEDULED/PENDING/RUNNING → CANCELLED に遷移し、JobCancelled を発行する。"""
         self.status = self.status.transition_to(JobStatus.CANCELLED)
         self.completed_at = datetime.now(timezone.utc)
         self.events.append(JobCancelled(job_id=self.id, timestamp=self.completed_at))
 
+    def _created_event(self, timestamp: datetime) -> JobCreated:
+        """ジョブキューに載せる JobCreated を作る。"""
+        return JobCreated(
+            job_id=self.id,
+            timestamp=timestamp,
+            priority=self.priority,
+            submitter=self.submitter,
+        )
+
     def collect_events(self) -> list[DomainEvent]:
         """未配信のドメインイベントを取り出す。取り出し後、内部リストはクリアされる。"""
         events = self.events.copy()
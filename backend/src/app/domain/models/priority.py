@@ -0,0 +1,21 @@
+"""ジョブの優先度の値オブジェクト定義。
+
+ワーカーが実行待ちのジョブから次に実行するものを選ぶときに使う。
+優先度ごとの配分の重みはワーカー側（FairJobBuffer）が決め、ドメインは順序だけを持つ。
+"""
+
+from enum import Enum
+
+DEFAULT_SUBMITTER = "default"
+"""投入者が指定されなかったジョブの投入者名。"""
+
+
+class JobPriority(Enum):
+    """ジョブの優先度を表す列挙型。
+
+    HIGH は対話的な短いジョブ、LOW は大量に投入されるバッチジョブを想定する。
+    """
+
+    HIGH = "HIGH"
+    NORMAL = "NORMAL"
+    LOW = "LOW"
@@ -1,12 +1,21 @@
 """FastAPI アプリケーションのエントリーポイント。
 
 起動時に以下を行う:
-    - PostgreSQL に jobs テーブルを作成する（存在しない場合）
+    - PostgreSQL にテーブルを作成し、既存のテーブルに不足しているカラム・インデックスを追加する
     - Redis クライアントを初期化し、app.state に保持する
+    - SSE 配信ハブ（Redis の購読 1 本）を起動する
+    - TRACE_FILE が設定されていれば、スパンをファイルに書き出す Tracer を有効にする
 
 終了時に以下を行う:
+    - SSE 配信ハブを停止する
     - Redis 接続をクローズする
     - DB エンジンを破棄する
+    - Tracer のバッファを書き出す
+
+ADAPTER_MODE=memory の場合は PostgreSQL・Redis に接続せず、
+SSE 配信ハブはプロセス内のイベントバスを購読する。
+ワーカーも別プロセスではなく、このプロセス内のタスクとして起動する
+（API 1 プロセスだけでジョブの作成から完了まで動く）。
 
 ルーターの登録順序に注意:
     SSE ルーター（/api/jobs/stream）を先に登録し、
@@ -14,35 +23,108 @@
     逆にすると /stream が {job_id} パラメータにマッチしてしまう。
 """
 
+import asyncio
 import os
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
 from contextlib import asynccontextmanager
 
 import redis.asyncio as aioredis
 from fastapi import FastAPI
+from sqlalchemy import Connection, inspect
+from sqlalchemy.schema import CreateColumn
 
+from app.adapters.inbound.events.event_source import EventSource
+from app.adapters.inbound.events.in_memory_event_source import InMemoryEventSource
+from app.adapters.inbound.events.redis_event_source import RedisEventSource
+from app.adapters.inbound.queue.in_memory_job_queue import InMemoryJobQueue
+from app.adapters.inbound.sse.event_hub import EventHub
+from app.adapters.outbound.job_storage import ADAPTER_MODE, memory_bus
+from app.adapters.outbound.metrics.app_metrics import SSE_CLIENTS
+from app.adapters.outbound.metrics.registry import REGISTRY
 from app.adapters.outbound.persistence.database import engine
 from app.adapters.outbound.persistence.models import Base
+from app.adapters.outbound.tracing.jsonl_tracer import configure_tracing
+from app.ports.tracer import get_tracer
+from app.worker import create_dispatcher, serve
 
 REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379")
+SSE_CLIENT_QUEUE_SIZE = int(os.environ.get("SSE_CLIENT_QUEUE_SIZE", "256"))
+
+
+def _upgrade_schema(conn: Connection) -> None:
+    """既存のテーブルに、後から追加されたカラムとインデックスを作成する。
+
+    create_all は既存テーブルを変更しないため、個別に確認する。
+    追加するカラムは NULL 可、または server_default を持つ必要がある。
+    """
+    inspector = inspect(conn)
+    for table in Base.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing:
+                ddl = CreateColumn(column).compile(dialect=conn.dialect)
+                conn.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {ddl}")
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """アプリケーションのライフサイクル管理。起動・終了時の初期化・後片付けを行う。"""
+    configure_tracing("api")
+    if ADAPTER_MODE == "memory":
+        async with _embedded_worker():
+            await _start_event_hub(app, InMemoryEventSource(memory_bus))
+            yield
+            await app.state.event_hub.stop()
+        get_tracer().close()
+        return
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_upgrade_schema)
     app.state.redis = aioredis.from_url(REDIS_URL)
+    await _start_event_hub(app, RedisEventSource(app.state.redis))
     yield
+    await app.state.event_hub.stop()
     await app.state.redis.aclose()
     await engine.dispose()
+    get_tracer().close()
+
+
+async def _start_event_hub(app: FastAPI, source: EventSource) -> None:
+    """source を購読する SSE 配信ハブを起動し、app.state に保持する。"""
+    app.state.event_hub = EventHub(source, SSE_CLIENT_QUEUE_SIZE)
+    await app.state.event_hub.start()
+    REGISTRY.add_collector(lambda: SSE_CLIENTS.set(app.state.event_hub.client_count))
+
+
+@asynccontextmanager
+async def _embedded_worker() -> AsyncIterator[None]:
+    """ADAPTER_MODE=memory 用に、ワーカーをこのプロセス内のタスクとして動かす。
+
+    抜けるときは新しいジョブの取り出しをやめ、実行中のジョブの終了を待つ。
+    """
+    queue = InMemoryJobQueue(memory_bus)
+    dispatcher = create_dispatcher(queue)
+    task = asyncio.create_task(serve(dispatcher, InMemoryEventSource(memory_bus)))
+    try:
+        yield
+    finally:
+        dispatcher.stop()
+        await task
+        await queue.close()
 
 
 app = FastAPI(title="Job Worker", lifespan=lifespan)
 
 from app.adapters.inbound.api.job_router import router as job_router  # noqa: E402
+from app.adapters.inbound.api.metrics_router import (  # noqa: E402
+    router as metrics_router,
+)
 from app.adapters.inbound.sse.job_sse import router as sse_router  # noqa: E402
 
 # SSE ルーターを先に登録する（/stream が /{job_id} より優先されるように）
 app.include_router(sse_router)
 app.include_router(job_router)
+app.include_router(metrics_router)
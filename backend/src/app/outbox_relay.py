@@ -0,0 +1,112 @@
+"""アウトボックスリレープロセス。
+
+API・ワーカーとは独立したプロセスとして動作し、
+event_outbox テーブルに確定したドメインイベントを Redis に配信する。
+
+起動コマンド: python -m app.outbox_relay
+
+処理フロー:
+    1. アウトボックスから最大 OUTBOX_BATCH_SIZE 件を取り出す（FOR UPDATE SKIP LOCKED）
+    2. RedisEventPublisher でまとめて配信する（パイプライン）
+    3. 配信した行を削除して commit する
+    4. 行が残っていれば続けて取り出し、無ければ NOTIFY を待つ
+       （NOTIFY を取りこぼした場合に備え、OUTBOX_POLL_INTERVAL_SECONDS ごとにも確認する）
+
+配信と削除の間にリレーが落ちた場合、そのイベントは再配信される（at-least-once）。
+
+METRICS_PORT が 0 以外の場合、そのポートで GET /metrics（Prometheus 形式）に応答する。
+"""
+
+import asyncio
+import logging
+import os
+import signal
+import traceback
+
+import redis.asyncio as aioredis
+
+from app.adapters.inbound.metrics.metrics_http_server import start_metrics_server
+from app.adapters.outbound.messaging.outbox_event_publisher import (
+    OUTBOX_CHANNEL,
+    drain_outbox,
+)
+from app.adapters.outbound.messaging.redis_event_publisher import RedisEventPublisher
+from app.adapters.outbound.persistence.database import async_session, engine
+from app.adapters.outbound.tracing.jsonl_tracer import configure_tracing
+from app.ports.tracer import get_tracer
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [outbox-relay] %(message)s")
+logger = logging.getLogger(__name__)
+
+REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379")
+OUTBOX_BATCH_SIZE = int(os.environ.get("OUTBOX_BATCH_SIZE", "500"))
+OUTBOX_POLL_INTERVAL_SECONDS = float(
+    os.environ.get("OUTBOX_POLL_INTERVAL_SECONDS", "1")
+)
+METRICS_PORT = int(os.environ.get("METRICS_PORT", "9101"))
+"""メトリクスを公開するポート。0 なら公開しない。"""
+OUTBOX_RETRY_DELAY_SECONDS = 1.0
+"""配信に失敗したとき、再試行するまでの待ち時間（秒）。"""
+
+
+async def relay(publisher: RedisEventPublisher, wakeup: asyncio.Event) -> None:
+    """アウトボックスが空になるまで配信し、空になったら wakeup か一定時間を待つ。"""
+    while True:
+        wakeup.clear()
+        try:
+            async with async_session() as session:
+                relayed = await drain_outbox(session, publisher, OUTBOX_BATCH_SIZE)
+        except Exception:
+            logger.error("Failed to relay outbox: %s", traceback.format_exc())
+            await asyncio.sleep(OUTBOX_RETRY_DELAY_SECONDS)
+            continue
+        if relayed:
+            logger.info("Relayed %d event(s)", relayed)
+        if relayed >= OUTBOX_BATCH_SIZE:
+            continue
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout=OUTBOX_POLL_INTERVAL_SECONDS)
+        except TimeoutError:
+            pass
+
+
+async def main() -> None:
+    """リレーのメインループ。
+
+    PostgreSQL の LISTEN 用に接続を 1 本保持し、アウトボックスへの書き込み
+    （NOTIFY）を受けたら即座に配信する。SIGTERM / SIGINT で終了する。
+    """
+    logger.info("Outbox relay starting, connecting to Redis at %s", REDIS_URL)
+    configure_tracing("relay")
+    redis_client = aioredis.from_url(REDIS_URL)
+    publisher = RedisEventPublisher(redis_client)
+    wakeup = asyncio.Event()
+
+    listen_conn = await engine.connect()
+    raw_conn = await listen_conn.get_raw_connection()
+    await raw_conn.driver_connection.add_listener(
+        OUTBOX_CHANNEL, lambda *_: wakeup.set()
+    )
+
+    metrics_server = await start_metrics_server(METRICS_PORT) if METRICS_PORT else None
+    task = asyncio.create_task(relay(publisher, wakeup))
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, task.cancel)
+    logger.info("Relaying outbox (batch=%d)...", OUTBOX_BATCH_SIZE)
+
+    try:
+        await task
+    except asyncio.CancelledError:
+        logger.info("Outbox relay stopped")
+    finally:
+        if metrics_server is not None:
+            metrics_server.close()
+        await listen_conn.close()
+        await redis_client.aclose()
+        await engine.dispose()
+        get_tracer().close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -17,9 +17,20 @@ class EventPublisher(ABC):
 
     ユースケース層はこのインターフェースを通じてイベントを配信し、
     具体的なメッセージング技術（Redis Pub/Sub 等）には依存しない。
+
+    実装によっては、イベントはリポジトリの保存と同じトランザクションで確定する
+    （OutboxEventPublisher）。そのためユースケースは save() の前に publish() する。
     """
 
     @abstractmethod
     async def publish(self, event: DomainEvent) -> None:
         """ドメインイベントを配信する。"""
         ...
+
+    async def publish_all(self, events: list[DomainEvent]) -> None:
+        """複数のドメインイベントを順に配信する。
+
+        既定では publish() を 1 件ずつ呼ぶ。まとめて送れる実装は上書きする。
+        """
+        for event in events:
+            await self.publish(event)
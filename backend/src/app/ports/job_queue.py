@@ -0,0 +1,71 @@
+"""ジョブキューのポート定義。
+
+ヘキサゴナルアーキテクチャにおけるプライマリポート（入力側）。
+ワーカーが実行すべきジョブを受け取るためのインターフェースを定義する。
+具体的な実装（Redis Streams のコンシューマグループ等）はアダプター層で提供される。
+
+配信の保証:
+    receive() で受け取ったジョブは ack() されるまで「処理中」として扱われる。
+    ack されないまま一定時間が経過した配信（ワーカーのクラッシュ等）は、
+    別のワーカーに再配信される（at-least-once）。
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from app.domain.models.job import JobId
+from app.domain.models.priority import DEFAULT_SUBMITTER, JobPriority
+
+
+@dataclass(frozen=True)
+class JobDelivery:
+    """キューから受け取ったジョブ 1 件分の配信。
+
+    Attributes:
+        job_id: 実行対象のジョブ ID。
+        delivery_id: キュー実装固有の配信識別子（ack に使用する）。
+        redelivered: 他のワーカーから引き継いだ再配信であれば True。
+        trace_parent: ジョブを作成した処理のトレースコンテキスト（W3C traceparent）。
+        priority: ジョブの優先度（ワーカーが実行順を決めるのに使う）。
+        submitter: ジョブの投入者（同じ優先度の中で公平に順番を回す単位）。
+    """
+
+    job_id: JobId
+    delivery_id: str
+    redelivered: bool = False
+    trace_parent: str | None = None
+    priority: JobPriority = JobPriority.NORMAL
+    submitter: str = DEFAULT_SUBMITTER
+
+
+class JobQueue(ABC):
+    """ワーカーへのジョブ配信を担う抽象キュー。
+
+    ワーカーはこのインターフェースを通じてジョブを受け取り、
+    具体的なメッセージング技術（Redis Streams、Pub/Sub 等）には依存しない。
+    """
+
+    @abstractmethod
+    async def receive(self, max_count: int) -> list[JobDelivery]:
+        """最大 max_count 件のジョブを受け取る。
+
+        ジョブが無い場合は一定時間ブロックした後、空リストを返す。
+        """
+        ...
+
+    @abstractmethod
+    async def ack(self, delivery: JobDelivery) -> None:
+        """ジョブの処理完了を通知し、キューから取り除く。"""
+        ...
+
+    @abstractmethod
+    async def extend(self, deliveries: list[JobDelivery]) -> None:
+        """処理中の配信の所有権を延長し、他のワーカーへの再配信を防ぐ。"""
+        ...
+
+    @abstractmethod
+    async def close(self) -> None:
+        """キューとの接続を閉じる。"""
+        ...
@@ -0,0 +1,45 @@
+"""送信できなかった通知（デッドレター）の保存先のポート定義。
+
+ヘキサゴナルアーキテクチャにおけるセカンダリポート（出力側）。
+再送しても送信できなかった通知を、後から調査・再送できるように記録する。
+具体的な実装（PostgreSQL、プロセス内メモリ）はアダプター層で提供される。
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.domain.models.job import JobId, JobStatus
+from app.domain.models.notification import NotificationChannel
+
+
+@dataclass(frozen=True)
+class NotificationDeadLetter:
+    """送信できなかった 1 件の通知。
+
+    Attributes:
+        job_id: 通知の対象のジョブ ID。
+        channel: 通知チャネル。
+        job_status: 通知したジョブのステータス（どの通知だったか）。
+        attempts: 送信を試みた回数。
+        error: 最後の送信で発生したエラー。
+        failed_at: 送信を諦めた日時。
+    """
+
+    job_id: JobId
+    channel: NotificationChannel
+    job_status: JobStatus
+    attempts: int
+    error: str
+    failed_at: datetime
+
+
+class NotificationDeadLetterStore(ABC):
+    """デッドレターの保存を担う抽象ポート。"""
+
+    @abstractmethod
+    async def add(self, letter: NotificationDeadLetter) -> None:
+        """デッドレターを 1 件保存する。"""
+        ...
@@ -27,3 +27,11 @@ class NotificationSender(ABC):
             通知先のスレッドIDなど、後続通知に必要な識別子。不要な場合は None。
         """
         ...
+
+    async def send_digest(self, jobs: list[Job]) -> None:
+        """複数のジョブの通知を 1 つにまとめて送信する（ダイジェスト）。
+
+        まとめた形式を持たない実装では、1 件ずつ send() する。
+        """
+        for job in jobs:
+            await self.send(job)
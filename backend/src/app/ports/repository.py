@@ -8,8 +8,68 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from datetime import datetime
 
-from app.domain.models.job import Job, JobId
+from app.domain.models.job import Job, JobId, JobStatus
+from app.domain.models.notification import NotificationChannel
+
+
+@dataclass(frozen=True)
+class JobCursor:
+    """ページの境界となるジョブの位置（キーセットページネーション用）。
+
+    一覧は (created_at, id) の降順に並び、次のページはこの位置より後から始まる。
+    """
+
+    created_at: datetime
+    job_id: JobId
+
+
+@dataclass(frozen=True)
+class JobFilter:
+    """ジョブの絞り込み条件。
+
+    Attributes:
+        statuses: 対象のステータス。空なら全ステータス。
+        notification_channels: 対象の通知チャネル。空なら全チャネル。
+        created_from: この日時以降に作成されたジョブのみ（含む）。
+        created_to: この日時より前に作成されたジョブのみ（含まない）。
+    """
+
+    statuses: frozenset[JobStatus] = frozenset()
+    notification_channels: frozenset[NotificationChannel] = frozenset()
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+
+
+@dataclass(frozen=True)
+class JobQuery:
+    """ジョブ一覧の絞り込み条件とページ指定。
+
+    Attributes:
+        limit: 1 ページの最大件数。
+        after: 前のページの末尾。None なら先頭ページ。
+        job_filter: 絞り込み条件。
+    """
+
+    limit: int
+    after: JobCursor | None = None
+    job_filter: JobFilter = field(default_factory=JobFilter)
+
+
+@dataclass(frozen=True)
+class JobPage:
+    """ジョブ一覧の 1 ページ分。
+
+    Attributes:
+        jobs: 作成日時の降順に並んだジョブ。
+        next_cursor: 次のページの開始位置。最後のページなら None。
+    """
+
+    jobs: list[Job]
+    next_cursor: JobCursor | None
 
 
 class JobRepository(ABC):
@@ -21,7 +81,28 @@ class JobRepository(ABC):
 
     @abstractmethod
     async def save(self, job: Job) -> None:
-        """ジョブを保存する。新規の場合は INSERT、既存の場合は UPDATE を行う。"""
+        """ジョブを保存する。新規の場合は INSERT、既存の場合は UPDATE を行う。
+
+        読み込み時（job.version）から他の処理が更新していれば保存せず、
+        ConcurrencyConflictError をスローする。保存に成功すると job.version が進む。
+        """
+        ...
+
+    @abstractmethod
+    async def set_discord_thread_id(self, job_id: JobId, thread_id: str) -> None:
+        """まだスレッド ID を持たないジョブに、Discord のスレッド ID を記録する。
+
+        通知の送信結果を後から書き戻すためのもので、version は進めない
+        （ジョブの状態遷移の save() と競合させない）。既に値があれば何もしない。
+        """
+        ...
+
+    @abstractmethod
+    async def add_all(self, jobs: list[Job]) -> None:
+        """新規ジョブをまとめて 1 トランザクションで INSERT する。
+
+        保存に成功すると各 job.version が進む。
+        """
         ...
 
     @abstractmethod
@@ -30,6 +111,29 @@ class JobRepository(ABC):
         ...
 
     @abstractmethod
-    async def find_all(self) -> list[Job]:
-        """全ジョブを作成日時の降順で取得する。"""
+    async def find_by_ids(self, job_ids: list[JobId]) -> list[Job]:
+        """指定された ID のジョブをまとめて取得する。見つからない ID は結果に含まれない。"""
+        ...
+
+    @abstractmethod
+    async def find_page(self, query: JobQuery) -> JobPage:
+        """条件に合うジョブを作成日時の降順で 1 ページ分取得する。"""
+        ...
+
+    @abstractmethod
+    async def find_scheduled(self, due_before: datetime, limit: int) -> list[Job]:
+        """予定時刻が due_before より前の SCHEDULED のジョブを、予定時刻の昇順で最大 limit 件取得する。"""
+        ...
+
+    @abstractmethod
+    async def count_by_status(self) -> dict[JobStatus, int]:
+        """ステータスごとのジョブ数を返す。ジョブが無いステータスは含まれない。"""
+        ...
+
+    @abstractmethod
+    def stream(self, job_filter: JobFilter) -> AsyncIterator[Job]:
+        """条件に合う全ジョブを作成日時の降順で 1 件ずつ返す。
+
+        全件をメモリに載せずに読み進めるため、エクスポート等の大量読み出しに使う。
+        """
         ...
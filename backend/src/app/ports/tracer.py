@@ -0,0 +1,180 @@
+"""トレーシング（処理時間の内訳の計測）のポート定義。
+
+ヘキサゴナルアーキテクチャにおけるセカンダリポート（出力側）。
+ユースケース・アダプターは span() / @traced で処理を区間（スパン）に分け、
+どこに時間がかかっているか（例: save と publish の比率）を記録する。
+記録したスパンの出力先はアダプター層の Tracer 実装で決まる。
+
+既定は NoopTracer で、スパンの生成も出力も行わない（ホットパスへの影響を抑える）。
+起動時に set_tracer() で実装を差し替える。
+
+トレースコンテキスト:
+    実行中のスパンは contextvars で asyncio タスクごとに保持され、
+    その中で開始したスパンは自動的に子になる。
+    プロセスをまたぐ場合は current_traceparent()（W3C traceparent 形式）を
+    イベントに載せ、受け取った側が span(parent=...) に渡して親子関係をつなぐ。
+
+    スパンは asyncio タスクをまたげないため、@traced はコルーチン関数専用で、
+    非同期ジェネレーター（リポジトリの stream() 等）には使わない。
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+@dataclass
+class Span:
+    """計測した 1 区間。
+
+    Attributes:
+        name: 区間の名前（例: CreateJobUseCase.execute）。
+        trace_id: 1 つのリクエスト（トレース）全体で共通の ID（32 桁の 16 進数）。
+        span_id: この区間の ID（16 桁の 16 進数）。
+        parent_id: 親の区間の ID。ルートなら None。
+        start_time: 開始日時（UNIX 時間、秒）。
+        duration: 所要時間（秒）。終了時に設定される。
+        attributes: 任意の属性（job_id など）。
+        error: 例外で終了した場合の例外クラス名。
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start_time: float
+    duration: float = 0.0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def traceparent(self) -> str:
+        """この区間を親とする W3C traceparent 文字列。"""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+class Tracer(ABC):
+    """スパンを記録する抽象ポート。
+
+    span() がスパンの生成と親子関係の管理を行い、
+    終了したスパンの出力だけを実装クラスの export() に任せる。
+    """
+
+    @contextmanager
+    def span(
+        self, name: str, parent: str | None = None, **attributes: Any
+    ) -> Iterator[Span | None]:
+        """with ブロックを 1 つのスパンとして計測する。
+
+        Args:
+            name: スパンの名前。
+            parent: 親の traceparent。省略時は実行中のスパンを親にする。
+            **attributes: スパンに付ける属性。
+        """
+        trace_id, parent_id = _parse_traceparent(parent) if parent else (None, None)
+        if trace_id is None:
+            current = _current_span.get()
+            if current is not None:
+                trace_id, parent_id = current.trace_id, current.span_id
+        span = Span(
+            name=name,
+            trace_id=trace_id or os.urandom(16).hex(),
+            span_id=os.urandom(8).hex(),
+            parent_id=parent_id,
+            start_time=time.time(),
+            attributes=attributes,
+        )
+        token = _current_span.set(span)
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.error = type(e).__name__
+            raise
+        finally:
+            span.duration = time.perf_counter() - start
+            _current_span.reset(token)
+            self.export(span)
+
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        """終了したスパンを出力する。"""
+        ...
+
+    def close(self) -> None:
+        """バッファに残ったスパンを出力し、後片付けをする。"""
+        return None
+
+
+class NoopTracer(Tracer):
+    """何も記録しない Tracer（既定）。"""
+
+    @contextmanager
+    def span(
+        self, name: str, parent: str | None = None, **attributes: Any
+    ) -> Iterator[Span | None]:
+        """スパンを生成せずにブロックを実行する。"""
+        yield None
+
+    def export(self, span: Span) -> None:
+        return None
+
+
+_tracer: Tracer = NoopTracer()
+
+
+def get_tracer() -> Tracer:
+    """プロセスで使う Tracer を返す。"""
+    return _tracer
+
+
+def set_tracer(tracer: Tracer) -> None:
+    """プロセスで使う Tracer を差し替える（起動時に 1 回呼ぶ）。"""
+    global _tracer
+    _tracer = tracer
+
+
+def current_traceparent() -> str | None:
+    """実行中のスパンの traceparent を返す。スパンの外では None。"""
+    current = _current_span.get()
+    return current.traceparent if current is not None else None
+
+
+def traced(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+    """コルーチン関数の呼び出しを 1 つのスパンとして計測するデコレーター。
+
+    スパン名は関数の修飾名（例: PostgresJobRepository.save）になる。
+    """
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        with _tracer.span(name):
+            return await func(*args, **kwargs)
+
+    return wrapper
+
+
+def _parse_traceparent(value: str) -> tuple[str | None, str | None]:
+    """traceparent（00-<trace_id>-<span_id>-<flags>）をトレース ID と親の ID に分解する。
+
+    形式が正しくなければ (None, None) を返す。
+    """
+    parts = value.split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None, None
+    return parts[1], parts[2]
@@ -1,26 +1,28 @@
 """ジョブキャンセルユースケース。
 
-指定されたジョブをキャンセルし、永続化した後、JobCancelled イベントを配信する。
-PENDING または RUNNING 状態のジョブのみキャンセル可能。
+指定されたジョブをキャンセルし、JobCancelled イベントと一緒に永続化する。
+SCHEDULED・PENDING・RUNNING 状態のジョブのみキャンセル可能。
 """
 
 from app.domain.exceptions import JobNotFoundError
 from app.domain.models.job import Job, JobId
 from app.ports.event_publisher import EventPublisher
 from app.ports.repository import JobRepository
+from app.ports.tracer import traced
 
 
 class CancelJobUseCase:
     """ジョブをキャンセルするユースケース。
 
-    Job 集約の cancel() を呼び出し、リポジトリに保存し、
-    発生したドメインイベントをパブリッシャー経由で配信する。
+    Job 集約の cancel() を呼び出し、発生したドメインイベントを
+    パブリッシャーに渡してから、リポジトリに保存する。
     """
 
     def __init__(self, repository: JobRepository, publisher: EventPublisher) -> None:
         self._repository = repository
         self._publisher = publisher
 
+    @traced
     async def execute(self, job_id: JobId) -> Job:
         """指定された ID のジョブをキャンセルする。
 
@@ -33,12 +35,12 @@ class CancelJobUseCase:
         Raises:
             JobNotFoundError: ジョブが見つからない場合。
             InvalidStatusTransitionError: COMPLETED/FAILED 状態のジョブをキャンセルしようとした場合。
+            ConcurrencyConflictError: 読み込み後に他の処理がジョブを更新していた場合。
         """
         job = await self._repository.find_by_id(job_id)
         if job is None:
             raise JobNotFoundError(str(job_id))
         job.cancel()
+        await self._publisher.publish_all(job.collect_events())
         await self._repository.save(job)
-        for event in job.collect_events():
-            await self._publisher.publish(event)
         return job
@@ -1,44 +1,57 @@
 """ジョブ作成ユースケース。
 
-新しいジョブを作成し、永続化した後、JobCreated イベントを配信する。
+新しいジョブを作成し、JobCreated（予定時刻付きなら JobScheduled）イベントと一緒に永続化する。
 """
 
+from datetime import datetime
+
 from app.domain.models.job import Job, JobType
 from app.domain.models.notification import NotificationChannel
+from app.domain.models.priority import DEFAULT_SUBMITTER, JobPriority
 from app.ports.event_publisher import EventPublisher
 from app.ports.repository import JobRepository
+from app.ports.tracer import traced
 
 
 class CreateJobUseCase:
     """ジョブを新規作成するユースケース。
 
-    ドメインの Job.create() を呼び出し、リポジトリに保存し、
-    発生したドメインイベントをパブリッシャー経由で配信する。
+    ドメインの Job.create() を呼び出し、発生したドメインイベントを
+    パブリッシャーに渡してから、リポジトリに保存する。
     """
 
     def __init__(self, repository: JobRepository, publisher: EventPublisher) -> None:
         self._repository = repository
         self._publisher = publisher
 
+    @traced
     async def execute(
         self,
         duration_seconds: int,
         notification_channel: NotificationChannel = NotificationChannel.NONE,
+        priority: JobPriority = JobPriority.NORMAL,
+        submitter: str = DEFAULT_SUBMITTER,
+        run_at: datetime | None = None,
     ) -> Job:
         """指定された実行秒数でジョブを作成する。
 
         Args:
             duration_seconds: ダミージョブの実行秒数。
             notification_channel: 通知チャネル（デフォルト: NONE）。
+            priority: 優先度（デフォルト: NORMAL）。
+            submitter: 投入者。
+            run_at: 実行予定時刻（デフォルト: すぐに実行する）。
 
         Returns:
-            作成された Job（PENDING 状態）。
+            作成された Job（PENDING 状態。run_at が未来なら SCHEDULED 状態）。
         """
         job = Job.create(
             JobType(duration_seconds=duration_seconds),
             notification_channel=notification_channel,
+            priority=priority,
+            submitter=submitter,
+            run_at=run_at,
         )
+        await self._publisher.publish_all(job.collect_events())
         await self._repository.save(job)
-        for event in job.collect_events():
-            await self._publisher.publish(event)
         return job
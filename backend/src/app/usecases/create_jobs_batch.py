@@ -0,0 +1,72 @@
+"""ジョブ一括作成ユースケース。
+
+複数のジョブをまとめて作成し、JobCreated イベントと一緒に
+1 トランザクションで永続化する。
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.domain.models.job import Job, JobType
+from app.domain.models.notification import NotificationChannel
+from app.domain.models.priority import DEFAULT_SUBMITTER, JobPriority
+from app.ports.event_publisher import EventPublisher
+from app.ports.repository import JobRepository
+from app.ports.tracer import traced
+
+
+@dataclass(frozen=True)
+class JobSpec:
+    """一括作成するジョブ 1 件分の指定。
+
+    Attributes:
+        duration_seconds: ダミージョブの実行秒数。
+        notification_channel: 通知チャネル。
+        priority: 優先度。
+        submitter: 投入者。
+        run_at: 実行予定時刻（None ならすぐに実行する）。
+    """
+
+    duration_seconds: int
+    notification_channel: NotificationChannel = NotificationChannel.NONE
+    priority: JobPriority = JobPriority.NORMAL
+    submitter: str = DEFAULT_SUBMITTER
+    run_at: datetime | None = None
+
+
+class CreateJobsBatchUseCase:
+    """ジョブを一括作成するユースケース。
+
+    CreateJobUseCase と同じく Job.create() で集約を生成するが、
+    保存とイベント配信はジョブごとではなくバッチ全体で 1 回ずつ行う。
+    """
+
+    def __init__(self, repository: JobRepository, publisher: EventPublisher) -> None:
+        self._repository = repository
+        self._publisher = publisher
+
+    @traced
+    async def execute(self, specs: list[JobSpec]) -> list[Job]:
+        """指定されたジョブをまとめて作成する。
+
+        Args:
+            specs: 作成するジョブの指定。
+
+        Returns:
+            作成された Job のリスト（PENDING または SCHEDULED 状態、specs と同じ順序）。
+        """
+        jobs = [
+            Job.create(
+                JobType(duration_seconds=spec.duration_seconds),
+                notification_channel=spec.notification_channel,
+                priority=spec.priority,
+                submitter=spec.submitter,
+                run_at=spec.run_at,
+            )
+            for spec in specs
+        ]
+        await self._publisher.publish_all(
+            [event for job in jobs for event in job.collect_events()]
+        )
+        await self._repository.add_all(jobs)
+        return jobs
@@ -0,0 +1,20 @@
+"""ジョブ履歴エクスポートユースケース。
+
+条件に合う全ジョブを作成日時の降順で 1 件ずつ読み出す。
+"""
+
+from collections.abc import AsyncIterator
+
+from app.domain.models.job import Job
+from app.ports.repository import JobFilter, JobRepository
+
+
+class ExportJobsUseCase:
+    """ジョブ履歴をエクスポートするユースケース。"""
+
+    def __init__(self, repository: JobRepository) -> None:
+        self._repository = repository
+
+    def execute(self, job_filter: JobFilter) -> AsyncIterator[Job]:
+        """条件に合う全ジョブを作成日時の降順で 1 件ずつ返す。"""
+        return self._repository.stream(job_filter)
@@ -6,6 +6,7 @@
 from app.domain.exceptions import JobNotFoundError
 from app.domain.models.job import Job, JobId
 from app.ports.repository import JobRepository
+from app.ports.tracer import traced
 
 
 class GetJobUseCase:
@@ -14,6 +15,7 @@ class GetJobUseCase:
     def __init__(self, repository: JobRepository) -> None:
         self._repository = repository
 
+    @traced
     async def execute(self, job_id: JobId) -> Job:
         """指定された ID のジョブを取得する。
 
@@ -1,10 +1,10 @@
 """ジョブ一覧取得ユースケース。
 
-全ジョブを作成日時の降順で取得する。
+条件に合うジョブを作成日時の降順で 1 ページずつ取得する。
 """
 
-from app.domain.models.job import Job
-from app.ports.repository import JobRepository
+from app.ports.repository import JobPage, JobQuery, JobRepository
+from app.ports.tracer import traced
 
 
 class ListJobsUseCase:
@@ -13,6 +13,7 @@ class ListJobsUseCase:
     def __init__(self, repository: JobRepository) -> None:
         self._repository = repository
 
-    async def execute(self) -> list[Job]:
-        """全ジョブを作成日時の降順で返す。"""
-        return await self._repository.find_all()
+    @traced
+    async def execute(self, query: JobQuery) -> JobPage:
+        """条件に合うジョブを作成日時の降順で 1 ページ分返す。"""
+        return await self._repository.find_page(query)
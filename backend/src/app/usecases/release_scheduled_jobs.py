@@ -0,0 +1,49 @@
+"""予定時刻になったジョブを実行待ちにするユースケース。
+
+ワーカーのスケジューラーが、予定時刻になった SCHEDULED のジョブを渡す。
+ジョブごとに PENDING に遷移させ、JobCreated イベントと一緒に永続化する
+（JobCreated がジョブキューに載り、通常のジョブと同じように実行される）。
+"""
+
+from app.domain.exceptions import ConcurrencyConflictError
+from app.domain.models.job import JobId, JobStatus
+from app.ports.event_publisher import EventPublisher
+from app.ports.repository import JobRepository
+from app.ports.tracer import traced
+
+
+class ReleaseScheduledJobsUseCase:
+    """予定時刻になったジョブを SCHEDULED → PENDING にするユースケース。
+
+    複数のワーカーが同じジョブを同時に渡しても、保存の compare-and-set で
+    1 つだけが成功する（他は競合としてスキップする）。
+    """
+
+    def __init__(self, repository: JobRepository, publisher: EventPublisher) -> None:
+        self._repository = repository
+        self._publisher = publisher
+
+    @traced
+    async def execute(self, job_ids: list[JobId]) -> int:
+        """指定されたジョブのうち、まだ SCHEDULED のものを実行待ちにする。
+
+        キャンセル済み・他のワーカーが先に実行待ちにしたジョブはスキップする。
+
+        Args:
+            job_ids: 予定時刻になったジョブの ID。
+
+        Returns:
+            実行待ちにしたジョブ数。
+        """
+        released = 0
+        for job in await self._repository.find_by_ids(job_ids):
+            if job.status != JobStatus.SCHEDULED:
+                continue
+            job.release()
+            await self._publisher.publish_all(job.collect_events())
+            try:
+                await self._repository.save(job)
+            except ConcurrencyConflictError:
+                continue
+            released += 1
+        return released
@@ -1,195 +1,429 @@
 """ジョブワーカープロセス。
 
 API サーバーとは独立したプロセスとして動作し、
-Redis Pub/Sub の job_events チャンネルを Subscribe して
-JobCreated イベントを受信・ジョブを実行する。
+ジョブキュー（JobQueue ポート）からジョブを受け取って実行する。
 
 起動コマンド: python -m app.worker
 
 処理フロー:
-    1. Redis Pub/Sub を Subscribe してイベントを待機する
-    2. JobCreated イベントを受信したら、Job を RUNNING に遷移させる
+    1. ジョブキューからジョブを受け取る（既定は Redis Streams のコンシューマグループ）
+    2. Job を RUNNING に遷移させる
     3. ダミージョブ（指定秒数の sleep）を実行する
-    4. 実行中は1秒間隔で DB をポーリングし、キャンセルを検知する
+    4. 実行中は JobCancelled イベントを受けて即座に中断する
+       （イベントを取りこぼした場合に備え、DB もまとめて定期的に再確認する）
     5. 完了したら COMPLETED に、失敗したら FAILED に遷移させる
+    6. 処理が終わったジョブを ack する（ack 前にワーカーが落ちた場合は再配信される）
+
+実行予定時刻付きのジョブ（SCHEDULED）は、JobScheduler が予定時刻になったものを
+PENDING にしてジョブキューに載せる（予定時刻の近いジョブだけをヒープに持つ）。
+
+状態遷移で発生したドメインイベントは、ジョブと同じトランザクションで
+アウトボックス（event_outbox）に書き込まれ、アウトボックスリレーが Redis に配信する。
+
+ADAPTER_MODE=memory の場合はこのプロセスは起動せず、API プロセスが
+create_dispatcher() / serve() を使って同じ処理をプロセス内で実行する。
+
+同時に実行するジョブ数は WORKER_CONCURRENCY、実行待ちのローカルバッファは
+WORKER_BUFFER_SIZE で制限され、どちらも埋まっている間はキューから取り出さない。
+
+通知は NotificationDispatcher のキューに入れるだけで、送信（再送を含む）を待たない。
+送信は DB セッションを閉じた後に依頼し、作成された Discord のスレッド ID は
+ディスパッチャーが送信後に書き戻す（ジョブの状態遷移の save() とは競合しない）。
+
+METRICS_PORT が 0 以外の場合、そのポートで GET /metrics（Prometheus 形式）に応答する。
 """
 
 import asyncio
-import json
 import logging
+import math
 import os
+import signal
 import traceback
+import uuid
+from datetime import datetime, timezone
 
 import redis.asyncio as aioredis
 
-from app.adapters.outbound.messaging.redis_event_publisher import (
-    CHANNEL,
-    RedisEventPublisher,
+from app.adapters.inbound.events.event_source import EventSource
+from app.adapters.inbound.events.redis_event_source import RedisEventSource
+from app.adapters.inbound.metrics.metrics_http_server import start_metrics_server
+from app.adapters.inbound.queue.job_dispatcher import JobDispatcher
+from app.adapters.inbound.queue.job_scheduler import JobScheduler
+from app.adapters.inbound.queue.redis_pubsub_job_queue import RedisPubSubJobQueue
+from app.adapters.inbound.queue.redis_stream_job_queue import (
+    JOB_QUEUE_CLAIM_IDLE_MS,
+    RedisStreamJobQueue,
+)
+from app.adapters.inbound.queue.running_job_registry import RunningJobRegistry
+from app.adapters.outbound.job_storage import (
+    ADAPTER_MODE,
+    open_dead_letter_store,
+    open_job_storage,
+)
+from app.adapters.outbound.messaging.redis_event_publisher import JOB_QUEUE_MODE
+from app.adapters.outbound.metrics.app_metrics import (
+    JOB_EXECUTION_SECONDS,
+    JOB_QUEUE_WAIT_SECONDS,
+    NOTIFICATION_QUEUE_DEPTH,
+    SCHEDULER_JOBS_PENDING,
+    WORKER_JOBS_IN_FLIGHT,
+    WORKER_JOBS_QUEUED,
+)
+from app.adapters.outbound.metrics.registry import REGISTRY
+from app.adapters.outbound.notification.notification_dispatcher import (
+    NotificationDispatcher,
 )
 from app.adapters.outbound.notification.notification_sender_factory import (
     NotificationSenderFactory,
 )
-from app.adapters.outbound.persistence.database import async_session
-from app.adapters.outbound.persistence.postgres_job_repository import (
-    PostgresJobRepository,
-)
-from app.domain.models.job import JobId, JobResult, JobStatus
+from app.adapters.outbound.tracing.jsonl_tracer import configure_tracing
+from app.domain.exceptions import ConcurrencyConflictError
+from app.domain.models.job import Job, JobId, JobResult, JobStatus
+from app.ports.job_queue import JobDelivery, JobQueue
+from app.ports.notification_dead_letter_store import NotificationDeadLetter
+from app.ports.tracer import get_tracer, traced
+from app.usecases.release_scheduled_jobs import ReleaseScheduledJobsUseCase
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [worker] %(message)s")
 logger = logging.getLogger(__name__)
 
 REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379")
+JOB_QUEUE_BATCH_SIZE = int(os.environ.get("JOB_QUEUE_BATCH_SIZE", "10"))
+WORKER_CONCURRENCY = int(os.environ.get("WORKER_CONCURRENCY", "50"))
+WORKER_BUFFER_SIZE = int(os.environ.get("WORKER_BUFFER_SIZE", "20"))
+WORKER_STATS_INTERVAL_SECONDS = float(
+    os.environ.get("WORKER_STATS_INTERVAL_SECONDS", "30")
+)
+WORKER_SHUTDOWN_GRACE_SECONDS = float(
+    os.environ.get("WORKER_SHUTDOWN_GRACE_SECONDS", "30")
+)
+WORKER_CANCEL_RECONCILE_SECONDS = float(
+    os.environ.get("WORKER_CANCEL_RECONCILE_SECONDS", "10")
+)
+METRICS_PORT = int(os.environ.get("METRICS_PORT", "9100"))
+"""メトリクスを公開するポート。0 なら公開しない。"""
+
+running_jobs = RunningJobRegistry()
+"""このワーカープロセスで実行中のジョブ。キャンセル通知の宛先。"""
+
+notification_senders = NotificationSenderFactory()
+"""通知の送信アダプター。serve() の間だけ使える（HTTP の接続プールを共有する）。"""
+
+
+async def save_discord_thread_id(job_id: JobId, thread_id: str) -> None:
+    """開始通知で作成された Discord のスレッド ID をジョブに書き戻す。"""
+    async with open_job_storage() as storage:
+        await storage.repository.set_discord_thread_id(job_id, thread_id)
+
+
+async def store_dead_letter(letter: NotificationDeadLetter) -> None:
+    """送信できなかった通知をデッドレターに記録する。"""
+    async with open_dead_letter_store() as store:
+        await store.add(letter)
+
+
+notifications = NotificationDispatcher(
+    notification_senders, save_discord_thread_id, store_dead_letter
+)
+"""通知の送信キュー。serve() の間だけ動く。"""
 
 
+async def load_scheduled_jobs(
+    due_before: datetime, limit: int
+) -> list[tuple[datetime, JobId]]:
+    """予定時刻が due_before より前の SCHEDULED のジョブを予定時刻の昇順で返す。"""
+    async with open_job_storage() as storage:
+        jobs = await storage.repository.find_scheduled(due_before, limit)
+    return [(job.run_at, job.id) for job in jobs]
+
+
+async def release_scheduled_jobs(job_ids: list[JobId]) -> None:
+    """予定時刻になったジョブを実行待ちにする（JobCreated でジョブキューに載る）。"""
+    async with open_job_storage() as storage:
+        usecase = ReleaseScheduledJobsUseCase(storage.repository, storage.publisher)
+        released = await usecase.execute(job_ids)
+    if released:
+        logger.info("Released %d scheduled job(s)", released)
+
+
+scheduler = JobScheduler(load_scheduled_jobs, release_scheduled_jobs)
+"""予定時刻付きのジョブを実行待ちにするスケジューラー。serve() の間だけ動く。"""
+
+
+def observe_finished(job: Job) -> None:
+    """終了したジョブの実行時間（started_at→completed_at）を記録する。"""
+    if job.started_at and job.completed_at:
+        JOB_EXECUTION_SECONDS.observe(
+            (job.completed_at - job.started_at).total_seconds(), job.status.value
+        )
+
+
+@traced
 async def execute_job(
     job_id: JobId,
     duration: int,
-    repo: PostgresJobRepository,
-    publisher: RedisEventPublisher,
+    start_notification: asyncio.Future[str | None] | None = None,
 ) -> None:
     """ダミージョブを実行する（指定秒数の sleep）。
 
-    1秒ごとに DB をポーリングしてキャンセルフラグを確認する。
-    キャンセルされていた場合は即座に中断する。
-    完了後は Job を COMPLETED に遷移させ、イベントを配信する。
+    実行中は RunningJobRegistry に登録され、JobCancelled の受信または
+    DB の再確認でキャンセルが通知された時点で即座に中断する。
+    完了後は Job を COMPLETED に遷移させ、JobCompleted と一緒に保存する。
+    完了通知は start_notification（開始通知）の送信後に送られるようキューに入れる。
     """
-    elapsed = 0
-    while elapsed < duration:
-        await asyncio.sleep(1)
-        elapsed += 1
-        async with async_session() as session:
-            poll_repo = PostgresJobRepository(session)
-            job = await poll_repo.find_by_id(job_id)
-            if job is None or job.status == JobStatus.CANCELLED:
-                logger.info("Job %s was cancelled, aborting", job_id)
-                return
+    cancelled = running_jobs.register(job_id)
+    try:
+        await asyncio.wait_for(cancelled.wait(), timeout=duration)
+        logger.info("Job %s was cancelled, aborting", job_id)
+        return
+    except TimeoutError:
+        pass
+    finally:
+        running_jobs.unregister(job_id)
 
-    async with async_session() as session:
-        complete_repo = PostgresJobRepository(session)
+    async with open_job_storage() as storage:
+        complete_repo = storage.repository
         job = await complete_repo.find_by_id(job_id)
         if job is None or job.status == JobStatus.CANCELLED:
             return
         job.complete(JobResult(message=f"Completed after {duration}s"))
-        await complete_repo.save(job)
-        for event in job.collect_events():
-            await publisher.publish(event)
-        logger.info("Job %s completed", job_id)
-
+        await storage.publisher.publish_all(job.collect_events())
         try:
-            sender = NotificationSenderFactory.create(job.notification_channel)
-            await sender.send(job)
-        except Exception:
-            logger.error(
-                "Failed to send notification for job %s: %s",
-                job_id,
-                traceback.format_exc(),
-            )
+            await complete_repo.save(job)
+        except ConcurrencyConflictError:
+            # 読み込み後にキャンセルされた等。後勝ちで上書きせず、相手の更新を優先する
+            logger.info("Job %s was modified concurrently, not completing", job_id)
+            return
+        observe_finished(job)
+        logger.info("Job %s completed", job_id)
+    await notifications.submit(job, after=start_notification)
 
 
-async def handle_event(data: dict, redis_client: aioredis.Redis) -> None:
-    """Redis Pub/Sub から受信したイベントを処理する。
+async def handle_job(delivery: JobDelivery) -> None:
+    """ジョブキューから受け取ったジョブを処理する。
 
-    JobCreated イベントのみを対象とし、以下の処理を行う:
+    以下の処理を行う:
         1. Job を DB から取得する
-        2. start() で RUNNING に遷移させ、JobStarted を配信する
+        2. start() で RUNNING に遷移させ、JobStarted と一緒に保存する
+           （他のワーカーから引き継いだ RUNNING のジョブは、残り時間から再開する）
         3. ダミージョブを実行する
-        4. 失敗した場合は fail() で FAILED に遷移させ、JobFailed を配信する
+        4. 失敗した場合は fail() で FAILED に遷移させ、JobFailed と一緒に保存する
+
+    処理全体を 1 つのスパンとし、ジョブを作成した API のスパン
+    （delivery.trace_parent）の子として記録する。
     """
-    event_type = data.get("event_type")
-    if event_type != "JobCreated":
-        return
+    with get_tracer().span(
+        "handle_job", parent=delivery.trace_parent, job_id=str(delivery.job_id)
+    ):
+        await _handle_job(delivery)
+
 
-    job_id = JobId(data["job_id"])
-    logger.info("Received JobCreated for %s", job_id)
+async def _handle_job(delivery: JobDelivery) -> None:
+    """handle_job の本体。"""
+    job_id = delivery.job_id
+    logger.info("Received job %s (redelivered=%s)", job_id, delivery.redelivered)
 
-    async with async_session() as session:
-        repo = PostgresJobRepository(session)
-        publisher = RedisEventPublisher(redis_client)
+    async with open_job_storage() as storage:
+        repo = storage.repository
+        publisher = storage.publisher
 
         job = await repo.find_by_id(job_id)
         if job is None:
             logger.error("Job %s not found", job_id)
             return
 
-        try:
-            job.start()
-            await repo.save(job)
-            for event in job.collect_events():
-                await publisher.publish(event)
-            logger.info(
-                "Job %s started (duration=%ds)", job_id, job.job_type.duration_seconds
-            )
-        except Exception:
-            logger.error("Failed to start job %s: %s", job_id, traceback.format_exc())
+        duration = job.job_type.duration_seconds
+        resumed = job.status == JobStatus.RUNNING and delivery.redelivered
+        if resumed:
+            # 前任のワーカーが実行途中で停止したジョブを引き継ぐ
+            elapsed = (datetime.now(timezone.utc) - job.started_at).total_seconds()
+            duration = max(0, math.ceil(duration - elapsed))
+            logger.info("Resuming job %s (remaining=%ds)", job_id, duration)
+        elif job.status != JobStatus.PENDING:
+            logger.info("Job %s is already %s, skipping", job_id, job.status.value)
             return
-
-        try:
-            sender = NotificationSenderFactory.create(job.notification_channel)
-            thread_id = await sender.send(job)
-            if thread_id:
-                job.discord_thread_id = thread_id
+        else:
+            try:
+                job.start()
+                await publisher.publish_all(job.collect_events())
                 await repo.save(job)
-                logger.info("Stored discord_thread_id=%s for job %s", thread_id, job_id)
-        except Exception:
-            logger.error(
-                "Failed to send start notification for job %s: %s",
-                job_id,
-                traceback.format_exc(),
-            )
+                JOB_QUEUE_WAIT_SECONDS.observe(
+                    (job.started_at - job.created_at).total_seconds(),
+                    job.priority.value,
+                )
+                logger.info("Job %s started (duration=%ds)", job_id, duration)
+            except ConcurrencyConflictError:
+                logger.info("Job %s was modified concurrently, skipping", job_id)
+                return
+            except Exception:
+                logger.error(
+                    "Failed to start job %s: %s", job_id, traceback.format_exc()
+                )
+                return
 
+    # 開始通知は DB セッションを閉じてから依頼する（引き継いだジョブでは送らない）
+    start_notification = None if resumed else await notifications.submit(job)
     try:
-        publisher = RedisEventPublisher(redis_client)
-        await execute_job(job_id, job.job_type.duration_seconds, repo, publisher)
+        await execute_job(job_id, duration, start_notification)
     except Exception:
         logger.error("Job %s failed: %s", job_id, traceback.format_exc())
-        async with async_session() as session:
-            fail_repo = PostgresJobRepository(session)
-            publisher = RedisEventPublisher(redis_client)
+        async with open_job_storage() as storage:
+            fail_repo = storage.repository
             job = await fail_repo.find_by_id(job_id)
-            if job and job.status == JobStatus.RUNNING:
-                job.fail(JobResult(message="Job failed", error=traceback.format_exc()))
+            if job is None or job.status != JobStatus.RUNNING:
+                return
+            job.fail(JobResult(message="Job failed", error=traceback.format_exc()))
+            await storage.publisher.publish_all(job.collect_events())
+            try:
                 await fail_repo.save(job)
-                for event in job.collect_events():
-                    await publisher.publish(event)
+            except ConcurrencyConflictError:
+                logger.info("Job %s was modified concurrently, not failing", job_id)
+                return
+            observe_finished(job)
+        await notifications.submit(job, after=start_notification)
+
+
+def create_job_queue(redis_client: aioredis.Redis) -> JobQueue:
+    """JOB_QUEUE_MODE に対応する JobQueue 実装を返す。"""
+    if JOB_QUEUE_MODE == "pubsub":
+        return RedisPubSubJobQueue(redis_client)
+    return RedisStreamJobQueue(redis_client)
+
+
+async def handle_domain_event(data: dict) -> None:
+    """job_events チャンネルのイベントを処理する。
+
+    JobCancelled を受信したら、このプロセスで実行中の該当ジョブを即座に中断する。
+    JobScheduled を受信したら、予定時刻が近ければスケジューラーに加える。
+    """
+    event_type = data.get("event_type")
+    if event_type == "JobCancelled" and running_jobs.cancel(data["job_id"]):
+        logger.info("Cancellation received for job %s", data["job_id"])
+    elif event_type == "JobScheduled" and data.get("run_at"):
+        scheduler.add(
+            JobId(uuid.UUID(data["job_id"])), datetime.fromisoformat(data["run_at"])
+        )
 
-                try:
-                    sender = NotificationSenderFactory.create(job.notification_channel)
-                    await sender.send(job)
-                except Exception:
-                    logger.error(
-                        "Failed to send notification for job %s: %s",
-                        job_id,
-                        traceback.format_exc(),
-                    )
+
+async def reconcile_cancellations() -> None:
+    """実行中ジョブのステータスを DB でまとめて再確認する（イベント取りこぼし対策）。
+
+    WORKER_CANCEL_RECONCILE_SECONDS ごとに 1 クエリで確認し、
+    CANCELLED になっている（または削除された）ジョブを中断する。
+    """
+    while True:
+        await asyncio.sleep(WORKER_CANCEL_RECONCILE_SECONDS)
+        job_ids = running_jobs.job_ids()
+        if not job_ids:
+            continue
+        try:
+            async with open_job_storage() as storage:
+                jobs = await storage.repository.find_by_ids(job_ids)
+        except Exception:
+            logger.error(
+                "Failed to reconcile cancellations: %s", traceback.format_exc()
+            )
+            continue
+        alive = {str(job.id) for job in jobs if job.status != JobStatus.CANCELLED}
+        for job_id in job_ids:
+            if str(job_id) not in alive and running_jobs.cancel(job_id):
+                logger.info("Job %s found cancelled during reconciliation", job_id)
+
+
+def create_dispatcher(queue: JobQueue) -> JobDispatcher:
+    """ワーカーの設定値で queue からジョブを受け取る JobDispatcher を作る。"""
+    return JobDispatcher(
+        queue,
+        handle_job,
+        concurrency=WORKER_CONCURRENCY,
+        buffer_size=WORKER_BUFFER_SIZE,
+        batch_size=JOB_QUEUE_BATCH_SIZE,
+        extend_interval=JOB_QUEUE_CLAIM_IDLE_MS / 1000 / 3,
+        stats_interval=WORKER_STATS_INTERVAL_SECONDS,
+        shutdown_grace=WORKER_SHUTDOWN_GRACE_SECONDS,
+    )
+
+
+async def serve(dispatcher: JobDispatcher, events: EventSource) -> None:
+    """dispatcher が停止するまでジョブを処理する。
+
+    その間、events からのキャンセル通知の受信と、DB の定期的な再確認、
+    予定時刻付きのジョブのスケジューラーを並行して行う。
+    通知の送信アダプター（共有の接続）とディスパッチャーは開始時に作り、
+    実行中のジョブとキューに残った通知の送信を待ち終えてから閉じる
+    （通知は最大 WORKER_SHUTDOWN_GRACE_SECONDS 秒待ち、残りは破棄する）。
+    ADAPTER_MODE=memory の API プロセスは、これをプロセス内のワーカーとして起動する。
+    """
+    notification_senders.start()
+    notifications.start()
+    REGISTRY.add_collector(lambda: _collect_worker_stats(dispatcher))
+    background = [
+        asyncio.create_task(events.run(handle_domain_event)),
+        asyncio.create_task(reconcile_cancellations()),
+        asyncio.create_task(scheduler.run()),
+    ]
+    try:
+        await dispatcher.run()
+        logger.info("Worker stopped")
+    finally:
+        for task in background:
+            task.cancel()
+        await asyncio.gather(*background, return_exceptions=True)
+        await notifications.stop(WORKER_SHUTDOWN_GRACE_SECONDS)
+        await notification_senders.stop()
+
+
+def _collect_worker_stats(dispatcher: JobDispatcher) -> None:
+    """スクレイプ時にディスパッチャー・通知キュー・スケジューラーの現在値をゲージに反映する。"""
+    WORKER_JOBS_IN_FLIGHT.set(dispatcher.in_flight)
+    for priority, queued in dispatcher.queued_by_priority.items():
+        WORKER_JOBS_QUEUED.set(queued, priority.value)
+    NOTIFICATION_QUEUE_DEPTH.set(notifications.queue_depth)
+    SCHEDULER_JOBS_PENDING.set(scheduler.pending)
 
 
 async def main() -> None:
     """ワーカーのメインループ。
 
-    Redis Pub/Sub を Subscribe し、イベントを受信するたびに
-    handle_event を非同期タスクとして起動する。
+    JobDispatcher がジョブキューからジョブを受け取り、
+    並行実行数の上限（WORKER_CONCURRENCY）の範囲で handle_job を実行する。
+    SIGTERM / SIGINT を受けると取り出しをやめ、実行中のジョブを
+    最大 WORKER_SHUTDOWN_GRACE_SECONDS 秒待ってから終了する。
     """
+    if ADAPTER_MODE == "memory":
+        # プロセス内のストアとバスは別プロセスから見えない
+        logger.error(
+            "ADAPTER_MODE=memory runs the worker inside the API process; "
+            "start only the API server"
+        )
+        return
+
     logger.info("Worker starting, connecting to Redis at %s", REDIS_URL)
+    configure_tracing("worker")
     redis_client = aioredis.from_url(REDIS_URL)
-    pubsub = redis_client.pubsub()
-    await pubsub.subscribe(CHANNEL)
-    logger.info("Subscribed to channel '%s', waiting for events...", CHANNEL)
+    queue = create_job_queue(redis_client)
 
+    dispatcher = create_dispatcher(queue)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, dispatcher.stop)
+    logger.info(
+        "Consuming jobs (mode=%s, concurrency=%d, buffer=%d), waiting for jobs...",
+        JOB_QUEUE_MODE,
+        WORKER_CONCURRENCY,
+        WORKER_BUFFER_SIZE,
+    )
+
+    metrics_server = await start_metrics_server(METRICS_PORT) if METRICS_PORT else None
     try:
-        while True:
-            message = await pubsub.get_message(
-                ignore_subscribe_messages=True, timeout=1.0
-            )
-            if message and message["type"] == "message":
-                data = json.loads(message["data"])
-                asyncio.create_task(handle_event(data, redis_client))
-            else:
-                await asyncio.sleep(0.1)
+        await serve(dispatcher, RedisEventSource(redis_client))
     finally:
-        await pubsub.unsubscribe(CHANNEL)
-        await pubsub.aclose()
+        if metrics_server is not None:
+            metrics_server.close()
+        await queue.close()
         await redis_client.aclose()
+        get_tracer().close()
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [worker] %(message)s")
     asyncio.run(main())
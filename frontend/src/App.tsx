@@ -5,6 +5,7 @@ import { JobList } from "./components/JobList";
 import { type JobEvent, useJobSSE } from "./hooks/useJobSSE";
 
 const EVENT_TO_STATUS: Record<string, string> = {
+  JobScheduled: "SCHEDULED",
   JobCreated: "PENDING",
   JobStarted: "RUNNING",
   JobCompleted: "COMPLETED",
@@ -14,37 +15,63 @@ const EVENT_TO_STATUS: Record<string, string> = {
 
 function App() {
   const [jobs, setJobs] = useState<Job[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
 
+  // 先頭ページ（新しい順）を取り直す。続きのページは「さらに読み込む」で追加する
   const reload = useCallback(async () => {
-    setJobs(await listJobs());
+    const page = await listJobs();
+    setJobs(page.jobs);
+    setNextCursor(page.nextCursor);
   }, []);
 
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    const page = await listJobs(nextCursor);
+    setJobs((prev) => {
+      const loaded = new Set(prev.map((j) => j.id));
+      return [...prev, ...page.jobs.filter((j) => !loaded.has(j.id))];
+    });
+    setNextCursor(page.nextCursor);
+  };
+
   useEffect(() => {
     reload();
   }, [reload]);
 
   useJobSSE((event: JobEvent) => {
+    if (event.event_type === "Resync") {
+      // 再送ログで取りこぼしを埋められなかった場合は一覧を取り直す
+      reload();
+      return;
+    }
     const newStatus = EVENT_TO_STATUS[event.event_type];
     if (!newStatus) return;
 
-    setJobs((prev) => {
-      const exists = prev.some((j) => j.id === event.job_id);
-      if (!exists) {
-        // 新しいジョブ（JobCreated）の場合、リロードして取得
+    if (!jobs.some((j) => j.id === event.job_id)) {
+      // 新しいジョブ（JobCreated / JobScheduled）の場合だけ、リロードして取得する。
+      // 2 ページ目以降のジョブの開始・完了などは、読み込んでいないので無視する
+      if (
+        event.event_type === "JobCreated" ||
+        event.event_type === "JobScheduled"
+      ) {
         reload();
-        return prev;
       }
-      return prev.map((j) =>
+      return;
+    }
+    setJobs((prev) =>
+      prev.map((j) =>
         j.id === event.job_id ? { ...j, status: newStatus } : j,
-      );
-    });
+      ),
+    );
   });
 
   const handleCreate = async (
     durationSeconds: number,
     notificationChannel: string,
+    priority: string,
+    runAt: string | null,
   ) => {
-    await createJob(durationSeconds, notificationChannel);
+    await createJob(durationSeconds, notificationChannel, priority, runAt);
     await reload();
   };
 
@@ -57,7 +84,12 @@ function App() {
     <div style={{ maxWidth: "800px", margin: "0 auto", padding: "24px" }}>
       <h1>Job Worker</h1>
       <JobCreateForm onSubmit={handleCreate} />
-      <JobList jobs={jobs} onCancel={handleCancel} />
+      <JobList
+        jobs={jobs}
+        hasMore={nextCursor !== null}
+        onCancel={handleCancel}
+        onLoadMore={loadMore}
+      />
     </div>
   );
 }
@@ -3,6 +3,10 @@ export interface Job {
   status: string;
   duration_seconds: number;
   notification_channel: string;
+  priority: string;
+  submitter: string;
+  // 実行予定時刻。指定されたジョブはこの時刻まで SCHEDULED で待つ
+  run_at: string | null;
   created_at: string;
   started_at: string | null;
   completed_at: string | null;
@@ -10,11 +14,19 @@ export interface Job {
   result_error: string | null;
 }
 
+export interface JobPage {
+  jobs: Job[];
+  // 続きのページのカーソル。最後のページなら null
+  nextCursor: string | null;
+}
+
 const BASE = "/api/jobs";
 
 export async function createJob(
   durationSeconds: number,
   notificationChannel: string = "none",
+  priority: string = "normal",
+  runAt: string | null = null,
 ): Promise<Job> {
   const res = await fetch(BASE, {
     method: "POST",
@@ -22,14 +34,21 @@ export async function createJob(
     body: JSON.stringify({
       duration_seconds: durationSeconds,
       notification_channel: notificationChannel,
+      priority,
+      run_at: runAt,
     }),
   });
   return res.json();
 }
 
-export async function listJobs(): Promise<Job[]> {
-  const res = await fetch(BASE);
-  return res.json();
+// 一覧は 1 ページ（既定 100 件）ずつ返る。続きは nextCursor を渡して取得する
+export async function listJobs(cursor?: string): Promise<JobPage> {
+  const url = cursor ? `${BASE}?cursor=${encodeURIComponent(cursor)}` : BASE;
+  const res = await fetch(url);
+  return {
+    jobs: await res.json(),
+    nextCursor: res.headers.get("X-Next-Cursor"),
+  };
 }
 
 export async function getJob(jobId: string): Promise<Job> {
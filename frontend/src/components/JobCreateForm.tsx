@@ -1,12 +1,19 @@
 import { useState } from "react";
 
 interface Props {
-  onSubmit: (durationSeconds: number, notificationChannel: string) => void;
+  onSubmit: (
+    durationSeconds: number,
+    notificationChannel: string,
+    priority: string,
+    runAt: string | null,
+  ) => void;
 }
 
 export function JobCreateForm({ onSubmit }: Props) {
   const [duration, setDuration] = useState("");
   const [notificationChannel, setNotificationChannel] = useState("none");
+  const [priority, setPriority] = useState("normal");
+  const [delay, setDelay] = useState("");
   const [error, setError] = useState("");
 
   const handleSubmit = (e: React.FormEvent) => {
@@ -16,10 +23,22 @@ export function JobCreateForm({ onSubmit }: Props) {
       setError("1以上の整数を入力してください");
       return;
     }
+    const delaySeconds = delay ? parseInt(delay, 10) : 0;
+    if (isNaN(delaySeconds) || delaySeconds < 0) {
+      setError("実行までの秒数は0以上の整数を入力してください");
+      return;
+    }
     setError("");
-    onSubmit(value, notificationChannel);
+    // 実行までの秒数が指定されたら、その時刻まで SCHEDULED で待たせる
+    const runAt =
+      delaySeconds > 0
+        ? new Date(Date.now() + delaySeconds * 1000).toISOString()
+        : null;
+    onSubmit(value, notificationChannel, priority, runAt);
     setDuration("");
     setNotificationChannel("none");
+    setPriority("normal");
+    setDelay("");
   };
 
   return (
@@ -46,6 +65,29 @@ export function JobCreateForm({ onSubmit }: Props) {
           <option value="discord">Discord</option>
         </select>
       </label>
+      <label>
+        優先度:{" "}
+        <select
+          value={priority}
+          onChange={(e) => setPriority(e.target.value)}
+          style={{ marginRight: "8px" }}
+        >
+          <option value="high">高</option>
+          <option value="normal">通常</option>
+          <option value="low">低</option>
+        </select>
+      </label>
+      <label>
+        実行までの秒数:{" "}
+        <input
+          type="number"
+          min="0"
+          value={delay}
+          placeholder="すぐ"
+          onChange={(e) => setDelay(e.target.value)}
+          style={{ width: "80px", marginRight: "8px" }}
+        />
+      </label>
       <button type="submit">作成</button>
       {error && (
         <span style={{ color: "red", marginLeft: "8px" }}>{error}</span>
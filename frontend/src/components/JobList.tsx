@@ -3,47 +3,63 @@ import { JobStatusBadge } from "./JobStatusBadge";
 
 interface Props {
   jobs: Job[];
+  hasMore: boolean;
   onCancel: (jobId: string) => void;
+  onLoadMore: () => void;
 }
 
-const CANCELLABLE = new Set(["PENDING", "RUNNING"]);
+const CANCELLABLE = new Set(["SCHEDULED", "PENDING", "RUNNING"]);
 
-export function JobList({ jobs, onCancel }: Props) {
+export function JobList({ jobs, hasMore, onCancel, onLoadMore }: Props) {
   if (jobs.length === 0) {
     return <p>ジョブがありません</p>;
   }
 
   return (
-    <table style={{ width: "100%", borderCollapse: "collapse" }}>
-      <thead>
-        <tr>
-          <th style={th}>ID</th>
-          <th style={th}>ステータス</th>
-          <th style={th}>秒数</th>
-          <th style={th}>通知</th>
-          <th style={th}>作成日時</th>
-          <th style={th}>操作</th>
-        </tr>
-      </thead>
-      <tbody>
-        {jobs.map((job) => (
-          <tr key={job.id}>
-            <td style={td}>{job.id.slice(0, 8)}</td>
-            <td style={td}>
-              <JobStatusBadge status={job.status} />
-            </td>
-            <td style={td}>{job.duration_seconds}s</td>
-            <td style={td}>{job.notification_channel}</td>
-            <td style={td}>{new Date(job.created_at).toLocaleString()}</td>
-            <td style={td}>
-              {CANCELLABLE.has(job.status) && (
-                <button onClick={() => onCancel(job.id)}>キャンセル</button>
-              )}
-            </td>
+    <>
+      <table style={{ width: "100%", borderCollapse: "collapse" }}>
+        <thead>
+          <tr>
+            <th style={th}>ID</th>
+            <th style={th}>ステータス</th>
+            <th style={th}>秒数</th>
+            <th style={th}>通知</th>
+            <th style={th}>優先度</th>
+            <th style={th}>作成日時</th>
+            <th style={th}>予定時刻</th>
+            <th style={th}>操作</th>
           </tr>
-        ))}
-      </tbody>
-    </table>
+        </thead>
+        <tbody>
+          {jobs.map((job) => (
+            <tr key={job.id}>
+              <td style={td}>{job.id.slice(0, 8)}</td>
+              <td style={td}>
+                <JobStatusBadge status={job.status} />
+              </td>
+              <td style={td}>{job.duration_seconds}s</td>
+              <td style={td}>{job.notification_channel}</td>
+              <td style={td}>{job.priority}</td>
+              <td style={td}>{new Date(job.created_at).toLocaleString()}</td>
+              <td style={td}>
+                {job.run_at ? new Date(job.run_at).toLocaleString() : "-"}
+              </td>
+              <td style={td}>
+                {CANCELLABLE.has(job.status) && (
+                  <button onClick={() => onCancel(job.id)}>キャンセル</button>
+                )}
+              </td>
+            </tr>
+          ))}
+        </tbody>
+      </table>
+      {hasMore && (
+        <p>
+          新しい順に {jobs.length} 件を表示中{" "}
+          <button onClick={onLoadMore}>さらに読み込む</button>
+        </p>
+      )}
+    </>
   );
 }
 
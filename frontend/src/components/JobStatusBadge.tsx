@@ -1,4 +1,5 @@
 const STATUS_COLORS: Record<string, string> = {
+  SCHEDULED: "#8b5cf6",
   PENDING: "#6b7280",
   RUNNING: "#3b82f6",
   COMPLETED: "#22c55e",
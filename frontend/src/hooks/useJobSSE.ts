@@ -2,6 +2,7 @@ import { useEffect, useRef } from "react";
 
 export interface JobEvent {
   event_type: string;
+  event_id?: number;
   job_id: string;
   status?: string;
   timestamp: string;
@@ -15,6 +16,7 @@ export function useJobSSE(onEvent: (event: JobEvent) => void) {
     const source = new EventSource("/api/jobs/stream");
 
     const eventTypes = [
+      "JobScheduled",
       "JobCreated",
       "JobStarted",
       "JobCompleted",
@@ -22,6 +24,15 @@ export function useJobSSE(onEvent: (event: JobEvent) => void) {
       "JobCancelled",
     ];
 
+    // 再接続時の取りこぼしがサーバーの再送範囲を超えた場合に届く
+    source.addEventListener("Resync", () => {
+      callbackRef.current({
+        event_type: "Resync",
+        job_id: "",
+        timestamp: new Date().toISOString(),
+      });
+    });
+
     for (const type of eventTypes) {
       source.addEventListener(type, (e: MessageEvent) => {
         const data: JobEvent = JSON.parse(e.data);